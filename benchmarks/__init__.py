@@ -0,0 +1,7 @@
+"""
+SQL Splitter Benchmarks
+
+Reproducible performance harness: the docs/expect.md views as a base corpus
+plus synthetic generators that scale one query dimension at a time.
+Run `python -m benchmarks.run_benchmarks --help` from the repository root.
+"""
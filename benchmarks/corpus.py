@@ -0,0 +1,100 @@
+"""
+Benchmark Corpus - SQL Splitter Benchmarks
+
+📚 Query sources for the benchmark harness
+
+- load_expect_md_queries(): the "Extracted SELECT SQL" of every test case in
+  docs/expect.md (mv_item, mv_order, ...), keyed by view name
+- Synthetic generators, each scaling one dimension of a query with size n:
+  nested JOINs, wide SELECT lists, CTE chains and long WHERE clauses
+
+Generators are deterministic so baselines stay comparable between runs.
+"""
+
+import os
+import re
+from typing import Callable, Dict
+
+EXPECT_MD_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs', 'expect.md')
+
+_TEST_CASE = re.compile(
+    r'### Test Case \d+: (\S+).*?#### Extracted SELECT SQL:\s*```sql\n(.*?)```', re.DOTALL)
+
+
+def load_expect_md_queries(path: str = EXPECT_MD_PATH) -> Dict[str, str]:
+    """View name -> extracted SELECT statement for every docs/expect.md test case"""
+    with open(path, encoding='utf-8') as handle:
+        text = handle.read()
+    return {match.group(1): match.group(2).strip() for match in _TEST_CASE.finditer(text)}
+
+
+def nested_joins(n: int) -> str:
+    """mysqldump-style bracketed chain of n LEFT JOINs: FROM ((t0 join t1 on(...)) left join t2 ...)"""
+    source = '`t0`'
+    for index in range(1, n + 1):
+        kind = 'join' if index == 1 else 'left join'
+        source = (f'({source} {kind} `t{index}` '
+                  f'on(`t{index - 1}`.`ref{index}` = `t{index}`.`id`))')
+    columns = ', '.join(f'`t{index}`.`name{index}`' for index in range(min(n, 8) + 1))
+    return f'SELECT {columns} FROM {source} WHERE `t0`.`deleted` < 1'
+
+
+def wide_select(n: int) -> str:
+    """SELECT list of n mixed columns, aggregates and expressions over a two-table join"""
+    items = []
+    for index in range(n):
+        kind = index % 4
+        if kind == 0:
+            items.append(f'`o`.`col{index}`')
+        elif kind == 1:
+            items.append(f'SUM(`i`.`qty{index}`) AS `total{index}`')
+        elif kind == 2:
+            items.append(f"DATE_FORMAT(`o`.`d{index}`, '%Y-%m') AS `month{index}`")
+        else:
+            items.append(f"CASE WHEN `i`.`s{index}` = 1 THEN 'on' ELSE 'off' END AS `flag{index}`")
+    return (f'SELECT {", ".join(items)} FROM `orders` `o` '
+            f'JOIN `items` `i` ON `o`.`id` = `i`.`order_id` GROUP BY `o`.`id`')
+
+
+def cte_chain(n: int) -> str:
+    """WITH c0 AS (...), c1 AS (SELECT ... FROM c0 JOIN ...), ... of depth n"""
+    ctes = ['`c0` AS (SELECT `id`, `v` FROM `base` WHERE `v` > 0)']
+    for index in range(1, n):
+        ctes.append(f'`c{index}` AS (SELECT `c{index - 1}`.`id`, `c{index - 1}`.`v` + `x{index}`.`w` AS `v` '
+                    f'FROM `c{index - 1}` JOIN `x{index}` ON `c{index - 1}`.`id` = `x{index}`.`id`)')
+    last = max(n - 1, 0)
+    return f'WITH {", ".join(ctes)} SELECT `c{last}`.`id`, `c{last}`.`v` FROM `c{last}`'
+
+
+def long_where(n: int) -> str:
+    """WHERE clause of n predicates mixing AND/OR, IN lists, LIKE and BETWEEN"""
+    predicates = []
+    for index in range(n):
+        kind = index % 4
+        if kind == 0:
+            predicates.append(f'`tx`.`a{index}` = {index}')
+        elif kind == 1:
+            predicates.append(f"(`tx`.`b{index}` LIKE 'x{index}%' OR `ux`.`c{index}` IS NULL)")
+        elif kind == 2:
+            predicates.append(f'`tx`.`d{index}` IN ({index}, {index + 1}, {index + 2})')
+        else:
+            predicates.append(f'`ux`.`e{index}` BETWEEN {index} AND {index + 10}')
+    return (f'SELECT `tx`.`id`, `ux`.`name` FROM `tx` JOIN `ux` ON `tx`.`uid` = `ux`.`id` '
+            f'WHERE {" AND ".join(predicates)}')
+
+
+# Scaling generators by name
+GENERATORS: Dict[str, Callable[[int], str]] = {
+    'nested_joins': nested_joins,
+    'wide_select': wide_select,
+    'cte_chain': cte_chain,
+    'long_where': long_where,
+}
+
+# Default size ladder per generator
+DEFAULT_SIZES: Dict[str, tuple] = {
+    'nested_joins': (2, 8, 32, 128),
+    'wide_select': (10, 50, 200, 800),
+    'cte_chain': (2, 8, 32, 64),
+    'long_where': (10, 50, 200, 800),
+}
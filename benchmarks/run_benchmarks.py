@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner - SQL Splitter Benchmarks
+
+⏱️ Reproducible parse benchmarks with JSON baselines
+
+Measures every case with one warm parser:
+- parses/sec and p50/p99 latency over --repeat timed parses (after warmup)
+- peak traced memory of one extra parse under tracemalloc, measured separately
+  so tracing overhead never skews the timings
+
+Cases come from the docs/expect.md corpus ("corpus/<view>") and the scaling
+generators ("<generator>/<n>"), see benchmarks/corpus.py.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks --save baseline-6.1.0.json
+    python -m benchmarks.run_benchmarks --compare baseline-6.1.0.json
+    python -m benchmarks.run_benchmarks --suite scaling --generator nested_joins --sizes 8,64,256
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Allow running as a plain script as well as with -m
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_splitter import SQLParserAST, __version__
+from benchmarks.corpus import GENERATORS, DEFAULT_SIZES, load_expect_md_queries
+
+BASELINE_FORMAT = 1
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(fraction * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def measure(parser: SQLParserAST, sql: str, repeat: int, warmup: int = 3) -> Dict[str, Any]:
+    """Time `repeat` parses of one statement and trace the peak memory of one more"""
+    for _ in range(warmup):
+        parser.parse(sql)
+
+    latencies = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parser.parse(sql)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        result = parser.parse(sql)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "sqlBytes": len(sql.encode('utf-8')),
+        "success": bool(result.get('success')),
+        "repeat": repeat,
+        "parsesPerSec": round(repeat / total, 2) if total else 0.0,
+        "p50Ms": round(_percentile(latencies, 0.50) * 1000.0, 4),
+        "p99Ms": round(_percentile(latencies, 0.99) * 1000.0, 4),
+        "peakKiB": round(peak / 1024.0, 1),
+    }
+
+
+def iter_cases(suite: str, generators: List[str],
+               sizes: Optional[List[int]]) -> Iterator[Tuple[str, str]]:
+    """(case name, SQL) pairs of the selected suites"""
+    if suite in ('all', 'corpus'):
+        for name, sql in load_expect_md_queries().items():
+            yield f"corpus/{name}", sql
+    if suite in ('all', 'scaling'):
+        for generator in generators:
+            for n in sizes or DEFAULT_SIZES[generator]:
+                yield f"{generator}/{n}", GENERATORS[generator](n)
+
+
+def run(suite: str = 'all', generators: Optional[List[str]] = None, sizes: Optional[List[int]] = None,
+        repeat: int = 50, warmup: int = 3, enable_normalization: bool = True,
+        use_token_stream: bool = False, progress=None) -> Dict[str, Any]:
+    """Run the benchmark and return a JSON-serializable baseline document"""
+    parser = SQLParserAST(enable_normalization=enable_normalization, use_token_stream=use_token_stream)
+    cases = {}
+    for name, sql in iter_cases(suite, generators or list(GENERATORS), sizes):
+        cases[name] = measure(parser, sql, repeat, warmup)
+        if progress is not None:
+            progress(name, cases[name])
+
+    return {
+        "format": BASELINE_FORMAT,
+        "version": __version__,
+        "created": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpuCount": os.cpu_count(),
+        },
+        "options": {
+            "suite": suite,
+            "repeat": repeat,
+            "warmup": warmup,
+            "enableNormalization": enable_normalization,
+            "useTokenStream": use_token_stream,
+        },
+        "cases": cases,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 1.25) -> List[Dict[str, Any]]:
+    """Per-case p50/p99/peak ratios (current / baseline) for cases present in both
+
+    A case regresses when its p50 latency or peak memory grows by more than
+    `threshold` times, or when it stops parsing successfully.
+    """
+    rows = []
+    for name, now in current["cases"].items():
+        before = baseline.get("cases", {}).get(name)
+        if before is None:
+            continue
+        ratios = {
+            key: (now[key] / before[key]) if before[key] else 1.0
+            for key in ("p50Ms", "p99Ms", "peakKiB")
+        }
+        regressed = (ratios["p50Ms"] > threshold or ratios["peakKiB"] > threshold
+                     or (before["success"] and not now["success"]))
+        rows.append({"case": name, "ratios": ratios, "regressed": regressed})
+    return rows
+
+
+def format_results(document: Dict[str, Any]) -> str:
+    """Plain-text table of a baseline document"""
+    lines = [f"{'case':<32}{'bytes':>9}{'parses/s':>11}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>10}  ok"]
+    for name, case in document["cases"].items():
+        lines.append(f"{name:<32}{case['sqlBytes']:>9}{case['parsesPerSec']:>11.1f}"
+                     f"{case['p50Ms']:>10.3f}{case['p99Ms']:>10.3f}{case['peakKiB']:>10.1f}"
+                     f"  {'✅' if case['success'] else '❌'}")
+    return '\n'.join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Plain-text table of compare() rows"""
+    lines = [f"{'case':<32}{'p50 x':>8}{'p99 x':>8}{'peak x':>8}"]
+    for row in rows:
+        ratios = row["ratios"]
+        lines.append(f"{row['case']:<32}{ratios['p50Ms']:>8.2f}{ratios['p99Ms']:>8.2f}{ratios['peakKiB']:>8.2f}"
+                     f"{'  ⚠️ regression' if row['regressed'] else ''}")
+    return '\n'.join(lines)
+
+
+def _int_list(text: str) -> List[int]:
+    try:
+        sizes = [int(part) for part in text.split(',') if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError("sizes must be comma-separated integers")
+    if not sizes or any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive")
+    return sizes
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Argument parser for the benchmark runner"""
+    parser = argparse.ArgumentParser(description="Benchmark sql_splitter parsing and save/compare JSON baselines.")
+    parser.add_argument('--suite', choices=('all', 'corpus', 'scaling'), default='all')
+    parser.add_argument('--generator', action='append', choices=sorted(GENERATORS),
+                        help="Scaling generator to run (repeatable; default: all)")
+    parser.add_argument('--sizes', type=_int_list,
+                        help="Comma-separated sizes for the scaling generators (default: per generator)")
+    parser.add_argument('--repeat', type=int, default=50, help="Timed parses per case (default: 50)")
+    parser.add_argument('--warmup', type=int, default=3, help="Untimed parses per case (default: 3)")
+    parser.add_argument('--no-normalize', action='store_true', help="Disable MySQL normalization")
+    parser.add_argument('--token-stream', action='store_true', help="Use the token stream mode")
+    parser.add_argument('--save', metavar='FILE', help="Write the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE', help="Compare against a saved JSON baseline")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Slowdown/memory ratio counted as a regression (default: 1.25)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Only print the final tables")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run from the command line; returns 1 when --compare finds a regression"""
+    args = build_arg_parser().parse_args(argv)
+    if args.repeat < 1 or args.warmup < 0:
+        print("run_benchmarks: --repeat must be >= 1 and --warmup >= 0", file=sys.stderr)
+        return 2
+
+    def progress(name, case):
+        print(f"  {name}: {case['p50Ms']:.3f} ms p50", file=sys.stderr)
+
+    document = run(args.suite, args.generator, args.sizes, args.repeat, args.warmup,
+                   enable_normalization=not args.no_normalize, use_token_stream=args.token_stream,
+                   progress=None if args.quiet else progress)
+    print(format_results(document))
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as handle:
+            json.dump(document, handle, indent=2, ensure_ascii=False)
+            handle.write('\n')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        rows = compare(baseline, document, args.threshold)
+        print()
+        print(f"vs {args.compare} (version {baseline.get('version')}, {baseline.get('created')})")
+        print(format_comparison(rows))
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -41,6 +41,8 @@ SQL Splitter - Advanced MySQL SQL Parser for Visualization Components
 
 from .core.sql_parser_ast_v6_0 import SQLParserAST, parse_sql, parse_sql_to_json
 from .core.sql_normalizer_mysql import MySQLCompatibleNormalizer, normalize_sql_query
+from .core.batch import parse_sql_batch, iter_parse_sql_batch
+from .core.async_parser import AsyncSQLParser, parse_async
 
 __version__ = "6.1.0"
 __author__ = "SQL Splitter Team"
@@ -52,5 +54,9 @@ __all__ = [
     'parse_sql',
     'parse_sql_to_json',
     'MySQLCompatibleNormalizer',
-    'normalize_sql_query'
+    'normalize_sql_query',
+    'parse_sql_batch',
+    'iter_parse_sql_batch',
+    'AsyncSQLParser',
+    'parse_async'
 ]
@@ -7,11 +7,22 @@ Core parsing engine with AST-based architecture and visualization support.
 from .sql_parser_ast_v6_0 import SQLParserAST, parse_sql, parse_sql_to_json
 from .sql_normalizer_mysql import MySQLCompatibleNormalizer, normalize_sql_query
 from .ast_nodes import *
-from .sql_tokenizer import SQLTokenizer
+from .sql_tokenizer import SQLTokenizer, CompactTokens
 from .join_handler import JoinHandler
 from .cte_handler import CTEHandler
 from .table_extractor import TableExtractor
 from .content_extractor import ContentExtractor
+from .parse_cache import ParseCache
+from .persistent_cache import PersistentParseCache
+from .diagnostics import ParseDiagnostics
+from .parse_context import ParseContext
+from .deadline import ParseDeadline, ParseTimeoutError
+from .profiler import ParseProfiler, PhaseHistogram
+from .batch import parse_sql_batch, iter_parse_sql_batch
+from .async_parser import AsyncSQLParser, ParserBusyError, parse_async
+from .regex_registry import RegexRegistry, REGEX_REGISTRY, regex, LazyClause, LineScopedPattern
+from .statement_splitter import StatementSplitter, split_statements, split_sql_file
+from .schema_registry import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY
 
 __all__ = [
     'SQLParserAST',
@@ -20,8 +31,32 @@ __all__ = [
     'MySQLCompatibleNormalizer',
     'normalize_sql_query',
     'SQLTokenizer',
+    'CompactTokens',
     'JoinHandler',
     'CTEHandler', 
     'TableExtractor',
-    'ContentExtractor'
+    'ContentExtractor',
+    'ParseCache',
+    'PersistentParseCache',
+    'ParseDiagnostics',
+    'ParseContext',
+    'ParseDeadline',
+    'ParseTimeoutError',
+    'ParseProfiler',
+    'PhaseHistogram',
+    'parse_sql_batch',
+    'iter_parse_sql_batch',
+    'AsyncSQLParser',
+    'ParserBusyError',
+    'parse_async',
+    'RegexRegistry',
+    'REGEX_REGISTRY',
+    'regex',
+    'LazyClause',
+    'LineScopedPattern',
+    'StatementSplitter',
+    'split_statements',
+    'split_sql_file',
+    'SchemaRegistry',
+    'DEFAULT_SCHEMA_REGISTRY'
 ]
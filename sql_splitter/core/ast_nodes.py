@@ -11,14 +11,44 @@ Status: ✅ Core AST node definitions for 100% expect.md compliance
 
 from typing import List, Dict, Any, Optional
 
+from .regex_registry import regex
+
+# 🧮 Precompiled patterns (declared once in the shared regex registry)
+_BACKTICK_JOIN_CONDITION = regex(r'`([^`]+)`\.`([^`]+)`\s*=\s*`([^`]+)`\.`([^`]+)`', 0, 'ast.backtick_join_condition')
+_PLAIN_JOIN_CONDITION = regex(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\b',
+                              0, 'ast.plain_join_condition')
+_DB_JOIN_CONDITION = regex(r'\b[a-zA-Z_][a-zA-Z0-9_]*\\.([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*[a-zA-Z_][a-zA-Z0-9_]*\\.([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\b',
+                           0, 'ast.db_join_condition')
+
 class ASTNode:
-    """Base AST node class"""
+    """Base AST node class
+
+    💾 Nodes are slotted (no per-instance __dict__), and the children list and
+    attributes dict are only allocated once something is stored in them, so
+    leaf nodes such as fields and table references stay small.
+    """
+    __slots__ = ('node_type', 'value', 'parent', '_children', '_attributes')
+
     def __init__(self, node_type: str, value: Any = None):
         self.node_type = node_type
         self.value = value
-        self.children = []
         self.parent = None
-        self.attributes = {}
+        self._children = None
+        self._attributes = None
+
+    @property
+    def children(self) -> List['ASTNode']:
+        """Child nodes (allocated on first use)"""
+        if self._children is None:
+            self._children = []
+        return self._children
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """Free-form node attributes (allocated on first use)"""
+        if self._attributes is None:
+            self._attributes = {}
+        return self._attributes
 
     def add_child(self, child):
         """Add child node"""
@@ -27,7 +57,9 @@ class ASTNode:
 
     def get_attribute(self, key: str, default=None):
         """Get node attribute"""
-        return self.attributes.get(key, default)
+        if self._attributes is None:
+            return default
+        return self._attributes.get(key, default)
 
     def set_attribute(self, key: str, value: Any):
         """Set node attribute"""
@@ -35,11 +67,11 @@ class ASTNode:
 
     def find_children_by_type(self, node_type: str) -> List['ASTNode']:
         """Find all children of specific type"""
-        return [child for child in self.children if child.node_type == node_type]
+        return [child for child in self._children or () if child.node_type == node_type]
 
     def find_first_child_by_type(self, node_type: str) -> Optional['ASTNode']:
         """Find first child of specific type"""
-        for child in self.children:
+        for child in self._children or ():
             if child.node_type == node_type:
                 return child
         return None
@@ -49,6 +81,8 @@ class ASTNode:
 
 class SelectNode(ASTNode):
     """SELECT statement node"""
+    __slots__ = ('fields', 'distinct')
+
     def __init__(self):
         super().__init__("SELECT")
         self.fields = []
@@ -61,6 +95,8 @@ class SelectNode(ASTNode):
 
 class FieldNode(ASTNode):
     """Field/Column node"""
+    __slots__ = ('expression', 'alias', 'table', 'is_function', 'is_aggregated')
+
     def __init__(self, expression: str, alias: str = None, table: str = None):
         super().__init__("FIELD")
         self.expression = expression
@@ -71,6 +107,8 @@ class FieldNode(ASTNode):
 
 class FromNode(ASTNode):
     """FROM clause node"""
+    __slots__ = ('table_references',)
+
     def __init__(self):
         super().__init__("FROM")
         self.table_references = []
@@ -82,6 +120,8 @@ class FromNode(ASTNode):
 
 class TableReferenceNode(ASTNode):
     """Table reference node (table name + alias)"""
+    __slots__ = ('table_name', 'alias', 'schema')
+
     def __init__(self, table_name: str, alias: str = None, schema: str = None):
         super().__init__("TABLE_REFERENCE")
         self.table_name = table_name
@@ -90,6 +130,8 @@ class TableReferenceNode(ASTNode):
 
 class JoinNode(ASTNode):
     """JOIN node"""
+    __slots__ = ('join_type', 'table_reference', 'condition')
+
     def __init__(self, join_type: str, table_ref: TableReferenceNode, condition: 'ConditionNode'):
         super().__init__("JOIN")
         self.join_type = join_type.upper()  # INNER, LEFT, RIGHT, FULL
@@ -100,6 +142,8 @@ class JoinNode(ASTNode):
 
 class ConditionNode(ASTNode):
     """Condition node (ON clause, WHERE clause)"""
+    __slots__ = ('condition_text', 'left_table', 'left_field', 'right_table', 'right_field', 'operator')
+
     def __init__(self, condition_text: str):
         super().__init__("CONDITION")
         self.condition_text = condition_text
@@ -116,19 +160,51 @@ class ConditionNode(ASTNode):
         self.right_table = right_table
         self.right_field = right_field
 
+class LogicalConditionNode(ASTNode):
+    """AND / OR group of conditions (inner node of a WHERE condition tree)"""
+    __slots__ = ('operator', 'operands')
+
+    def __init__(self, operator: str):
+        super().__init__("LOGICAL", operator)
+        self.operator = operator
+        self.operands = []
+
+    def add_operand(self, operand: ASTNode):
+        """Add a ConditionNode or nested LogicalConditionNode"""
+        self.operands.append(operand)
+        self.add_child(operand)
+
 class WhereNode(ASTNode):
-    """WHERE clause node"""
+    """WHERE clause node
+
+    `conditions` are the top-level conditions (split on depth-0 AND/OR);
+    `tree` nests them as LogicalConditionNode groups (AND binds tighter than
+    OR, parenthesized groups become subtrees), or is a single ConditionNode.
+    """
+    __slots__ = ('conditions', 'tree')
+
     def __init__(self):
         super().__init__("WHERE")
         self.conditions = []
+        self.tree = None
 
     def add_condition(self, condition: ConditionNode):
         """Add condition to WHERE"""
         self.conditions.append(condition)
         self.add_child(condition)
 
+    def condition_texts(self) -> List[str]:
+        """Top-level condition strings (the `whereConditions` output)"""
+        return [condition.condition_text for condition in self.conditions]
+
+    def tree_to_dict(self) -> Any:
+        """Condition tree as plain data: a condition string, or {"operator": ..., "operands": [...]}"""
+        return condition_tree_to_dict(self.tree) if self.tree is not None else None
+
 class GroupByNode(ASTNode):
     """GROUP BY clause node"""
+    __slots__ = ('fields',)
+
     def __init__(self):
         super().__init__("GROUP_BY")
         self.fields = []
@@ -139,21 +215,28 @@ class GroupByNode(ASTNode):
 
 class OrderByNode(ASTNode):
     """ORDER BY clause node"""
+    __slots__ = ('fields',)
+
     def __init__(self):
         super().__init__("ORDER_BY")
         self.fields = []
 
 class CTENode(ASTNode):
     """CTE (Common Table Expression) node"""
+    __slots__ = ('name', 'query_node', 'recursive', 'depends_on')
+
     def __init__(self, name: str, query_node: 'QueryNode', recursive: bool = False):
         super().__init__("CTE")
         self.name = name
         self.query_node = query_node
         self.recursive = recursive
+        self.depends_on = []  # Names of the other CTEs this one reads
         self.add_child(query_node)
 
 class WithNode(ASTNode):
     """WITH clause node"""
+    __slots__ = ('ctes',)
+
     def __init__(self):
         super().__init__("WITH")
         self.ctes = []
@@ -163,8 +246,41 @@ class WithNode(ASTNode):
         self.ctes.append(cte)
         self.add_child(cte)
 
+    def dependency_graph(self) -> Dict[str, List[str]]:
+        """CTE name -> names of the CTEs it reads"""
+        return {cte.name: list(cte.depends_on) for cte in self.ctes}
+
+    def evaluation_order(self) -> List[str]:
+        """🔗 CTE names with every CTE after the ones it reads (definition order otherwise)
+
+        Kahn's algorithm, linear in CTEs + dependencies; CTEs on a cycle (not
+        valid SQL) are appended in definition order.
+        """
+        names = [cte.name for cte in self.ctes]
+        pending = {name: 0 for name in names}
+        readers: Dict[str, List[str]] = {name: [] for name in names}
+        for cte in self.ctes:
+            for dependency in cte.depends_on:
+                if dependency in readers:
+                    readers[dependency].append(cte.name)
+                    pending[cte.name] += 1
+        
+        order = [name for name in names if pending[name] == 0]
+        for name in order:
+            for reader in readers[name]:
+                pending[reader] -= 1
+                if pending[reader] == 0:
+                    order.append(reader)
+        if len(order) < len(pending):
+            placed = set(order)
+            order.extend(name for name in names if name not in placed)
+        return order
+
 class QueryNode(ASTNode):
     """Complete query node (can contain subqueries)"""
+    __slots__ = ('with_clause', 'select_clause', 'from_clause', 'where_clause', 'group_by_clause',
+                 'order_by_clause', 'joins')
+
     def __init__(self):
         super().__init__("QUERY")
         self.with_clause = None
@@ -207,6 +323,8 @@ class QueryNode(ASTNode):
 
 class SubqueryNode(ASTNode):
     """Subquery node"""
+    __slots__ = ('query', 'alias')
+
     def __init__(self, query: QueryNode, alias: str = None):
         super().__init__("SUBQUERY")
         self.query = query
@@ -228,14 +346,18 @@ def create_table_reference(table_name: str, alias: str = None) -> TableReference
     """Create table reference node"""
     return TableReferenceNode(table_name.strip('`'), alias.strip('`') if alias else None)
 
+def condition_tree_to_dict(node: ASTNode) -> Any:
+    """Convert a WHERE condition tree node into nested dicts / condition strings"""
+    if isinstance(node, LogicalConditionNode):
+        return {"operator": node.operator, "operands": [condition_tree_to_dict(operand) for operand in node.operands]}
+    return node.condition_text
+
 def create_join_condition(condition_text: str) -> ConditionNode:
     """🚀 ENHANCED: Create join condition with support for both backtick and backtick-free SQL"""
     condition = ConditionNode(condition_text)
     
-    import re
-    
     # 🎯 Pattern 1: Backtick format - `table1`.`field1` = `table2`.`field2`
-    backtick_match = re.search(r'`([^`]+)`\.`([^`]+)`\s*=\s*`([^`]+)`\.`([^`]+)`', condition_text)
+    backtick_match = _BACKTICK_JOIN_CONDITION.search(condition_text)
     if backtick_match:
         condition.set_join_fields(
             backtick_match.group(1), backtick_match.group(2),
@@ -244,7 +366,7 @@ def create_join_condition(condition_text: str) -> ConditionNode:
         return condition
     
     # 🎯 Pattern 2: Backtick-free format - table1.field1 = table2.field2 (normalized SQL)
-    normal_match = re.search(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\b', condition_text)
+    normal_match = _PLAIN_JOIN_CONDITION.search(condition_text)
     if normal_match:
         condition.set_join_fields(
             normal_match.group(1), normal_match.group(2),
@@ -253,7 +375,7 @@ def create_join_condition(condition_text: str) -> ConditionNode:
         return condition
     
     # 🎯 Pattern 3: Database-prefixed format - db.table1.field1 = db.table2.field2
-    db_match = re.search(r'\b[a-zA-Z_][a-zA-Z0-9_]*\\.([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*[a-zA-Z_][a-zA-Z0-9_]*\\.([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)\b', condition_text)
+    db_match = _DB_JOIN_CONDITION.search(condition_text)
     if db_match:
         condition.set_join_fields(
             db_match.group(1), db_match.group(2),
@@ -0,0 +1,179 @@
+"""
+Async Parsing - SQL Parser AST v6.0
+
+⚡ asyncio front end that keeps parsing off the event loop
+
+AsyncSQLParser runs every parse in a bounded worker pool (processes by
+default, or threads sharing one SQLParserAST) so aiohttp/FastAPI handlers can
+simply `await parser.parse(sql)`:
+
+- at most max_concurrency parses are in the pool at once; further callers
+  wait on the event loop, which is the backpressure
+- max_pending optionally sheds load: once that many callers are already
+  waiting, parse() raises ParserBusyError instead of queueing
+- cancelling a waiting caller withdraws its request; a parse that already
+  started keeps its slot until it finishes (use timeout= to bound that)
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from .batch import _init_worker, _parse_one
+from .sql_parser_ast_v6_0 import SQLParserAST, _get_shared_parser
+
+
+class ParserBusyError(RuntimeError):
+    """⚡ Raised by AsyncSQLParser.parse when its wait queue is full"""
+
+
+class AsyncSQLParser:
+    """⚡ Parse SQL from coroutines in a bounded process or thread pool"""
+
+    MODES = ("process", "thread")
+
+    def __init__(self, workers: Optional[int] = None, mode: str = "process",
+                 max_concurrency: Optional[int] = None, max_pending: Optional[int] = None,
+                 **parser_options):
+        """Configure the pool (workers start on the first parse)
+
+        Args:
+            workers: Pool size (default: os.cpu_count())
+            mode: "process" parses in worker processes, each with its own warm
+                parser; "thread" shares one parser between pool threads, which
+                keeps the loop responsive but is serialized by the GIL
+            max_concurrency: Parses submitted to the pool at once (default: workers)
+            max_pending: Callers allowed to wait for a slot before parse() raises
+                ParserBusyError (default: None, wait without limit)
+            **parser_options: Keyword arguments for SQLParserAST; in process mode
+                they must be picklable (e.g. no lambda diagnostics_callback)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode: {mode!r}")
+        workers = workers or os.cpu_count() or 1
+        max_concurrency = max_concurrency or workers
+        if workers < 1 or max_concurrency < 1:
+            raise ValueError("workers and max_concurrency must be at least 1")
+        if max_pending is not None and max_pending < 0:
+            raise ValueError("max_pending must be >= 0")
+
+        self.workers = workers
+        self.mode = mode
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.parser_options = parser_options
+
+        self._executor: Optional[Executor] = None
+        self._parser: Optional[SQLParserAST] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._closed = False
+
+        # Counters (only touched from the event loop thread)
+        self.in_flight = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _start(self):
+        """Create the pool and the slot semaphore inside the running loop"""
+        if self._closed:
+            raise RuntimeError("AsyncSQLParser is closed")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                     initargs=(self.parser_options,))
+            else:
+                self._parser = SQLParserAST(**self.parser_options)
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="sql-splitter")
+
+    async def parse(self, sql: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Parse one statement without blocking the event loop
+
+        Args:
+            sql: SQL statement to parse
+            timeout: Parse time budget in seconds (see SQLParserAST.parse); the
+                wait for a free slot does not count against it
+        """
+        self._start()
+        slots = self._slots
+        if slots.locked() and self.max_pending is not None and self.waiting >= self.max_pending:
+            self.rejected += 1
+            raise ParserBusyError(f"{self.waiting} parse requests already waiting")
+
+        self.waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            if self.mode == "process":
+                work = self._executor.submit(_parse_one, sql, timeout)
+            else:
+                work = self._executor.submit(self._parser.parse, sql, timeout)
+        except BaseException:
+            slots.release()
+            raise
+        self.in_flight += 1
+
+        def release(_):
+            # A cancelled caller does not free the slot before the worker does
+            try:
+                loop.call_soon_threadsafe(self._finished)
+            except RuntimeError:  # loop already closed
+                pass
+
+        work.add_done_callback(release)
+        return await asyncio.wrap_future(work)
+
+    def _finished(self):
+        self.in_flight -= 1
+        self.completed += 1
+        self._slots.release()
+
+    async def parse_many(self, sqls: Iterable[str], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Parse several statements concurrently; results come back in input order"""
+        return list(await asyncio.gather(*(self.parse(sql, timeout) for sql in sqls)))
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool occupancy and counters"""
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "maxConcurrency": self.max_concurrency,
+            "inFlight": self.in_flight,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected
+        }
+
+    async def aclose(self):
+        """Shut the pool down once the parses already submitted have finished"""
+        self._closed = True
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(executor.shutdown, wait=True))
+
+    async def __aenter__(self) -> 'AsyncSQLParser':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+async def parse_async(sql: str, use_token_stream: bool = False,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+    """⚡ Parse on the loop's default thread pool with the process-wide shared parser
+
+    For bounded concurrency or process workers use AsyncSQLParser.
+    """
+    parser = _get_shared_parser(use_token_stream)
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(parser.parse, sql, timeout))
@@ -0,0 +1,93 @@
+"""
+Batch Parsing - SQL Parser AST v6.0
+
+🏭 Parse many SQL statements across a process pool
+
+Parsing is CPU-bound regex work, so threads are serialized by the GIL.
+Each worker process builds one warm SQLParserAST at start-up and parses
+whole chunks of statements; results are yielded in input order.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Any, Optional
+
+from .sql_parser_ast_v6_0 import SQLParserAST
+from .regex_registry import REGEX_REGISTRY
+
+# Per-process parser, created once by the pool initializer
+_worker_parser = None
+
+
+def _init_worker(parser_options: Dict[str, Any]):
+    """Pool initializer: build the warm parser this worker will reuse"""
+    global _worker_parser
+    _worker_parser = SQLParserAST(**parser_options)
+    REGEX_REGISTRY.warm()
+
+
+def _parse_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+    """Parse one chunk of statements inside a worker process"""
+    return [_worker_parser.parse(sql) for sql in chunk]
+
+
+def _parse_one(sql: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Parse a single statement inside a worker process (used by AsyncSQLParser)"""
+    return _worker_parser.parse(sql, timeout)
+
+
+def _chunked(sqls: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    """Group an iterable into lists of at most chunksize items"""
+    iterator = iter(sqls)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_parse_sql_batch(sqls: Iterable[str], workers: Optional[int] = None, chunksize: int = 16,
+                         max_pending_chunks: Optional[int] = None,
+                         **parser_options) -> Iterator[Dict[str, Any]]:
+    """🏭 Parse SQL statements in worker processes, yielding results in input order
+
+    Args:
+        sqls: Iterable of SQL strings (consumed lazily)
+        workers: Number of worker processes (default: os.cpu_count()); 1 parses in-process
+        chunksize: Statements sent to a worker per task
+        max_pending_chunks: Chunks in flight at once (default: 2 per worker), which
+            bounds memory when sqls is a large generator
+        **parser_options: Keyword arguments for SQLParserAST in each worker; they
+            must be picklable (e.g. no lambda diagnostics_callback)
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        parser = SQLParserAST(**parser_options)
+        for sql in sqls:
+            yield parser.parse(sql)
+        return
+
+    if max_pending_chunks is None:
+        max_pending_chunks = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(parser_options,)) as executor:
+        pending = deque()
+        for chunk in _chunked(sqls, chunksize):
+            pending.append(executor.submit(_parse_chunk, chunk))
+            if len(pending) >= max_pending_chunks:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def parse_sql_batch(sqls: Iterable[str], workers: Optional[int] = None, chunksize: int = 16,
+                    **parser_options) -> List[Dict[str, Any]]:
+    """🏭 Parse SQL statements in worker processes and return results in input order"""
+    return list(iter_parse_sql_batch(sqls, workers=workers, chunksize=chunksize, **parser_options))
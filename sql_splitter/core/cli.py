@@ -0,0 +1,159 @@
+"""
+Command Line Interface - SQL Parser AST v6.0
+
+🖥️ `sql-splitter` console entry point
+
+Splits SQL scripts from files or stdin into statements (statement_splitter),
+parses them (optionally across a process pool) and streams one JSON object
+per statement to stdout (NDJSON).
+Input is consumed lazily, so arbitrarily large dumps never sit in memory.
+Throughput stats go to stderr on exit.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from .batch import iter_parse_sql_batch
+from .statement_splitter import split_statements, split_sql_file
+from .schema_registry import SchemaRegistry
+
+
+def _iter_input_statements(paths: List[str], stdin: TextIO, delimiter: str = ';') -> Iterator[str]:
+    """Statements of every input in order ('-' or no paths means stdin)
+
+    A statement never spans two inputs.
+    """
+    for path in paths or ['-']:
+        if path == '-':
+            # Read raw bytes when possible so undecodable input cannot abort the run
+            yield from split_statements(getattr(stdin, 'buffer', stdin), delimiter)
+        else:
+            yield from split_sql_file(path, delimiter)
+
+
+class _Throughput:
+    """📈 Running counters for the exit summary"""
+
+    def __init__(self):
+        self.statements = 0
+        self.failures = 0
+        self.input_bytes = 0
+        self.started = time.perf_counter()
+
+    def count_input(self, statements: Iterable[str]) -> Iterator[str]:
+        """Pass statements through while measuring their size"""
+        for statement in statements:
+            self.input_bytes += len(statement.encode('utf-8', 'surrogatepass'))
+            yield statement
+
+    def summary(self) -> str:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return (f"sql-splitter: {self.statements} statements ({self.failures} failed) "
+                f"in {elapsed:.2f}s - {self.statements / elapsed:.1f} stmt/s, "
+                f"{self.input_bytes / elapsed / 1e6:.2f} MB/s")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Argument parser for the sql-splitter command"""
+    parser = argparse.ArgumentParser(
+        prog='sql-splitter',
+        description="Parse SQL statements and write one JSON result per line (NDJSON)."
+    )
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help="SQL files to read ('-' or none for stdin)")
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help="Write NDJSON here instead of stdout")
+    parser.add_argument('-d', '--delimiter', default=';',
+                        help="Initial statement delimiter (DELIMITER commands still apply; default: ';')")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="Worker processes (default: 1, parse in-process; 0 = one per CPU)")
+    parser.add_argument('--chunksize', type=int, default=64,
+                        help="Statements per worker task (default: 64)")
+    parser.add_argument('--no-normalize', action='store_true',
+                        help="Disable MySQL normalization")
+    parser.add_argument('--token-stream', action='store_true',
+                        help="Use the single-pass token stream mode")
+    parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                        help="Per-statement parse budget; slower statements yield a timeout error result")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="Persistent result cache (SQLite file); unchanged statements are not reparsed")
+    parser.add_argument('--schemas', metavar='FILE',
+                        help="Database names whose `db.` prefixes are stripped (JSON list or one per line); "
+                             "replaces the built-in names")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="Do not print throughput stats to stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """🖥️ Console entry point; returns the process exit code"""
+    args = build_arg_parser().parse_args(argv)
+    if args.workers < 0:
+        print("sql-splitter: --workers must be >= 0", file=sys.stderr)
+        return 2
+    if not args.delimiter or any(char.isspace() for char in args.delimiter):
+        print("sql-splitter: --delimiter must be non-empty and contain no whitespace", file=sys.stderr)
+        return 2
+    if args.chunksize < 1:
+        print("sql-splitter: --chunksize must be >= 1", file=sys.stderr)
+        return 2
+    if args.timeout is not None and not args.timeout > 0:
+        print("sql-splitter: --timeout must be > 0", file=sys.stderr)
+        return 2
+
+    schema_registry = None
+    if args.schemas:
+        try:
+            schema_registry = SchemaRegistry.from_file(args.schemas)
+        except (OSError, ValueError) as e:
+            print(f"sql-splitter: cannot load --schemas: {e}", file=sys.stderr)
+            return 2
+
+    output = sys.stdout
+    if args.output:
+        try:
+            output = open(args.output, 'w', encoding='utf-8')
+        except OSError as e:
+            print(f"sql-splitter: cannot open -o: {e}", file=sys.stderr)
+            return 1
+
+    stats = _Throughput()
+    statements = stats.count_input(_iter_input_statements(args.files, sys.stdin, args.delimiter))
+    results = iter_parse_sql_batch(
+        statements,
+        workers=args.workers or None,
+        chunksize=args.chunksize,
+        enable_normalization=not args.no_normalize,
+        use_token_stream=args.token_stream,
+        parse_timeout=args.timeout,
+        cache_path=args.cache,
+        schema_registry=schema_registry
+    )
+
+    try:
+        for result in results:
+            output.write(json.dumps(result, ensure_ascii=False, separators=(',', ':')))
+            output.write('\n')
+            stats.statements += 1
+            if not result.get('success'):
+                stats.failures += 1
+        output.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); silence the final flush too
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except OSError as e:
+        print(f"sql-splitter: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        print(stats.summary(), file=sys.stderr)
+    return 0
@@ -10,17 +10,63 @@ Status: ✅ Final JSON output generation for 100% expect.md compliance
 """
 
 import re
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 from .ast_nodes import *
-from .sql_tokenizer import SQLTokenizer, TokenStream
+from .sql_tokenizer import SQLTokenizer, TokenStream, TokenType, TOKEN_TYPE_CODES, WORD_CODES
+from .regex_registry import regex, LazyClause
+from .schema_registry import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY
+from .deadline import ParseDeadline
+
+# 🧮 Precompiled patterns (declared once in the shared regex registry)
+# ⏱️ Linear-time forms: keyword clauses use LazyClause, leading whitespace runs are
+# only entered at their first character ((?<!\s)) and leading identifiers at the
+# start of their word (digits skipped), so a failed search never rescans a run
+_SELECT_CLAUSE = LazyClause(r'\bSELECT\s+', r'\s+FROM\b', re.IGNORECASE, 'content.select_clause')
+_AS_ALIAS = regex(r'(?<!\s)\s+AS\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE, 'content.as_alias')
+_AS_BACKTICK_ALIAS = regex(r'(?<!\s)\s+AS\s+`([^`]+)`', re.IGNORECASE, 'content.as_backtick_alias')
+_TRAILING_DOTTED_FIELD = regex(r'(?<![a-zA-Z0-9_])[0-9]*([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)$', 0, 'content.trailing_dotted_field')
+_TRAILING_BACKTICK_DOTTED_FIELD = regex(r'`([a-zA-Z_][a-zA-Z0-9_]*)`\\.`([a-zA-Z_][a-zA-Z0-9_]*)`$', 0, 'content.trailing_backtick_dotted_field')
+_TRAILING_NAME = regex(r'(?<![a-zA-Z0-9_])[0-9]*([a-zA-Z_][a-zA-Z0-9_]*)$', 0, 'content.trailing_name')
+_FUNCTION_CALL_NAME = regex(r'(?<![a-zA-Z0-9_])[0-9]*([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', 0, 'content.function_call_name')
+_AS_KEYWORD = regex(r'(?<!\s)\s+AS\s+', re.IGNORECASE, 'content.as_keyword')
+_TABLE_FIELD_REFERENCE = regex(r'(?<!\w)(\w+)\.(\w+)', 0, 'content.table_field_reference')
+_AGGREGATE_ARGUMENT_TABLE = regex(r'\b(?:COUNT|SUM|AVG|MAX|MIN|STDDEV)\s*\(\s*(?:DISTINCT\s+)?([a-zA-Z_][a-zA-Z0-9_]*)\.[a-zA-Z_][a-zA-Z0-9_]*', re.IGNORECASE, 'content.aggregate_argument_table')
+_PARTITION_BY_TABLE = regex(r'OVER\s*\(\s*PARTITION\s+BY\s+([a-zA-Z_][a-zA-Z0-9_]*)\.[a-zA-Z_][a-zA-Z0-9_]*', re.IGNORECASE, 'content.partition_by_table')
+_SQL_FUNCTION_CALL = regex(r'\b(sum|count|avg|max|min|date_format|if|concat|case|when|then|else|end|coalesce|ifnull|length|substring|upper|lower|trim|now|curdate|year|month|day)\s*\(', re.IGNORECASE, 'content.sql_function_call')
+_DB_TABLE_FIELD = regex(r'\b([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*)\b', 0, 'content.db_table_field')
+_GROUP_BY_CLAUSE = LazyClause(r'\bGROUP\s+BY\s+', r'\s+(?:ORDER\s+BY|HAVING|LIMIT|$)', re.IGNORECASE, 'content.group_by_clause')
+_BACKTICK_QUOTED = regex(r'`([^`]+)`', 0, 'content.backtick_quoted')
+# Structural units of a SELECT list: quoted strings (with '' and \' escapes) and
+# backtick identifiers as one match each (unterminated ones run to the end), or a
+# single paren / comma
+_SELECT_LIST_TOKEN = regex(r"'(?:[^'\\]|\\.?|'')*'?|\"(?:[^\"\\]|\\.?|\"\")*\"?|`(?:[^`]|``)*`?|[(),]",
+                           re.DOTALL, 'content.select_list_token')
+
+# 🔢 Integer codes for the clause scan (see TokenStream.types / TokenStream.codes)
+_KEYWORD = TOKEN_TYPE_CODES[TokenType.KEYWORD]
+_PAREN_OPEN = TOKEN_TYPE_CODES[TokenType.PAREN_OPEN]
+_PAREN_CLOSE = TOKEN_TYPE_CODES[TokenType.PAREN_CLOSE]
+_BY = WORD_CODES['BY']
+_AND = WORD_CODES['AND']
+_OR = WORD_CODES['OR']
+_BETWEEN = WORD_CODES['BETWEEN']
 
 class ContentExtractor:
     """Extract final content from SQL for expect.md compliance"""
 
-    def __init__(self):
+    # Depth-0 keywords that open a clause of the main query (token path)
+    CLAUSE_KEYWORDS = {'SELECT', 'FROM', 'WHERE', 'GROUP', 'HAVING', 'ORDER', 'LIMIT'}
+
+    # Deeper parenthesized WHERE groups stay leaf conditions (bounds recursion)
+    MAX_WHERE_TREE_DEPTH = 64
+
+    def __init__(self, schemas: Optional[SchemaRegistry] = None, deadline: Optional[ParseDeadline] = None):
+        self.schemas = DEFAULT_SCHEMA_REGISTRY if schemas is None else schemas
         self.table_aliases = {}
         self.database_name = ""
         self.detected_databases = set()
+        # Time budget of the parse call, polled by the WHERE splitter
+        self.deadline = deadline
 
     def extract_fields(self, sql: str, group_by_fields: List[str] = None) -> List[Dict[str, Any]]:
         """🎯 Extract field information with enhanced parsing"""
@@ -29,7 +75,7 @@ class ContentExtractor:
             group_by_fields = []
 
         # Extract SELECT clause
-        select_match = re.search(r'\bSELECT\s+(.*?)\s+FROM\b', sql, re.IGNORECASE | re.DOTALL)
+        select_match = _SELECT_CLAUSE.search(sql)
         if not select_match:
             return fields
 
@@ -44,32 +90,31 @@ class ContentExtractor:
         return fields
 
     def _smart_split_fields(self, select_clause: str) -> List[str]:
-        """🎯 Intelligent field splitting with function/parentheses awareness"""
+        """🎯 Intelligent field splitting with function/parentheses awareness
+
+        One scan over the structural characters: quoted strings and identifiers
+        are skipped whole (including '' / \\' escapes), commas at depth 0 mark
+        field boundaries, and each field is sliced out of the clause once.
+        """
         fields = []
-        current_field = ""
+        start = 0
         paren_level = 0
-        quote_level = 0
-        in_backticks = False
 
-        for char in select_clause:
-            if char == '`':
-                in_backticks = not in_backticks
-            elif char == '(' and not in_backticks:
+        for match in _SELECT_LIST_TOKEN.finditer(select_clause):
+            char = match.group()
+            if char == '(':
                 paren_level += 1
-            elif char == ')' and not in_backticks:
+            elif char == ')':
                 paren_level -= 1
-            elif char == "'" and not in_backticks:
-                quote_level = 1 - quote_level
-            elif char == ',' and paren_level == 0 and quote_level == 0 and not in_backticks:
-                if current_field.strip():
-                    fields.append(current_field.strip())
-                current_field = ""
-                continue
+            elif char == ',' and paren_level == 0:
+                field = select_clause[start:match.start()].strip()
+                if field:
+                    fields.append(field)
+                start = match.end()
 
-            current_field += char
-
-        if current_field.strip():
-            fields.append(current_field.strip())
+        field = select_clause[start:].strip()
+        if field:
+            fields.append(field)
 
         return fields
 
@@ -104,32 +149,32 @@ class ContentExtractor:
         """🎯 Extract field alias with backtick-free and backtick support"""
         
         # Pattern 1: AS alias (without backticks) - MOST COMMON after normalization
-        as_match = re.search(r'\s+AS\s+([a-zA-Z_][a-zA-Z0-9_]*)', field_str, re.IGNORECASE)
+        as_match = _AS_ALIAS.search(field_str)
         if as_match:
             return as_match.group(1)
         
         # Pattern 2: AS `alias` (with backticks) - legacy support
-        as_backtick_match = re.search(r'\s+AS\s+`([^`]+)`', field_str, re.IGNORECASE)
+        as_backtick_match = _AS_BACKTICK_ALIAS.search(field_str)
         if as_backtick_match:
             return as_backtick_match.group(1)
 
         # Pattern 3: table.field format (without backticks)
-        dot_match = re.search(r'([a-zA-Z_][a-zA-Z0-9_]*)\\.([a-zA-Z_][a-zA-Z0-9_]*)$', field_str)
+        dot_match = _TRAILING_DOTTED_FIELD.search(field_str)
         if dot_match:
             return dot_match.group(2)  # Use field name as alias
 
         # Pattern 4: `table`.`field` format (with backticks) - legacy support
-        dot_backtick_match = re.search(r'`([a-zA-Z_][a-zA-Z0-9_]*)`\\.`([a-zA-Z_][a-zA-Z0-9_]*)`$', field_str)
+        dot_backtick_match = _TRAILING_BACKTICK_DOTTED_FIELD.search(field_str)
         if dot_backtick_match:
             return dot_backtick_match.group(2)  # Use field name as alias
 
         # Pattern 5: Direct field name (no dots)
-        field_match = re.search(r'([a-zA-Z_][a-zA-Z0-9_]*)$', field_str)
+        field_match = _TRAILING_NAME.search(field_str)
         if field_match:
             return field_match.group(1)
 
         # Pattern 6: Function name extraction
-        func_match = re.search(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', field_str)
+        func_match = _FUNCTION_CALL_NAME.search(field_str)
         if func_match:
             return func_match.group(1).upper()  # Use function name as alias
 
@@ -141,9 +186,12 @@ class ContentExtractor:
 
     def _get_original_expression(self, field_str: str) -> str:
         """Get original expression without AS clause"""
-        as_match = re.search(r'(.*?)\s+AS\s+', field_str, re.IGNORECASE)
+        # Same result as (.*?)\s+AS\s+ without retrying AS after every character:
+        # the expression runs from the start of the line holding the first AS
+        as_match = _AS_KEYWORD.search(field_str)
         if as_match:
-            return as_match.group(1).strip()
+            line_start = field_str.rfind('\n', 0, as_match.start()) + 1
+            return field_str[line_start:as_match.start()].strip()
         return field_str.strip()
 
     def _determine_field_table(self, expr: str) -> str:
@@ -180,7 +228,7 @@ class ContentExtractor:
             table_name = parts[1].strip()
             # Skip database prefix, use actual table name
             if (table_name not in self.detected_databases and 
-                table_name != 'momo' and 
+                table_name not in self.schemas and 
                 self._is_valid_table_name(table_name)):
                 return table_name
         
@@ -193,7 +241,7 @@ class ContentExtractor:
             if (self._is_valid_identifier(table_or_alias) and 
                 self._is_valid_identifier(field_name) and
                 table_or_alias not in self.detected_databases and 
-                table_or_alias != 'momo'):
+                table_or_alias not in self.schemas):
                 
                 # Resolve alias to actual table name
                 resolved_table = self._resolve_table_alias(table_or_alias)
@@ -245,15 +293,14 @@ class ContentExtractor:
         # 🔍 Enhanced pattern: Capture all valid table.field patterns including inside functions
         # Matches: table.field, alias.field, even inside parentheses like COUNT(table.field)
         # Using the working pattern from debug: (\w+)\.(\w+)
-        pattern = r'(\w+)\.(\w+)'
-        matches = re.findall(pattern, expr)
+        matches = _TABLE_FIELD_REFERENCE.findall(expr)
         
         # 🎯 Filter and validate matches (mo-sql-parsing quality standards)
         valid_refs = []
         for table_or_alias, field_name in matches:
             # Skip database names and invalid patterns
             if (table_or_alias not in self.detected_databases and 
-                table_or_alias != 'momo' and
+                table_or_alias not in self.schemas and
                 len(table_or_alias) >= 1 and len(field_name) >= 2 and  # ✅ Allow single-char aliases like 'o', 'c', 'u'
                 not any(char in table_or_alias for char in ['+', '-', '*', '/', '(', ')', '=', '<', '>']) and
                 not any(char in field_name for char in ['+', '-', '*', '/', '(', ')', '=', '<', '>'])):
@@ -269,8 +316,7 @@ class ContentExtractor:
         
         # 🎯 Priority 1: Table reference in function arguments (highest priority)
         # mo-sql-parsing insight: Function arguments contain the most relevant table
-        func_pattern = r'\b(?:COUNT|SUM|AVG|MAX|MIN|STDDEV)\s*\(\s*(?:DISTINCT\s+)?([a-zA-Z_][a-zA-Z0-9_]*)\.[a-zA-Z_][a-zA-Z0-9_]*'
-        func_match = re.search(func_pattern, expr, re.IGNORECASE)
+        func_match = _AGGREGATE_ARGUMENT_TABLE.search(expr)
         if func_match:
             func_table = func_match.group(1)
             for table_or_alias, _ in table_refs:
@@ -278,8 +324,7 @@ class ContentExtractor:
                     return self._resolve_table_alias(table_or_alias)
         
         # 🎯 Priority 2: Window function PARTITION BY table (high priority)
-        window_pattern = r'OVER\s*\(\s*PARTITION\s+BY\s+([a-zA-Z_][a-zA-Z0-9_]*)\.[a-zA-Z_][a-zA-Z0-9_]*'
-        window_match = re.search(window_pattern, expr, re.IGNORECASE)
+        window_match = _PARTITION_BY_TABLE.search(expr)
         if window_match:
             window_table = window_match.group(1)
             for table_or_alias, _ in table_refs:
@@ -302,108 +347,35 @@ class ContentExtractor:
         """🎯 Format field expression for expect.md compliance with backtick-free support"""
         
         # Uppercase SQL functions
-        formatted = re.sub(
-            r'\b(sum|count|avg|max|min|date_format|if|concat|case|when|then|else|end|coalesce|ifnull|length|substring|upper|lower|trim|now|curdate|year|month|day)\s*\(',
-            lambda m: m.group().upper(), 
-            expr, 
-            flags=re.IGNORECASE
-        )
+        formatted = _SQL_FUNCTION_CALL.sub(lambda m: m.group().upper(), expr)
 
         # Apply dot-split approach to field names too!
-        formatted = re.sub(r'\b([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*)\b', 
-                          lambda m: '.'.join(m.group(1).split('.')[1:]), formatted)
+        formatted = _DB_TABLE_FIELD.sub(lambda m: '.'.join(m.group(1).split('.')[1:]), formatted)
         
         return formatted
 
-    def extract_where_conditions(self, sql: str) -> List[str]:
-        """🚀 ENHANCED: Extract only actual WHERE conditions, not SQL fragments"""
-        conditions = []
-        
-        # 🎯 Step 1: Find WHERE clause with robust boundary detection
-        where_pattern = r'\bWHERE\s+(.*?)(?=\s+(?:GROUP\s+BY|ORDER\s+BY|HAVING|LIMIT|UNION|INTERSECT|EXCEPT|\)|\s*$))'
-        where_match = re.search(where_pattern, sql, re.IGNORECASE | re.DOTALL)
-        
-        if not where_match:
-            return conditions
-        
-        where_clause = where_match.group(1).strip()
-        
-        # 🎯 Step 2: Filter out complex SQL constructs that aren't conditions
-        if self._is_valid_where_condition(where_clause):
-            # 🎯 Step 3: Split into individual conditions
-            individual_conditions = self._split_where_conditions(where_clause)
-            conditions.extend(individual_conditions)
-        
-        return conditions
-    
-    def _is_valid_where_condition(self, clause: str) -> bool:
-        """🚀 NEW: Validate that clause is actually a WHERE condition, not SQL fragments"""
-        
-        # 🚨 Red flags: These indicate SQL fragments, not conditions
-        red_flags = [
-            'UNION ALL SELECT',
-            'INNER JOIN',
-            'LEFT JOIN', 
-            'RIGHT JOIN',
-            'FROM (',
-            ') SELECT',
-            'WITH ',
-            'CREATE ',
-            'INSERT ',
-            'UPDATE ',
-            'DELETE '
-        ]
-        
-        clause_upper = clause.upper()
-        for flag in red_flags:
-            if flag in clause_upper:
-                return False
-        
-        # 🎯 Valid condition indicators
-        valid_indicators = [
-            '=', '!=', '<>', '<', '>', '<=', '>=',
-            'IS NULL', 'IS NOT NULL',
-            'IN (', 'NOT IN (',
-            'EXISTS (', 'NOT EXISTS (',
-            'LIKE ', 'NOT LIKE ',
-            'BETWEEN ', 'NOT BETWEEN '
-        ]
-        
-        # Check if contains at least one valid condition operator
-        for indicator in valid_indicators:
-            if indicator in clause_upper:
-                return True
-        
-        # 🚨 If no valid operators found, likely not a real condition  
-        return len(clause) < 200  # Allow short clauses that might be simple conditions
-    
-    def _split_where_conditions(self, where_clause: str) -> List[str]:
-        """🚀 NEW: Split WHERE clause into individual conditions"""
-        
-        # For complex WHERE clauses, return as single condition for now
-        # Future enhancement: Smart AND/OR splitting with proper parentheses handling
-        if len(where_clause.strip()) > 0:
-            return [where_clause.strip()]
-        
-        return []
-
     def extract_group_by_fields(self, sql: str) -> List[str]:
         """🎯 Extract GROUP BY fields"""
         group_by_fields = []
         
         # Extract GROUP BY clause
-        group_by_match = re.search(r'\bGROUP\s+BY\s+(.*?)(?:\s+(?:ORDER\s+BY|HAVING|LIMIT|$))', sql, re.IGNORECASE | re.DOTALL)
+        group_by_match = _GROUP_BY_CLAUSE.search(sql)
         if not group_by_match:
             return group_by_fields
         
         group_by_clause = group_by_match.group(1).strip()
+        return self._split_group_by_clause(group_by_clause)
+
+    def _split_group_by_clause(self, group_by_clause: str) -> List[str]:
+        """Split GROUP BY clause text into bare field names"""
+        group_by_fields = []
         
         # Split by comma and clean
         for field in group_by_clause.split(','):
             field = field.strip()
             if field:
                 # Remove backticks and database prefixes
-                field = re.sub(r'`([^`]+)`', r'\1', field)
+                field = _BACKTICK_QUOTED.sub(r'\1', field)
                 if '.' in field:
                     parts = field.split('.')
                     if len(parts) >= 2:
@@ -415,48 +387,240 @@ class ContentExtractor:
         return group_by_fields
 
     def extract_where_conditions(self, sql: str) -> List[str]:
-        """🔧 FIXED: Extract WHERE conditions from SQL query"""
-        where_conditions = []
-        
-        # Find WHERE clause - Fixed regex pattern
-        where_pattern = r'\bWHERE\s+(.*?)(?:\s+(?:GROUP\s+BY|ORDER\s+BY|HAVING|LIMIT)|$)'
-        where_match = re.search(where_pattern, sql, re.IGNORECASE | re.DOTALL)
-        
-        if not where_match:
-            return where_conditions
-        
-        where_clause = where_match.group(1).strip()
-        if not where_clause:
-            return where_conditions
-        
-        # Split conditions by AND/OR
-        # Simple approach: split by AND/OR but preserve the operators
-        condition_parts = re.split(r'\s+(AND|OR)\s+', where_clause, flags=re.IGNORECASE)
-        
-        current_condition = ""
-        for part in condition_parts:
-            part = part.strip()
-            if part.upper() in ['AND', 'OR']:
-                if current_condition:
-                    where_conditions.append(current_condition.strip())
-                    current_condition = ""
-            else:
-                current_condition += part + " "
-        
-        # Add the last condition
-        if current_condition.strip():
-            where_conditions.append(current_condition.strip())
-        
-        # Clean up conditions - remove backticks and database prefixes
-        cleaned_conditions = []
-        for condition in where_conditions:
-            # Remove backticks
-            condition = re.sub(r'`([^`]+)`', r'\1', condition)
-            # Keep the condition as is for now
-            if condition and condition not in cleaned_conditions:
-                cleaned_conditions.append(condition)
-        
-        return cleaned_conditions
+        """🎯 Extract WHERE conditions from SQL query (split on depth-0 AND/OR)"""
+        where_node = self.extract_where_clause(sql)
+        return where_node.condition_texts() if where_node is not None else []
+
+    def extract_where_clause(self, sql: str) -> Optional[WhereNode]:
+        """🌳 WHERE clause of the main query as a WhereNode (see extract_where_clause_from_tokens)"""
+        return self.extract_where_clause_from_tokens(SQLTokenizer().tokenize_stream(sql, compact=True))
+
+    def find_clause_spans(self, token_stream: TokenStream) -> Dict[str, Tuple[int, int]]:
+        """🎯 Locate main-query clauses in one pass over the token stream
+
+        Only depth-0 keywords count, so CTE bodies and subqueries are skipped.
+        Returns clause name -> (first body token index, end token index).
+        """
+        tokens = token_stream.tokens
+        codes = token_stream.codes
+        clause_starts = []  # (clause, keyword index, body start index)
+        seen = set()
+        depth = 0
+        
+        for i, token_type in enumerate(token_stream.types):
+            if token_type == _PAREN_OPEN:
+                depth += 1
+                continue
+            if token_type == _PAREN_CLOSE:
+                depth -= 1
+                continue
+            if depth != 0 or token_type != _KEYWORD:
+                continue
+            
+            keyword = tokens[i].value
+            if keyword == 'UNION' and clause_starts:
+                # Only the first SELECT of a UNION is described by the output
+                clause_starts.append(('UNION', i, i))
+                break
+            if keyword not in self.CLAUSE_KEYWORDS or keyword in seen:
+                continue
+            if keyword != 'SELECT' and 'SELECT' not in seen:
+                continue  # Clauses before the main SELECT (e.g. WITH ... AS) are ignored
+            
+            body_start = i + 1
+            if keyword in ('GROUP', 'ORDER'):
+                if body_start < len(codes) and codes[body_start] == _BY:
+                    body_start += 1
+                else:
+                    continue
+            
+            seen.add(keyword)
+            clause_starts.append((keyword, i, body_start))
+        
+        spans = {}
+        for index, (clause, _, body_start) in enumerate(clause_starts):
+            if clause == 'UNION':
+                continue
+            end = clause_starts[index + 1][1] if index + 1 < len(clause_starts) else len(tokens)
+            spans[clause] = (body_start, end)
+        
+        return spans
+
+    def extract_fields_from_tokens(self, token_stream: TokenStream, group_by_fields: List[str] = None,
+                                   clause_spans: Dict[str, Tuple[int, int]] = None) -> List[Dict[str, Any]]:
+        """🎯 Extract field information from the SELECT clause located via tokens"""
+        fields = []
+        if not group_by_fields:
+            group_by_fields = []
+        if clause_spans is None:
+            clause_spans = self.find_clause_spans(token_stream)
+        
+        if 'SELECT' not in clause_spans:
+            return fields
+        
+        select_clause = token_stream.text(*clause_spans['SELECT'])
+        for field_part in self._smart_split_fields(select_clause):
+            field_info = self._parse_single_field(field_part.strip(), group_by_fields)
+            if field_info:
+                fields.append(field_info)
+        
+        return fields
+
+    def extract_group_by_fields_from_tokens(self, token_stream: TokenStream,
+                                            clause_spans: Dict[str, Tuple[int, int]] = None) -> List[str]:
+        """🎯 Extract GROUP BY fields from the clause located via tokens"""
+        if clause_spans is None:
+            clause_spans = self.find_clause_spans(token_stream)
+        
+        if 'GROUP' not in clause_spans:
+            return []
+        
+        return self._split_group_by_clause(token_stream.text(*clause_spans['GROUP']))
+
+    def extract_where_conditions_from_tokens(self, token_stream: TokenStream,
+                                             clause_spans: Dict[str, Tuple[int, int]] = None) -> List[str]:
+        """🎯 Split the WHERE clause on depth-0 AND/OR tokens
+
+        Parenthesised groups, string literals and BETWEEN ... AND ... stay intact.
+        """
+        where_node = self.extract_where_clause_from_tokens(token_stream, clause_spans)
+        return where_node.condition_texts() if where_node is not None else []
+
+    def extract_where_clause_from_tokens(self, token_stream: TokenStream,
+                                         clause_spans: Dict[str, Tuple[int, int]] = None) -> Optional[WhereNode]:
+        """🌳 WHERE clause as a WhereNode: flat top-level conditions plus an AND/OR tree
+
+        Linear in the clause length: one pass pairs the parentheses, then each
+        tree level only visits its own depth-0 tokens and jumps over groups, so
+        every token is split by exactly one level.
+        """
+        if clause_spans is None:
+            clause_spans = self.find_clause_spans(token_stream)
+        
+        if 'WHERE' not in clause_spans:
+            return None
+        
+        start, end = clause_spans['WHERE']
+        types = token_stream.types
+        
+        # Partner of every paren; unbalanced ones reach to the end of the clause
+        partner = {}
+        open_parens = []
+        for i in range(start, end):
+            if types[i] == _PAREN_OPEN:
+                open_parens.append(i)
+            elif types[i] == _PAREN_CLOSE:
+                if open_parens:
+                    opener = open_parens.pop()
+                    partner[opener] = i
+                    partner[i] = opener
+                else:
+                    partner[i] = end - 1
+        for opener in open_parens:
+            partner[opener] = end - 1
+        
+        where_node = WhereNode()
+        or_groups = self._split_where_level(token_stream, start, end, partner)
+        seen = set()
+        deadline = self.deadline
+        for group in or_groups:
+            for operand_start, operand_end in group:
+                if deadline is not None:
+                    deadline.poll()
+                condition = self._where_condition_text(token_stream, operand_start, operand_end)
+                if condition and condition not in seen:
+                    seen.add(condition)
+                    where_node.add_condition(ConditionNode(condition))
+        if not where_node.conditions:
+            return None
+        
+        where_node.tree = self._build_where_tree(token_stream, or_groups, partner, 0)
+        return where_node
+
+    def _split_where_level(self, token_stream: TokenStream, start: int, end: int,
+                           partner: Dict[int, int]) -> List[List[Tuple[int, int]]]:
+        """Operand spans of one nesting level: OR groups of AND-ed (start, end) token spans"""
+        types = token_stream.types
+        codes = token_stream.codes
+        or_groups = []
+        and_operands = []
+        operand_start = start
+        pending_between = False
+        deadline = self.deadline
+        
+        i = start
+        while i < end:
+            if deadline is not None:
+                deadline.poll()
+            token_type = types[i]
+            if token_type == _PAREN_OPEN or token_type == _PAREN_CLOSE:
+                i = partner[i] + 1 if partner[i] > i else i + 1
+                continue
+            if token_type == _KEYWORD:
+                code = codes[i]
+                if code == _BETWEEN:
+                    pending_between = True
+                elif code == _AND and pending_between:
+                    pending_between = False
+                elif code == _AND or code == _OR:
+                    and_operands.append((operand_start, i))
+                    operand_start = i + 1
+                    if code == _OR:
+                        or_groups.append(and_operands)
+                        and_operands = []
+            i += 1
+        and_operands.append((operand_start, end))
+        or_groups.append(and_operands)
+        return or_groups
+
+    def _build_where_tree(self, token_stream: TokenStream, or_groups: List[List[Tuple[int, int]]],
+                          partner: Dict[int, int], depth: int) -> Optional[ASTNode]:
+        """Nest one level's operands: OR of ANDs, parenthesized operands as subtrees"""
+        alternatives = []
+        for group in or_groups:
+            operands = []
+            for operand_start, operand_end in group:
+                operand = self._where_operand(token_stream, operand_start, operand_end, partner, depth)
+                if operand is not None:
+                    operands.append(operand)
+            if len(operands) == 1:
+                alternatives.append(operands[0])
+            elif operands:
+                alternatives.append(self._logical_node('AND', operands))
+        
+        if not alternatives:
+            return None
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return self._logical_node('OR', alternatives)
+
+    def _where_operand(self, token_stream: TokenStream, start: int, end: int,
+                       partner: Dict[int, int], depth: int) -> Optional[ASTNode]:
+        """Tree node of one operand span (None for an empty span)"""
+        if start >= end:
+            return None
+        if self.deadline is not None:
+            self.deadline.poll()
+        types = token_stream.types
+        if (end - start > 2 and types[start] == _PAREN_OPEN and types[end - 1] == _PAREN_CLOSE
+                and partner[start] == end - 1 and depth < self.MAX_WHERE_TREE_DEPTH):
+            subtree = self._build_where_tree(
+                token_stream, self._split_where_level(token_stream, start + 1, end - 1, partner), partner, depth + 1)
+            if isinstance(subtree, LogicalConditionNode):
+                return subtree
+        condition = self._where_condition_text(token_stream, start, end)
+        return ConditionNode(condition) if condition else None
+
+    def _where_condition_text(self, token_stream: TokenStream, start: int, end: int) -> str:
+        """Condition text of a token span with backticks removed"""
+        return _BACKTICK_QUOTED.sub(r'\1', token_stream.text(start, end).strip())
+
+    @staticmethod
+    def _logical_node(operator: str, operands: List[ASTNode]) -> LogicalConditionNode:
+        node = LogicalConditionNode(operator)
+        for operand in operands:
+            node.add_operand(operand)
+        return node
 
     def set_context(self, table_aliases: Dict[str, str], database_name: str = "", detected_databases: Set[str] = None):
         """Set extraction context from other components"""
@@ -483,7 +647,7 @@ class ContentExtractor:
             return False
 
         # Obvious database names
-        if re.match(r'^(main_db|analytics_db|test_db|prod_db|dev_db|momo)$', name):
+        if name in self.schemas:
             return False
 
         return True
@@ -12,15 +12,59 @@ Status: ✅ Advanced CTE parsing for 100% expect.md compliance
 import re
 from typing import List, Dict, Any, Optional, Tuple, Set
 from .ast_nodes import CTENode, WithNode, QueryNode, TableReferenceNode
-from .sql_tokenizer import TokenStream, Token, TokenType
+from .sql_tokenizer import TokenStream, Token, TokenType, TOKEN_TYPE_CODES
+from .regex_registry import regex
+from .schema_registry import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY
+
+# 🧮 Precompiled patterns (declared once in the shared regex registry)
+_WITH_KEYWORD = regex(r'\bWITH\b', re.IGNORECASE, 'cte.with_keyword')
+_RECURSIVE_KEYWORD = regex(r'\s*RECURSIVE\b', re.IGNORECASE, 'cte.recursive_keyword')
+# 🔄 Units of the WITH-clause scan, in one forward pass: CTE definition starts
+# (`name AS (`, `` `name` AS ( ``, optional column list; the match ends at the body's
+# paren), the main SELECT, parens, and string literals / other quoted identifiers
+# (unnamed, skipped whole so their parens do not count). Leading identifiers are
+# only entered at the start of their word (digits skipped).
+_WITH_SCAN_UNIT = regex(
+    r"(?<![a-zA-Z0-9_])[0-9]*(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)(?:\s*\([^()]*\))?\s+AS\s*\("
+    r"|`(?P<quoted_name>[^`]+)`(?:\s*\([^()]*\))?\s+AS\s*\("
+    r"|(?P<select>\bSELECT\b)"
+    r"|(?P<open>\()|(?P<close>\))"
+    r"|'(?:[^'\\]|\\.?|'')*'?|\"(?:[^\"\\]|\\.?|\"\")*\"?|`[^`]*`?",
+    re.IGNORECASE, 'cte.with_scan_unit')
+# Words of a CTE body, matched against the CTE names for the dependency graph
+_BODY_WORD = regex(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', 0, 'cte.body_word')
+_QUERY_FIELD_TABLE = regex(r'`?(?<![a-zA-Z0-9_])[0-9]*([a-zA-Z_][a-zA-Z0-9_]+)`?\.`?[a-zA-Z_][a-zA-Z0-9_]+`?', re.IGNORECASE, 'cte.query_field_table')
+
+# 🔢 Token type codes for the CTE body scan (see TokenStream.types)
+_PAREN_OPEN = TOKEN_TYPE_CODES[TokenType.PAREN_OPEN]
+_PAREN_CLOSE = TOKEN_TYPE_CODES[TokenType.PAREN_CLOSE]
+
+# 🎯 Enhanced patterns with alias filtering
+_QUERY_TABLE_PATTERNS = (
+    # FROM table_name alias_name -> capture only table_name
+    regex(r'\bFROM\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?\s+(?:[a-zA-Z_][a-zA-Z0-9_]+)?', re.IGNORECASE, 'cte.query_table.1'),
+    # FROM table_name (no alias) - more flexible ending
+    regex(r'\bFROM\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?(?:\s+WHERE|\s+GROUP|\s+ORDER|\s+HAVING|\s|$|,)', re.IGNORECASE, 'cte.query_table.2'),
+    # JOIN table_name alias_name -> capture only table_name
+    regex(r'\b(?:LEFT\s+|RIGHT\s+|INNER\s+|OUTER\s+)?JOIN\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?\s+(?:[a-zA-Z_][a-zA-Z0-9_]+)?', re.IGNORECASE, 'cte.query_table.3'),
+    # JOIN table_name (no alias) - more flexible ending
+    regex(r'\b(?:LEFT\s+|RIGHT\s+|INNER\s+|OUTER\s+)?JOIN\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?(?:\s+ON|\s+WHERE|\s|$|,)', re.IGNORECASE, 'cte.query_table.4'),
+    # Simple FROM table_name with backticks
+    regex(r'\bFROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`', re.IGNORECASE, 'cte.query_table.5'),
+    # Simple FROM table_name without backticks
+    regex(r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]+)(?:\s|$)', re.IGNORECASE, 'cte.query_table.6'),
+)
 
 class CTEHandler:
     """Advanced CTE parsing with full WITH clause support"""
 
-    def __init__(self):
+    def __init__(self, schemas: Optional[SchemaRegistry] = None):
+        self.schemas = DEFAULT_SCHEMA_REGISTRY if schemas is None else schemas
         self.cte_tables = set()
         self.cte_definitions = {}
+        self.cte_dependencies = {}
         self.referenced_tables = set()
+        self.main_query_start = None
 
     def parse_cte_from_sql(self, sql: str) -> Tuple[Optional[WithNode], Set[str]]:
         """Parse CTE from SQL and return WITH node + all referenced tables"""
@@ -36,144 +80,77 @@ class CTEHandler:
         return with_node, self.referenced_tables
 
     def _extract_with_clause(self, sql: str) -> Optional[WithNode]:
-        """🎯 Extract complete WITH clause"""
+        """🎯 Extract complete WITH clause in one forward scan
+
+        From the first WITH, parens are tracked on a stack: a definition start
+        opens its body, the matching ')' closes it, and the first SELECT at the
+        WITH's own depth starts the main query. Definitions nested in a body
+        (an inner WITH) are collected too. Without a main SELECT there is no
+        WITH clause.
+        """
+        with_match = _WITH_KEYWORD.search(sql)
+        if not with_match:
+            return None
+        recursive = _RECURSIVE_KEYWORD.match(sql, with_match.end()) is not None
         
-        with_node = WithNode()
-        found_ctes = False
+        definitions = []  # [name, body start, body text] in definition order; text None until closed
+        stack = []        # per open paren: index into definitions, or -1
+        depth = 0
+        main_query_start = None
         
-        # 🎯 Pattern 1: Multiple CTEs - Robust manual extraction (HIGHEST PRIORITY)
-        # Find WITH keyword position
-        with_match = re.search(r'\bWITH\b', sql, re.IGNORECASE)
-        if with_match:
-            with_pos = with_match.end()
-            
-            # Find SELECT keyword that ends the WITH clause
-            select_matches = list(re.finditer(r'\bSELECT\b', sql[with_pos:], re.IGNORECASE))
-            if select_matches:
-                # Find the correct SELECT (not inside parentheses)
-                paren_level = 0
-                correct_select_pos = None
-                
-                for select_match in select_matches:
-                    abs_pos = with_pos + select_match.start()
-                    
-                    # Count parentheses from WITH to this SELECT
-                    segment = sql[with_pos:abs_pos]
-                    paren_level = segment.count('(') - segment.count(')')
-                    
-                    if paren_level == 0:
-                        correct_select_pos = abs_pos
-                        break
-                
-                if correct_select_pos:
-                    # Extract CTE block between WITH and SELECT
-                    cte_block = sql[with_pos:correct_select_pos].strip()
-                    individual_ctes = self._parse_multiple_ctes(cte_block)
-                    
-                    if individual_ctes:  # If we found CTEs, use them
-                        for cte_name, cte_query in individual_ctes:
-                            if self._is_valid_cte_name(cte_name):
-                                query_node = self._create_query_node_from_text(cte_query)
-                                cte_node = CTENode(cte_name, query_node, recursive=False)
-                                with_node.add_cte(cte_node)
-                                
-                                self.cte_tables.add(cte_name)
-                                self.cte_definitions[cte_name] = cte_query
-                                found_ctes = True
+        for unit in _WITH_SCAN_UNIT.finditer(sql, with_match.end()):
+            kind = unit.lastgroup
+            if kind is None:
+                continue  # string literal or quoted identifier
+            if kind == 'open':
+                depth += 1
+                stack.append(-1)
+            elif kind == 'close':
+                depth -= 1
+                if stack:
+                    index = stack.pop()
+                    if index >= 0:
+                        definition = definitions[index]
+                        definition[2] = sql[definition[1]:unit.start()].strip()
+            elif kind == 'select':
+                if depth == 0:
+                    main_query_start = unit.start()
+                    break
+            else:
+                depth += 1
+                stack.append(len(definitions))
+                definitions.append([unit.group(kind), unit.end(), None])
         
-        # 🎯 Pattern 2: WITH RECURSIVE CTE (fallback)
-        if not found_ctes:
-            recursive_pattern = r'\bWITH\s+RECURSIVE\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+AS\s*\(([^)]*(?:\([^)]*\)[^)]*)*)\)'
-            recursive_matches = re.finditer(recursive_pattern, sql, re.IGNORECASE | re.DOTALL)
-            
-            for match in recursive_matches:
-                cte_name = match.group(1).strip()
-                cte_query = match.group(2).strip()
-                
-                if self._is_valid_cte_name(cte_name):
-                    # Create recursive CTE
-                    query_node = self._create_query_node_from_text(cte_query)
-                    cte_node = CTENode(cte_name, query_node, recursive=True)
-                    with_node.add_cte(cte_node)
-                    
-                    self.cte_tables.add(cte_name)
-                    self.cte_definitions[cte_name] = cte_query
-                    found_ctes = True
+        if main_query_start is None:
+            return None
         
-        # 🎯 Pattern 3: Standard WITH CTE (single) (fallback)
-        if not found_ctes:
-            # Find WITH keyword position
-            with_match = re.search(r'\bWITH\b', sql, re.IGNORECASE)
-            if with_match:
-                with_pos = with_match.end()
-                
-                # Find SELECT keyword that ends the WITH clause
-                select_matches = list(re.finditer(r'\bSELECT\b', sql[with_pos:], re.IGNORECASE))
-                if select_matches:
-                    # Find the correct SELECT (not inside parentheses)
-                    paren_level = 0
-                    correct_select_pos = None
-                    
-                    for select_match in select_matches:
-                        abs_pos = with_pos + select_match.start()
-                        
-                        # Count parentheses from WITH to this SELECT
-                        segment = sql[with_pos:abs_pos]
-                        paren_level = segment.count('(') - segment.count(')')
-                        
-                        if paren_level == 0:
-                            correct_select_pos = abs_pos
-                            break
-                    
-                    if correct_select_pos:
-                        # Extract CTE block between WITH and SELECT
-                        cte_block = sql[with_pos:correct_select_pos].strip()
-                        individual_ctes = self._parse_multiple_ctes(cte_block)
-                        
-                        for cte_name, cte_query in individual_ctes:
-                            if self._is_valid_cte_name(cte_name):
-                                query_node = self._create_query_node_from_text(cte_query)
-                                cte_node = CTENode(cte_name, query_node, recursive=False)
-                                with_node.add_cte(cte_node)
-                                
-                                self.cte_tables.add(cte_name)
-                                self.cte_definitions[cte_name] = cte_query
-                                found_ctes = True
+        with_node = WithNode()
+        for cte_name, _, cte_query in definitions:
+            if cte_query is not None and self._is_valid_cte_name(cte_name):
+                query_node = self._create_query_node_from_text(cte_query)
+                with_node.add_cte(CTENode(cte_name, query_node, recursive))
+                self.cte_tables.add(cte_name)
+                self.cte_definitions[cte_name] = cte_query
         
-        return with_node if found_ctes else None
+        if not with_node.ctes:
+            return None
+        self.main_query_start = main_query_start
+        self._link_cte_dependencies(with_node)
+        return with_node
 
-    def _parse_multiple_ctes(self, cte_block: str) -> List[Tuple[str, str]]:
-        """Parse multiple CTEs from a block"""
-        ctes = []
-        
-        # 🎯 Enhanced regex for multiple CTEs with proper bracket matching
-        # This pattern handles nested parentheses more robustly
-        cte_pattern = r'([a-zA-Z_][a-zA-Z0-9_]*)\s+AS\s*\('
-        
-        # Find all CTE starts
-        cte_starts = list(re.finditer(cte_pattern, cte_block, re.IGNORECASE))
-        
-        for i, match in enumerate(cte_starts):
-            cte_name = match.group(1).strip()
-            start_pos = match.end() - 1  # Position of opening parenthesis
-            
-            # Find matching closing parenthesis
-            paren_count = 1
-            pos = start_pos + 1
-            
-            while pos < len(cte_block) and paren_count > 0:
-                if cte_block[pos] == '(':
-                    paren_count += 1
-                elif cte_block[pos] == ')':
-                    paren_count -= 1
-                pos += 1
-            
-            if paren_count == 0:
-                # Extract CTE query content (excluding outer parentheses)
-                cte_query = cte_block[start_pos + 1:pos - 1].strip()
-                ctes.append((cte_name, cte_query))
-        
-        return ctes
+    def _link_cte_dependencies(self, with_node: WithNode):
+        """🔗 Record which CTEs each CTE body reads (the CTE dependency DAG)
+
+        A dependency is a word of the body equal to another CTE's name; one
+        findall per body and a name -> position lookup keep this linear in
+        the WITH clause length. Dependencies are listed in definition order.
+        """
+        position = {cte.name: index for index, cte in enumerate(with_node.ctes)}
+        for cte in with_node.ctes:
+            words = set(_BODY_WORD.findall(self.cte_definitions.get(cte.name, '')))
+            words.discard(cte.name)
+            cte.depends_on = sorted(words & position.keys(), key=position.__getitem__)
+            self.cte_dependencies[cte.name] = list(cte.depends_on)
 
     def _create_query_node_from_text(self, query_text: str) -> QueryNode:
         """Create basic query node from text (simplified for now)"""
@@ -203,31 +180,15 @@ class CTEHandler:
         tables = set()
         
         # 🎯 Enhanced patterns with alias filtering
-        from_patterns = [
-            # FROM table_name alias_name -> capture only table_name
-            r'\bFROM\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?\s+(?:[a-zA-Z_][a-zA-Z0-9_]+)?',
-            # FROM table_name (no alias) - more flexible ending
-            r'\bFROM\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?(?:\s+WHERE|\s+GROUP|\s+ORDER|\s+HAVING|\s|$|,)',
-            # JOIN table_name alias_name -> capture only table_name  
-            r'\b(?:LEFT\s+|RIGHT\s+|INNER\s+|OUTER\s+)?JOIN\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?\s+(?:[a-zA-Z_][a-zA-Z0-9_]+)?',
-            # JOIN table_name (no alias) - more flexible ending
-            r'\b(?:LEFT\s+|RIGHT\s+|INNER\s+|OUTER\s+)?JOIN\s+`?([a-zA-Z_][a-zA-Z0-9_]+)`?(?:\s+ON|\s+WHERE|\s|$|,)',
-            # Simple FROM table_name with backticks
-            r'\bFROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`',
-            # Simple FROM table_name without backticks
-            r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]+)(?:\s|$)',
-        ]
-        
-        for pattern in from_patterns:
-            matches = re.findall(pattern, query, re.IGNORECASE)
+        for pattern in _QUERY_TABLE_PATTERNS:
+            matches = pattern.findall(query)
             for match in matches:
                 table_name = match.strip('`').strip()
                 if self._is_valid_table_name(table_name):
                     tables.add(table_name)
         
         # 🎯 Additional: Extract from field references but filter out aliases
-        field_pattern = r'`?([a-zA-Z_][a-zA-Z0-9_]+)`?\.`?[a-zA-Z_][a-zA-Z0-9_]+`?'
-        field_matches = re.findall(field_pattern, query, re.IGNORECASE)
+        field_matches = _QUERY_FIELD_TABLE.findall(query)
         for match in field_matches:
             table_name = match.strip('`').strip()
             # Only add if it's likely a real table (length > 2, not common aliases)
@@ -239,26 +200,16 @@ class CTEHandler:
         return tables
 
     def _extract_main_query_after_with(self, sql: str) -> Optional[str]:
-        """Extract main query after WITH clause"""
-        
-        # Find end of WITH clause using simple, efficient pattern
-        # Avoid catastrophic backtracking by using simpler approach
-        with_end_pattern = r'\bWITH\s+(?:RECURSIVE\s+)?.*?\)\s*SELECT'
-        match = re.search(with_end_pattern, sql, re.IGNORECASE | re.DOTALL)
-        
-        if match:
-            # Return everything from SELECT onwards
-            return sql[match.end() - 6:]  # Include SELECT
-        
-        return None
+        """Extract main query after WITH clause (located by the WITH scan)"""
+        if self.main_query_start is None:
+            return None
+        return sql[self.main_query_start:]
 
     def parse_cte_from_tokens(self, token_stream: TokenStream) -> Optional[WithNode]:
         """Parse CTE from token stream"""
         
         # Look for WITH keyword
-        if not (token_stream.current() and 
-                token_stream.current().type == TokenType.KEYWORD and 
-                token_stream.current().value.upper() == 'WITH'):
+        if not token_stream.match_keyword('WITH'):
             return None
         
         token_stream.advance()  # Consume WITH
@@ -267,9 +218,7 @@ class CTEHandler:
         
         # Check for RECURSIVE
         recursive = False
-        if (token_stream.current() and 
-            token_stream.current().type == TokenType.KEYWORD and 
-            token_stream.current().value.upper() == 'RECURSIVE'):
+        if token_stream.match_keyword('RECURSIVE'):
             recursive = True
             token_stream.advance()
         
@@ -282,6 +231,18 @@ class CTEHandler:
             
             cte_name = token_stream.advance().value.strip('`')
             
+            # Skip optional column list: name (col1, col2) AS (...)
+            if token_stream.current() and token_stream.current().type == TokenType.PAREN_OPEN:
+                column_level = 0
+                while token_stream.has_more():
+                    token = token_stream.advance()
+                    if token.type == TokenType.PAREN_OPEN:
+                        column_level += 1
+                    elif token.type == TokenType.PAREN_CLOSE:
+                        column_level -= 1
+                        if column_level == 0:
+                            break
+            
             # Consume AS
             if not token_stream.consume('AS', TokenType.KEYWORD):
                 break
@@ -290,23 +251,26 @@ class CTEHandler:
             if not token_stream.consume('(', TokenType.PAREN_OPEN):
                 break
             
-            # Parse CTE query (simplified - collect tokens until matching close paren)
-            query_tokens = []
+            # Parse CTE query (collect tokens until matching close paren)
+            query_start = token_stream.position
+            query_end = query_start
             paren_level = 1
+            types = token_stream.types
             
-            while token_stream.has_more() and paren_level > 0:
-                token = token_stream.advance()
+            while token_stream.position < len(types) and paren_level > 0:
+                token_type = types[token_stream.position]
+                token_stream.position += 1
                 
-                if token.type == TokenType.PAREN_OPEN:
+                if token_type == _PAREN_OPEN:
                     paren_level += 1
-                elif token.type == TokenType.PAREN_CLOSE:
+                elif token_type == _PAREN_CLOSE:
                     paren_level -= 1
                 
                 if paren_level > 0:  # Don't include the closing paren
-                    query_tokens.append(token)
+                    query_end = token_stream.position
             
             # Create CTE node
-            query_text = ' '.join([t.value for t in query_tokens])
+            query_text = token_stream.text(query_start, query_end)
             query_node = self._create_query_node_from_text(query_text)
             cte_node = CTENode(cte_name, query_node, recursive)
             with_node.add_cte(cte_node)
@@ -322,7 +286,10 @@ class CTEHandler:
             
             token_stream.advance()  # Consume comma
         
-        return with_node if with_node.ctes else None
+        if not with_node.ctes:
+            return None
+        self._link_cte_dependencies(with_node)
+        return with_node
 
     def _is_valid_cte_name(self, name: str) -> bool:
         """Validate CTE name"""
@@ -347,7 +314,7 @@ class CTEHandler:
             return False
         
         # Skip database names
-        if name.lower().endswith('_db') or name in {'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db', 'momo'}:
+        if name.lower().endswith('_db') or name in self.schemas:
             return False
         
         return True
@@ -356,6 +323,10 @@ class CTEHandler:
         """Get all CTE table names"""
         return self.cte_tables.copy()
 
+    def get_cte_dependencies(self) -> Dict[str, List[str]]:
+        """CTE name -> names of the CTEs its body reads (definition order)"""
+        return {name: list(dependencies) for name, dependencies in self.cte_dependencies.items()}
+
     def get_all_referenced_tables(self) -> Set[str]:
         """Get all tables referenced in CTEs and main query"""
         return self.referenced_tables.copy()
@@ -366,14 +337,17 @@ class CTEHandler:
             "total_ctes": len(self.cte_tables),
             "cte_names": list(self.cte_tables),
             "referenced_tables": list(self.referenced_tables),
-            "definitions": len(self.cte_definitions)
+            "definitions": len(self.cte_definitions),
+            "dependencies": self.get_cte_dependencies()
         }
 
     def reset(self):
         """Reset handler state"""
         self.cte_tables.clear()
         self.cte_definitions.clear()
+        self.cte_dependencies.clear()
         self.referenced_tables.clear()
+        self.main_query_start = None
 
 # Helper function for easy integration
 def parse_cte_from_sql(sql: str) -> Tuple[Optional[WithNode], Set[str], Set[str]]:
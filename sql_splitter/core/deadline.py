@@ -0,0 +1,95 @@
+"""
+Parse Deadline - SQL Parser AST v6.0
+
+⏳ Per-parse time budget (SQLParserAST.parse(sql, timeout=...))
+
+The budget is cooperative: the parser checks it at every phase boundary
+(normalize, tokenize, structure.cte/joins/tables, content.*), before every
+normalization rule pass, and the loops that grow with the statement poll it -
+tokenizing, the comma-FROM to JOIN conversion, the JOIN parser, the table
+reference scan, the WHERE splitter and the table/JOIN output loops - so those
+stop within a few hundred iterations of the budget running out. Everything
+else runs to completion once started: a single regex call (one normalization
+pass over the whole statement, say) cannot be interrupted from Python, and the
+CTE and SELECT-list extraction only see the deadline at the next phase
+boundary. A parse therefore overruns its budget by the longest such
+uninterrupted step, which grows with the statement size.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+
+class ParseTimeoutError(Exception):
+    """⏳ Raised at a checkpoint when a parse has used up its time budget"""
+
+    def __init__(self, budget: float, elapsed: float, phase: Optional[str] = None):
+        self.budget = budget
+        self.elapsed = elapsed
+        self.phase = phase
+        where = f" in phase '{phase}'" if phase else ""
+        super().__init__(f"Parse exceeded its {budget * 1000.0:g} ms budget "
+                         f"({elapsed * 1000.0:.1f} ms elapsed{where})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Budget details for the error result"""
+        return {
+            "budgetMs": round(self.budget * 1000.0, 3),
+            "elapsedMs": round(self.elapsed * 1000.0, 3),
+            "phase": self.phase
+        }
+
+
+class ParseDeadline:
+    """⏳ Time budget of one parse call, checked at phase boundaries and polled in long loops"""
+
+    __slots__ = ('budget', 'started', 'expires', 'phase', '_countdown')
+
+    # poll() reads the clock on every POLL_INTERVAL-th call
+    POLL_INTERVAL = 256
+
+    def __init__(self, seconds: float):
+        """Start the clock
+
+        Args:
+            seconds: Budget in seconds (must be > 0)
+        """
+        if not seconds > 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        self.budget = float(seconds)
+        self.started = time.perf_counter()
+        self.expires = self.started + self.budget
+        self.phase: Optional[str] = None
+        self._countdown = self.POLL_INTERVAL
+
+    def remaining(self) -> float:
+        """Seconds left in the budget (negative once spent)"""
+        return self.expires - time.perf_counter()
+
+    def expired(self) -> bool:
+        """Whether the budget is spent"""
+        return time.perf_counter() >= self.expires
+
+    def check(self, phase: Optional[str] = None):
+        """Raise ParseTimeoutError when the budget is spent
+
+        Args:
+            phase: Name of the phase about to start (reported in the error, and
+                by later poll() calls until the next check)
+        """
+        if phase is not None:
+            self.phase = phase
+        now = time.perf_counter()
+        if now >= self.expires:
+            raise ParseTimeoutError(self.budget, now - self.started, self.phase)
+
+    def poll(self):
+        """Cheap check() for the inner loops of a phase
+
+        Only every POLL_INTERVAL-th call reads the clock; the error names the
+        phase of the last check().
+        """
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self._countdown = self.POLL_INTERVAL
+            self.check()
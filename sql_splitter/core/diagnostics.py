@@ -0,0 +1,83 @@
+"""
+Parse Diagnostics - SQL Parser AST v6.0
+
+🩺 Structured diagnostics collected during a single parse
+
+Replaces the old print() output with data: applied normalization rules,
+validation warnings and per-phase timings. A collector is only created when
+diagnostics are requested, so the disabled path costs nothing.
+
+Phases nest by name ('structure.joins' is part of 'structure'). Besides wall
+time every phase records the net change in allocated memory blocks
+(sys.getallocatedblocks, CPython only; 0 elsewhere).
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List
+
+# Net live allocation counter (CPython); other interpreters report 0
+_allocated_blocks = getattr(sys, 'getallocatedblocks', lambda: 0)
+
+
+class ParseDiagnostics:
+    """🩺 Diagnostics collector for one parse call"""
+
+    def __init__(self):
+        self.applied_rules: List[str] = []
+        self.validation_warnings: List[str] = []
+        self.messages: List[str] = []
+        self.timings: Dict[str, float] = {}
+        self.allocations: Dict[str, int] = {}
+        self.cache_hit = False
+        self._started = time.perf_counter()
+        self._started_blocks = _allocated_blocks()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a parse phase, recording its duration in milliseconds"""
+        # Register on entry so nested phases are listed after their parent
+        self.timings.setdefault(name, 0.0)
+        blocks = _allocated_blocks()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.record_timing(name, time.perf_counter() - start)
+            self.record_allocations(name, _allocated_blocks() - blocks)
+
+    def record_timing(self, name: str, seconds: float):
+        """Record (or accumulate) a phase duration given in seconds"""
+        self.timings[name] = self.timings.get(name, 0.0) + seconds * 1000.0
+
+    def record_allocations(self, name: str, blocks: int):
+        """Record (or accumulate) the net allocated-block delta of a phase"""
+        self.allocations[name] = self.allocations.get(name, 0) + blocks
+
+    def note(self, message: str):
+        """Record a free-form diagnostic message"""
+        self.messages.append(message)
+
+    def finish(self):
+        """Record total wall time since the collector was created"""
+        self.timings['total'] = (time.perf_counter() - self._started) * 1000.0
+        self.allocations['total'] = _allocated_blocks() - self._started_blocks
+
+    def phase_report(self) -> Dict[str, Dict[str, Any]]:
+        """Per-phase {"ms", "allocatedBlocks"} in recording order (result metadata.timings)"""
+        return {
+            name: {"ms": round(value, 3), "allocatedBlocks": self.allocations.get(name, 0)}
+            for name, value in self.timings.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get diagnostics as a JSON-serializable dict"""
+        return {
+            "appliedRules": list(self.applied_rules),
+            "validationWarnings": list(self.validation_warnings),
+            "messages": list(self.messages),
+            "timingsMs": {name: round(value, 3) for name, value in self.timings.items()},
+            "allocatedBlocks": dict(self.allocations),
+            "cacheHit": self.cache_hit
+        }
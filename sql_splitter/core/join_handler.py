@@ -7,433 +7,198 @@ Author: AI Assistant
 Version: 6.0 AST Modular
 Date: 2025-08-26
 Status: ✅ Advanced JOIN parsing for 100% expect.md compliance
+
+JOINs are read by a recursive-descent parser over the token stream: every
+FROM starts a table-reference list, a bracketed group recurses into the same
+rules and a derived table recurses into a full statement, so any nesting
+depth is handled in one pass over the tokens.
 """
 
-import re
 from typing import List, Dict, Any, Optional, Tuple
 from .ast_nodes import JoinNode, TableReferenceNode, ConditionNode, create_table_reference, create_join_condition
-from .sql_tokenizer import TokenStream, Token, TokenType
+from .sql_tokenizer import SQLTokenizer, TokenStream, TokenType, TOKEN_TYPE_CODES, WORD_CODES, word_codes
+from .deadline import ParseDeadline
+
+# Words that may appear in a JOIN operator (the last ones are plain identifiers to the tokenizer)
+_JOIN_KEYWORDS = {'JOIN', 'LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER'}
+_JOIN_MODIFIERS = {'CROSS', 'NATURAL', 'STRAIGHT_JOIN'}
+# Keywords that open a derived table / subquery after '('
+_SUBQUERY_KEYWORDS = {'SELECT', 'WITH'}
+
+# 🔢 Integer codes for the scan loops (see TokenStream.types / TokenStream.codes)
+_JOIN_KEYWORD_CODES = word_codes(*_JOIN_KEYWORDS)
+_JOIN_MODIFIER_CODES = word_codes(*_JOIN_MODIFIERS)
+_SUBQUERY_CODES = word_codes(*_SUBQUERY_KEYWORDS)
+_FROM = WORD_CODES['FROM']
+_KEYWORD = TOKEN_TYPE_CODES[TokenType.KEYWORD]
+_IDENTIFIER = TOKEN_TYPE_CODES[TokenType.IDENTIFIER]
+_COMMA = TOKEN_TYPE_CODES[TokenType.COMMA]
+_PAREN_OPEN = TOKEN_TYPE_CODES[TokenType.PAREN_OPEN]
+_PAREN_CLOSE = TOKEN_TYPE_CODES[TokenType.PAREN_CLOSE]
 
 class JoinHandler:
     """Advanced JOIN parsing with AST support"""
 
-    def __init__(self):
+    # Depth-0 keywords that terminate an ON condition in the token path
+    CONDITION_END_KEYWORDS = {
+        'LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER', 'JOIN', 'WHERE', 'GROUP',
+        'ORDER', 'HAVING', 'LIMIT', 'UNION'
+    }
+    CONDITION_END_CODES = word_codes(*CONDITION_END_KEYWORDS)
+
+    # Bracket groups deeper than this are scanned flat instead of recursed into
+    MAX_NESTING_DEPTH = 64
+
+    def __init__(self, deadline: Optional[ParseDeadline] = None):
         self.table_aliases = {}
         self.detected_joins = []
+        self._nesting = 0
+        # Time budget of the parse call, polled per scanned token and table reference
+        self.deadline = deadline
 
     def parse_joins_from_tokens(self, token_stream: TokenStream) -> List[JoinNode]:
-        """Parse JOINs from token stream"""
+        """Parse JOINs from token stream (one recursive-descent pass)"""
         joins = []
-        
+        self._parse_statement(token_stream, joins)
+        # A stray ')' ends the statement early; keep reading after it
         while token_stream.has_more():
-            if self._is_join_keyword(token_stream.current()):
-                join_node = self._parse_single_join(token_stream)
-                if join_node:
-                    joins.append(join_node)
-                    self.detected_joins.append(join_node)
-            else:
-                token_stream.advance()
-                
-        return joins
-
-    def parse_joins_from_sql(self, sql: str) -> List[JoinNode]:
-        """🚀 ENHANCED: Parse JOINs with robust deduplication logic"""
-        joins = []
+            token_stream.advance()
+            self._parse_statement(token_stream, joins)
         
-        # 🎯 Handle triple-nested brackets: (((...)))
-        triple_joins = self._parse_triple_nested_joins(sql)
-        joins.extend(triple_joins)
-        
-        # 🎯 Handle double-nested brackets: ((...)
-        if not joins:
-            double_joins = self._parse_double_nested_joins(sql)
-            joins.extend(double_joins)
-        
-        # 🎯 Handle single-nested brackets: (...)
-        if not joins:
-            single_joins = self._parse_single_nested_joins(sql)
-            joins.extend(single_joins)
-        
-        # 🎯 Handle standard JOINs (not in brackets) - ONLY if no nested JOINs found
-        if not joins:
-            standard_joins = self._parse_standard_joins(sql)
-            joins.extend(standard_joins)
-        
-        # 🚀 ENHANCED: Remove duplicates based on table+alias combination
+        self.detected_joins.extend(joins)
         return self._deduplicate_joins(joins)
 
-    def _parse_triple_nested_joins(self, sql: str) -> List[JoinNode]:
-        """🎯 Parse triple-nested bracket JOINs: (((...))) - COMPLETELY REWRITTEN"""
-        joins = []
-        
-        # 🔥 COMPLETE REWRITE: Manual character-by-character parsing for mv_item pattern
-        # Target: FROM (((`mt_item` join `mv_order` on(...)) left join `mv_item_status_desc` on(...)) left join `mv_item_type_desc` on(...))
-        
-        # Step 1: Find the FROM clause with triple brackets
-        from_pattern = r'FROM\s+\(\(\('
-        from_match = re.search(from_pattern, sql, re.IGNORECASE)
-        
-        if not from_match:
-            return joins
-        
-        # Step 2: Manual bracket-aware parsing from the FROM position
-        start_pos = from_match.end() - 3  # Start from the first (((
-        bracket_depth = 0
-        complete_content = ""
-        i = start_pos
-        
-        while i < len(sql):
-            char = sql[i]
-            
-            if char == '(':
-                bracket_depth += 1
-            elif char == ')':
-                bracket_depth -= 1
-                
-            complete_content += char
-            
-            # Stop when we've closed all brackets
-            if bracket_depth == 0 and i > start_pos:
-                break
-                
-            i += 1
-        
-        # Step 3: Extract content inside the outermost brackets
-        # Remove the outer ((( and )))
-        if complete_content.startswith('(((') and complete_content.endswith(')))'):
-            inner_content = complete_content[3:-3]
-        else:
-            inner_content = complete_content
-        
-        # Step 4: Manual JOIN extraction from the complete inner content
-        # This should now include ALL JOINs including the outermost ones
-        
-        # 🎯 Direct extraction approach for mv_item pattern
-        joins.extend(self._extract_joins_from_content(inner_content))
-        
-        # 🎯 Additional direct pattern matching for mv_item_type_desc specifically
-        if 'mv_item_type_desc' in sql and len(joins) < 3:
-            # Manually add the missing mv_item_type_desc JOIN
-            type_desc_pattern = r'left\s+join\s+`mv_item_type_desc`'
-            if re.search(type_desc_pattern, sql, re.IGNORECASE):
-                table_ref = create_table_reference('mv_item_type_desc', None)
-                condition = create_join_condition("")
-                join_node = JoinNode('LEFT', table_ref, condition)
-                joins.append(join_node)
-        
-        return joins
+    def parse_joins_from_sql(self, sql: str) -> List[JoinNode]:
+        """🚀 Parse JOINs from SQL text (tokenized once, then parsed as a join tree)"""
+        return self.parse_joins_from_tokens(SQLTokenizer().tokenize_stream(sql))
 
-    def _parse_double_nested_joins(self, sql: str) -> List[JoinNode]:
-        """🎯 Parse double-nested bracket JOINs: ((...))"""
-        joins = []
-        
-        double_pattern = r'FROM\s+\(\(([^)]+)\)\s*([^)]*)\)'
-        matches = re.finditer(double_pattern, sql, re.IGNORECASE | re.DOTALL)
-        
-        for match in matches:
-            inner_content = match.group(1) if match.group(1) else ""
-            outer_content = match.group(2) if len(match.groups()) >= 2 and match.group(2) else ""
-            
-            full_content = f"{inner_content} {outer_content}"
-            bracket_joins = self._extract_joins_from_content(full_content)
-            joins.extend(bracket_joins)
-            
-        return joins
+    # 🌳 Recursive-descent join tree
+    #
+    #   statement        := { FROM table_references | join_clause | token }  (until unmatched ')')
+    #   table_references := table_reference { ',' table_reference }
+    #   table_reference  := table_factor { join_clause }
+    #   join_clause      := join_operator table_factor [ ON condition | USING '(' ... ')' ]
+    #   table_factor     := name [alias] | '(' table_references ')' [alias] | '(' statement ')' [alias]
 
-    def _parse_single_nested_joins(self, sql: str) -> List[JoinNode]:
-        """🎯 Parse single-nested bracket JOINs: (...)"""
-        joins = []
-        
-        single_pattern = r'FROM\s+\(([^)]+)\)'
-        matches = re.finditer(single_pattern, sql, re.IGNORECASE | re.DOTALL)
-        
-        for match in matches:
-            content = match.group(1)
-            bracket_joins = self._extract_joins_from_content(content)
-            joins.extend(bracket_joins)
+    def _parse_statement(self, token_stream: TokenStream, joins: List[JoinNode]):
+        """Scan one (sub)query, parsing every FROM clause; stops before an unmatched ')'"""
+        depth = 0
+        types, codes = token_stream.types, token_stream.codes
+        deadline = self.deadline
+        
+        while token_stream.position < len(types):
+            if deadline is not None:
+                deadline.poll()
+            position = token_stream.position
+            token_type = types[position]
             
-        return joins
+            if token_type == _PAREN_OPEN:
+                depth += 1
+                token_stream.position += 1
+            elif token_type == _PAREN_CLOSE:
+                if depth == 0:
+                    return
+                depth -= 1
+                token_stream.position += 1
+            elif token_type == _KEYWORD and codes[position] == _FROM:
+                token_stream.position += 1
+                self._parse_table_references(token_stream, joins)
+            elif self._is_join_operator_start(token_stream):
+                # JOIN outside a FROM list (e.g. UPDATE a JOIN b, or after an index hint)
+                if not self._parse_join_clause(token_stream, joins):
+                    token_stream.position += 1
+            else:
+                token_stream.position += 1
 
-    def _parse_standard_joins(self, sql: str) -> List[JoinNode]:
-        """🚀 ENHANCED: Parse standard JOINs with duplicate prevention"""
-        joins = []
-        processed_positions = set()  # Track processed positions to avoid duplicates
-        
-        # Order matters: Check specific JOIN types first, generic 'JOIN' last
-        join_types = ['LEFT JOIN', 'RIGHT JOIN', 'INNER JOIN', 'FULL JOIN', 'OUTER JOIN', 'JOIN']
-        
-        for join_type in join_types:
-            for match in re.finditer(rf'\b{join_type}\b', sql, re.IGNORECASE):
-                position = match.start()
-                
-                # Skip if already processed or inside brackets
-                if position in processed_positions or self._is_inside_brackets(sql, position):
-                    continue
-                
-                # FIXED: Skip generic 'JOIN' if it's part of a specific join type (e.g., LEFT JOIN)
-                if join_type == 'JOIN':
-                    # Check if this JOIN is part of a compound join type
-                    pre_context = sql[max(0, position-10):position].strip()
-                    if any(prefix in pre_context.upper() for prefix in ['LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER']):
-                        continue
-                
-                join_node = self._parse_join_at_position(sql, position, join_type)
-                if join_node:
-                    joins.append(join_node)
-                    processed_positions.add(position)
-                    
-                    # Mark a wider range as processed to avoid overlaps
-                    for i in range(max(0, position-10), min(len(sql), position+20)):
-                        processed_positions.add(i)
-        
-        return joins
-    
-    def _deduplicate_joins(self, joins: List[JoinNode]) -> List[JoinNode]:
-        """🚀 FIXED: Remove duplicate JOINs based on table+alias combination"""
-        if not joins:
-            return joins
+    def _parse_table_references(self, token_stream: TokenStream, joins: List[JoinNode]) -> Optional[Tuple[str, Optional[str]]]:
+        """Parse a comma-separated FROM list; returns the leading (table, alias)"""
+        lead = self._parse_table_reference(token_stream, joins)
         
-        seen_joins = set()
-        unique_joins = []
+        while token_stream.has_more() and token_stream.types[token_stream.position] == _COMMA:
+            token_stream.position += 1
+            self._parse_table_reference(token_stream, joins)
         
-        for join in joins:
-            # 🔧 FIXED: Use correct attribute name 'table_reference' not 'table_ref'
-            table_name = join.table_reference.table_name if join.table_reference else ""
-            alias = join.table_reference.alias if join.table_reference and join.table_reference.alias else ""
-            join_type = join.join_type if join.join_type else ""
-            
-            # Create unique key
-            unique_key = f"{table_name}|{alias}|{join_type}"
-            
-            if unique_key not in seen_joins:
-                seen_joins.add(unique_key)
-                unique_joins.append(join)
-        
-        return unique_joins
+        return lead
 
-    def _extract_joins_from_content(self, content: str) -> List[JoinNode]:
-        """🎯 Extract all JOINs from bracket content - Fixed ON/alias confusion"""
-        joins = []
-        
-        # 🔥 FIXED: Comprehensive JOIN extraction without ON/alias confusion
-        # Target pattern: `mt_item` join `mv_order` on(...)) left join `mv_item_status_desc` on(...)) left join `mv_item_type_desc` on(...)
-        
-        # 🎯 Enhanced approach: Find all JOIN...ON pairs explicitly
-        
-        # Step 1: Clean and normalize content
-        normalized_content = content.replace(')', ' ').replace('(', ' ')
-        normalized_content = re.sub(r'\s+', ' ', normalized_content).strip()
-        
-        # Step 2: Use comprehensive patterns to find all JOINs
-        # 🎯 USER'S EXCELLENT SUGGESTION: Apply dot-split approach to JOIN extraction patterns!
-        
-        found_tables = set()  # Initialize to track duplicates
-        
-        # First handle database-prefixed patterns and apply dot-split logic
-        db_prefixed_patterns = [
-            # Pattern 1: Database-prefixed JOIN with ON conditions (momo.table_name)
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\s+on\s*\(([^)]+)\)',
-            
-            # Pattern 2: Database-prefixed JOIN with simpler ON conditions
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\s+on\s+([^)]+)',
-            
-            # Pattern 3: Simple JOIN with database-prefixed table (fallback)
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)',
-        ]
-        
-        # Process database-prefixed patterns with dot-split logic
-        for pattern in db_prefixed_patterns:
-            matches = list(re.finditer(pattern, normalized_content, re.IGNORECASE))
-            
-            for match in matches:
-                join_type_raw = match.group(1).strip().upper()
-                join_type = join_type_raw.replace(' JOIN', '').replace('JOIN', '').strip()
-                if not join_type:
-                    join_type = 'INNER'
-                
-                db_name = match.group(2)  # Database name (e.g., "momo")
-                table_name = match.group(3)  # Actual table name (e.g., "mv_order")
-                
-                # Get ON condition if available
-                condition_text = ""
-                if len(match.groups()) >= 4 and match.group(4):
-                    condition_text = match.group(4).strip()
-                    # Apply dot-split to condition text too
-                    condition_text = re.sub(
-                        r'\b(momo|main_db|analytics_db|test_db|prod_db|dev_db)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)',
-                        r'\2.\3',  # Keep only table.field, remove database
-                        condition_text,
-                        flags=re.IGNORECASE
-                    )
-                
-                # Only add the actual table name, not the database prefix
-                if (table_name not in found_tables and 
-                    self._is_valid_table_name(table_name) and
-                    db_name in ['momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db']):
-                    
-                    found_tables.add(table_name)
-                    
-                    # Create table reference (no alias for mv_item pattern)
-                    table_ref = create_table_reference(table_name, None)
-                    
-                    # Create condition
-                    condition = create_join_condition(condition_text)
-                    
-                    # Create JOIN node
-                    join_node = JoinNode(join_type, table_ref, condition)
-                    joins.append(join_node)
-        
-        # Then handle standard patterns (no database prefix)
-        join_patterns = [
-            # Pattern 3: Standard JOIN with ON conditions (no database prefix)
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+([a-zA-Z_][a-zA-Z0-9_]+)\s+on\s*\(([^)]+)\)',
-            
-            # Pattern 4: Standard JOIN with simpler ON conditions
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+([a-zA-Z_][a-zA-Z0-9_]+)\s+on\s+([^)]+)',
-            
-            # Pattern 6: Simple JOIN with table only (fallback)
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+([a-zA-Z_][a-zA-Z0-9_]+)',
-            
-            # Pattern 7: Legacy backtick support
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+`([a-zA-Z_][a-zA-Z0-9_]+)`\s+on\s+([^)]+)',
-            
-            # Pattern 8: Legacy backtick fallback
-            r'((?:left\s+|right\s+|inner\s+|full\s+|outer\s+)?join)\s+`([a-zA-Z_][a-zA-Z0-9_]+)`'
-        ]
-        
-        found_tables = set()  # Track to avoid duplicates
-        
-        for pattern in join_patterns:
-            matches = list(re.finditer(pattern, normalized_content, re.IGNORECASE))
-            
-            for match in matches:
-                join_type_raw = match.group(1).strip().upper()
-                join_type = join_type_raw.replace(' JOIN', '').replace('JOIN', '').strip()
-                if not join_type:
-                    join_type = 'INNER'
-                
-                table_name = match.group(2)
-                
-                # Get ON condition if available
-                condition_text = ""
-                if len(match.groups()) >= 3 and match.group(3):
-                    condition_text = match.group(3).strip()
-                    
-                    # 🎯 USER'S EXCELLENT SUGGESTION: Apply dot-split to JOIN condition text too!
-                    # Remove database prefixes from condition text using dot-split logic
-                    condition_text = re.sub(
-                        r'\b(momo|main_db|analytics_db|test_db|prod_db|dev_db)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)',
-                        r'\2.\3',  # Keep only table.field, remove database
-                        condition_text,
-                        flags=re.IGNORECASE
-                    )
-                    
-                    # Handle database-only prefixes (e.g., momo.field -> field)
-                    condition_text = re.sub(
-                        r'\b(momo|main_db|analytics_db|test_db|prod_db|dev_db)\.([a-zA-Z_][a-zA-Z0-9_]+)\b',
-                        r'\2',  # Keep only field, remove database
-                        condition_text,
-                        flags=re.IGNORECASE
-                    )
-                
-                # Avoid duplicates and validate table name
-                if (table_name not in found_tables and 
-                    self._is_valid_table_name(table_name)):
-                    
-                    found_tables.add(table_name)
-                    
-                    # Create table reference (no alias for mv_item pattern)
-                    table_ref = create_table_reference(table_name, None)
-                    
-                    # Create condition (now with cleaned database prefixes)
-                    condition = create_join_condition(condition_text)
-                    
-                    # Create JOIN node
-                    join_node = JoinNode(join_type, table_ref, condition)
-                    joins.append(join_node)
-        
-        # 🎯 Special handling for mv_item pattern - manual extraction if needed
-        if len(joins) < 3 and 'mv_item' in content.lower():
-            # Manually extract the three expected JOINs for mv_item pattern
-            expected_tables = ['mv_order', 'mv_item_status_desc', 'mv_item_type_desc']
-            
-            for table in expected_tables:
-                if table not in found_tables:
-                    # Look for this specific table in the content
-                    if f'`{table}`' in content:
-                        # Determine JOIN type based on position
-                        join_type = 'INNER' if table == 'mv_order' else 'LEFT'
-                        
-                        table_ref = create_table_reference(table, None)
-                        condition = create_join_condition("")
-                        join_node = JoinNode(join_type, table_ref, condition)
-                        joins.append(join_node)
-                        found_tables.add(table)
+    def _parse_table_reference(self, token_stream: TokenStream, joins: List[JoinNode]) -> Optional[Tuple[str, Optional[str]]]:
+        """Parse a table factor followed by its chain of JOIN clauses"""
+        if self.deadline is not None:
+            self.deadline.poll()
+        lead = self._parse_table_factor(token_stream, joins)
+        
+        while token_stream.has_more() and self._is_join_operator_start(token_stream):
+            if self.deadline is not None:
+                self.deadline.poll()
+            if not self._parse_join_clause(token_stream, joins):
+                break
         
-        return joins
+        return lead
 
-    def _parse_join_at_position(self, sql: str, position: int, join_type: str) -> Optional[JoinNode]:
-        """🎯 Parse JOIN at specific position in SQL"""
-        # Find the end of this JOIN clause
-        end_pos = self._find_join_end_position(sql, position)
-        join_text = sql[position:end_pos].strip()
-        
-        # Extract table and alias - Support both backtick and backtick-free SQL
-        # FIXED: Enhanced pattern to properly separate table and alias from ON clause
-        table_pattern = rf'{re.escape(join_type)}\s+`?([a-zA-Z_][a-zA-Z0-9_.]*)`?(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?\s+(?=ON\b)'
-        table_match = re.search(table_pattern, join_text, re.IGNORECASE)
-        
-        # Fallback pattern for JOINs without explicit ON clause or with different structure
-        if not table_match:
-            fallback_pattern = rf'{re.escape(join_type)}\s+`?([a-zA-Z_][a-zA-Z0-9_.]*)`?(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?'
-            table_match = re.search(fallback_pattern, join_text, re.IGNORECASE)
-        
-        if not table_match:
-            return None
-        
-        table_name = table_match.group(1)
-        alias = table_match.group(2) if len(table_match.groups()) >= 2 and table_match.group(2) else None
-        
-        if not self._is_valid_table_name(table_name):
+    def _parse_table_factor(self, token_stream: TokenStream, joins: List[JoinNode]) -> Optional[Tuple[str, Optional[str]]]:
+        """Parse a table name, a bracketed join group or a derived table
+
+        Returns (table_name, alias) for the table the factor starts with, or None
+        for derived tables and anything that is not a table.
+        """
+        if not token_stream.has_more():
             return None
         
-        # Store alias mapping
-        if alias:
-            self.table_aliases[alias] = table_name
-        
-        # Extract ON condition
-        on_pattern = r'\bON\s+(.+?)(?=\s*$)'
-        on_match = re.search(on_pattern, join_text, re.IGNORECASE | re.DOTALL)
-        
-        if not on_match:
+        if token_stream.types[token_stream.position] == _PAREN_OPEN:
+            if self._nesting >= self.MAX_NESTING_DEPTH:
+                # Leave the group to the (iterative) statement scan
+                return None
+            
+            token_stream.position += 1
+            inner = token_stream.position
+            self._nesting += 1
+            try:
+                if (inner < len(token_stream.types) and token_stream.types[inner] == _KEYWORD and
+                        token_stream.codes[inner] in _SUBQUERY_CODES):
+                    # Derived table: a full statement of its own
+                    self._parse_statement(token_stream, joins)
+                    lead = None
+                else:
+                    lead = self._parse_table_references(token_stream, joins)
+            finally:
+                self._nesting -= 1
+            
+            token_stream.consume(')', TokenType.PAREN_CLOSE)
+            alias = token_stream.consume_alias()
+            if lead and alias:
+                lead = (lead[0], alias)
+            return lead
+        
+        name_parts = token_stream.consume_qualified_name()
+        if not name_parts:
             return None
         
-        condition_text = on_match.group(1).strip()
-        
-        # Create nodes
-        table_ref = create_table_reference(table_name, alias)
-        condition = create_join_condition(condition_text)
-        
-        # Clean join type
-        clean_join_type = join_type.replace(' JOIN', '').strip() or 'INNER'
-        
-        return JoinNode(clean_join_type, table_ref, condition)
+        # `db`.`table` keeps only the table part
+        alias = token_stream.consume_alias()
+        return name_parts[-1], alias
 
-    def _is_join_keyword(self, token: Token) -> bool:
-        """Check if token is a JOIN keyword"""
-        if not token or token.type != TokenType.KEYWORD:
-            return False
-        return token.value.upper() in ['JOIN', 'LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER']
+    def _is_join_operator_start(self, token_stream: TokenStream) -> bool:
+        """Check if the current token can start a JOIN operator"""
+        position = token_stream.position
+        token_type = token_stream.types[position]
+        if token_type == _KEYWORD:
+            return token_stream.codes[position] in _JOIN_KEYWORD_CODES
+        return token_type == _IDENTIFIER and token_stream.codes[position] in _JOIN_MODIFIER_CODES
+
+    def _parse_join_clause(self, token_stream: TokenStream, joins: List[JoinNode]) -> bool:
+        """Parse one JOIN operator, its right-hand factor and its condition
 
-    def _parse_single_join(self, token_stream: TokenStream) -> Optional[JoinNode]:
-        """Parse single JOIN from token stream"""
-        # Consume JOIN keywords
+        Returns False (without consuming anything) when the words at the cursor
+        are not a JOIN operator, e.g. the LEFT(...) string function.
+        """
+        start = token_stream.position
         join_parts = []
-        while (token_stream.current() and 
-               token_stream.current().type == TokenType.KEYWORD and
-               token_stream.current().value.upper() in ['LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER', 'JOIN']):
+        while token_stream.has_more() and self._is_join_operator_start(token_stream):
             join_parts.append(token_stream.advance().value.upper())
         
+        if 'JOIN' not in join_parts and 'STRAIGHT_JOIN' not in join_parts:
+            token_stream.position = start
+            return False
+        
         # Determine join type
         if 'LEFT' in join_parts:
             join_type = 'LEFT'
@@ -441,88 +206,119 @@ class JoinHandler:
             join_type = 'RIGHT'
         elif 'FULL' in join_parts:
             join_type = 'FULL'
-        elif 'INNER' in join_parts:
-            join_type = 'INNER'
         else:
-            join_type = 'INNER'  # Default
+            join_type = 'INNER'  # INNER, CROSS, STRAIGHT_JOIN and plain JOIN
         
-        # Get table name
-        table_token = token_stream.current()
-        if not table_token or table_token.type != TokenType.QUOTED_IDENTIFIER:
-            return None
+        factor = self._parse_table_factor(token_stream, joins)
+        
+        # Consume ON condition / USING column list (JOINs without either keep an empty condition)
+        condition_text = ""
+        if token_stream.consume('ON', TokenType.KEYWORD):
+            condition_text = self._consume_condition(token_stream, joins)
+        elif (token_stream.match('USING') and token_stream.position + 1 < len(token_stream.types) and
+              token_stream.types[token_stream.position + 1] == _PAREN_OPEN):
+            condition_start = token_stream.position
+            token_stream.position += 2
+            self._skip_group(token_stream)
+            condition_text = token_stream.text(condition_start, token_stream.position)
         
-        table_name = table_token.value.strip('`')
-        token_stream.advance()
+        if not factor:
+            return True
         
-        # Check for alias
-        alias = None
-        if (token_stream.current() and 
-            token_stream.current().type == TokenType.QUOTED_IDENTIFIER):
-            alias = token_stream.advance().value.strip('`')
+        table_name, alias = factor
+        if not self._is_valid_table_name(table_name):
+            return True
         
         # Store alias mapping
         if alias:
             self.table_aliases[alias] = table_name
         
-        # Consume ON keyword
-        on_token = token_stream.consume('ON', TokenType.KEYWORD)
-        if not on_token:
-            return None
-        
-        # Parse condition (simplified for now)
-        condition_tokens = []
+        table_ref = create_table_reference(table_name, alias)
+        condition = create_join_condition(condition_text)
+        joins.append(JoinNode(join_type, table_ref, condition))
+        return True
+
+    def _consume_condition(self, token_stream: TokenStream, joins: List[JoinNode]) -> str:
+        """Consume an ON condition and return its source text
+
+        Ends at a depth-0 clause/JOIN keyword or comma, or at the ')' closing the
+        enclosing group. Subqueries inside the condition are parsed for JOINs too.
+        """
+        condition_start = token_stream.position
+        types, codes = token_stream.types, token_stream.codes
+        end_codes = self.CONDITION_END_CODES
+        position = condition_start
         paren_level = 0
         
-        while token_stream.has_more():
-            token = token_stream.current()
+        while position < len(types):
+            token_type = types[position]
             
-            if token.type == TokenType.PAREN_OPEN:
+            if token_type == _PAREN_OPEN:
                 paren_level += 1
-            elif token.type == TokenType.PAREN_CLOSE:
+                position += 1
+                if (position < len(types) and types[position] == _KEYWORD and
+                        codes[position] in _SUBQUERY_CODES and
+                        self._nesting < self.MAX_NESTING_DEPTH):
+                    token_stream.position = position
+                    self._nesting += 1
+                    try:
+                        self._parse_statement(token_stream, joins)
+                    finally:
+                        self._nesting -= 1
+                    position = token_stream.position
+                continue
+            elif token_type == _PAREN_CLOSE:
                 paren_level -= 1
                 if paren_level < 0:
                     break
-            elif token.type == TokenType.KEYWORD and token.value.upper() in ['LEFT', 'RIGHT', 'INNER', 'JOIN', 'WHERE', 'GROUP', 'ORDER']:
-                if paren_level == 0:
-                    break
+            elif paren_level == 0 and (
+                    (token_type == _KEYWORD and codes[position] in end_codes) or
+                    token_type == _COMMA or
+                    (token_type == _IDENTIFIER and codes[position] in _JOIN_MODIFIER_CODES)):
+                break
             
-            condition_tokens.append(token_stream.advance())
+            position += 1
         
-        # Build condition text
-        condition_text = ' '.join([t.value for t in condition_tokens])
-        
-        # Create nodes
-        table_ref = create_table_reference(table_name, alias)
-        condition = create_join_condition(condition_text)
-        
-        return JoinNode(join_type, table_ref, condition)
+        token_stream.position = position
+        # Build condition text from the original source slice
+        return token_stream.text(condition_start, token_stream.position)
 
-    def _is_inside_brackets(self, sql: str, position: int) -> bool:
-        """🎯 Check if position is inside any FROM brackets"""
-        bracket_patterns = [
-            r'FROM\s+\([^)]+\)',
-            r'FROM\s+\(\([^)]+\)\s*[^)]*\)',
-            r'FROM\s+\(\(\([^)]+\)\s*[^)]*\)\s*[^)]*\)'
-        ]
-        
-        for pattern in bracket_patterns:
-            for match in re.finditer(pattern, sql, re.IGNORECASE | re.DOTALL):
-                if match.start() <= position <= match.end():
-                    return True
-        
-        return False
+    def _skip_group(self, token_stream: TokenStream):
+        """Advance past the ')' that closes an already-opened group"""
+        paren_level = 1
+        types = token_stream.types
+        while token_stream.position < len(types):
+            token_type = types[token_stream.position]
+            token_stream.position += 1
+            if token_type == _PAREN_OPEN:
+                paren_level += 1
+            elif token_type == _PAREN_CLOSE:
+                paren_level -= 1
+                if paren_level == 0:
+                    return
 
-    def _find_join_end_position(self, sql: str, start_pos: int) -> int:
-        """Find end position of JOIN clause"""
-        end_keywords = ['LEFT JOIN', 'RIGHT JOIN', 'INNER JOIN', 'JOIN', 'WHERE', 'GROUP BY', 'ORDER BY', 'HAVING', 'LIMIT']
-        end_pos = len(sql)
+    def _deduplicate_joins(self, joins: List[JoinNode]) -> List[JoinNode]:
+        """🚀 FIXED: Remove duplicate JOINs based on table+alias combination"""
+        if not joins:
+            return joins
         
-        for keyword in end_keywords:
-            next_match = re.search(rf'\b{keyword}\b', sql[start_pos + 10:], re.IGNORECASE)
-            if next_match:
-                end_pos = min(end_pos, start_pos + 10 + next_match.start())
+        seen_joins = set()
+        unique_joins = []
         
-        return end_pos
+        for join in joins:
+            # 🔧 FIXED: Use correct attribute name 'table_reference' not 'table_ref'
+            table_name = join.table_reference.table_name if join.table_reference else ""
+            alias = join.table_reference.alias if join.table_reference and join.table_reference.alias else ""
+            join_type = join.join_type if join.join_type else ""
+            
+            # Create unique key
+            unique_key = f"{table_name}|{alias}|{join_type}"
+            
+            if unique_key not in seen_joins:
+                seen_joins.add(unique_key)
+                unique_joins.append(join)
+        
+        return unique_joins
 
     def _is_valid_table_name(self, name: str) -> bool:
         """Validate table name"""
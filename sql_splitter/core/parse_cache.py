@@ -0,0 +1,118 @@
+"""
+Parse Cache - SQL Parser AST v6.0
+
+🗄️ Size-bounded LRU cache for parse results
+
+Entries are stored as serialized JSON, which gives every hit a fresh
+defensive copy and an exact byte size for the memory limit.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class ParseCache:
+    """🗄️ Thread-safe LRU cache of parse results bounded by entries and bytes"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None):
+        """Initialize cache
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Optional upper bound on the total serialized size of all entries
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (serialized result, byte size)
+        self._lock = threading.Lock()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key by hashing the given parts (SQL text, config tags)"""
+        digest = hashlib.sha1()
+        for part in parts:
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a private copy of the cached result, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(entry[0])
+
+    def put(self, key: str, result: Dict[str, Any]) -> bool:
+        """Store a result, evicting least recently used entries to stay in bounds
+
+        Returns False when the result cannot be cached (not serializable or
+        larger than max_bytes on its own).
+        """
+        try:
+            payload = json.dumps(result, ensure_ascii=False, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return False
+
+        size = len(payload.encode('utf-8'))
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[1]
+
+            self._entries[key] = (payload, size)
+            self._current_bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and self._current_bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= evicted[1]
+                self.evictions += 1
+
+        return True
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
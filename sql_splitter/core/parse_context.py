@@ -0,0 +1,79 @@
+"""
+Parse Context - SQL Parser AST v6.0
+
+🧵 Per-call state of one SQLParserAST.parse() call
+
+Everything a parse writes (table aliases, extracted tables and joins, the
+normalized SQL, the deadline and diagnostics collector) lives here instead of
+on the parser, and every call gets its own component handlers. A single
+SQLParserAST can therefore be shared by many threads: the parser itself only
+holds configuration, the normalizer rules and the (locked) result cache.
+"""
+
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Set
+
+from .ast_nodes import JoinNode
+from .sql_tokenizer import SQLTokenizer
+from .join_handler import JoinHandler
+from .cte_handler import CTEHandler
+from .table_extractor import TableExtractor
+from .content_extractor import ContentExtractor
+from .diagnostics import ParseDiagnostics
+from .deadline import ParseDeadline
+from .schema_registry import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY
+
+# Shared no-op context used for phase timing when diagnostics are disabled
+_NO_DIAGNOSTICS = nullcontext()
+
+
+class ParseContext:
+    """🧵 Mutable state of a single parse call (never shared between calls)"""
+
+    __slots__ = ('sql', 'normalized_sql', 'sql_tokens', 'diagnostics', 'deadline',
+                 'table_aliases', 'database_name', 'detected_databases',
+                 'extracted_tables', 'extracted_joins',
+                 'tokenizer', 'join_handler', 'cte_handler', 'table_extractor', 'content_extractor')
+
+    def __init__(self, sql: str, diagnostics: Optional[ParseDiagnostics] = None,
+                 deadline: Optional[ParseDeadline] = None,
+                 schemas: SchemaRegistry = DEFAULT_SCHEMA_REGISTRY):
+        """Start the state of one parse
+
+        Args:
+            sql: Original SQL as passed to parse()
+            diagnostics: Collector of this call, or None when diagnostics are off
+            deadline: Time budget of this call, or None for unlimited
+            schemas: Database names of the parser, shared by all handlers
+        """
+        self.sql = sql
+        self.normalized_sql = ""
+        # Token stream of the normalized SQL, once a string-mode phase has tokenized it
+        self.sql_tokens = None
+        self.diagnostics = diagnostics
+        self.deadline = deadline
+
+        self.table_aliases: Dict[str, str] = {}
+        self.database_name = ""
+        self.detected_databases: Set[str] = set()
+        self.extracted_tables: List[str] = []
+        self.extracted_joins: List[JoinNode] = []
+
+        # Handlers keep scratch state while they run, so each call owns a set
+        # (the long token loops poll the deadline between phase boundaries)
+        self.tokenizer = SQLTokenizer(deadline)
+        self.join_handler = JoinHandler(deadline)
+        self.cte_handler = CTEHandler(schemas)
+        self.table_extractor = TableExtractor(schemas, deadline)
+        self.content_extractor = ContentExtractor(schemas, deadline)
+
+    def phase(self, name: str):
+        """Phase timer of the collector, or the shared no-op context without one
+
+        Phase boundaries double as timeout checkpoints: a spent deadline raises
+        ParseTimeoutError before the phase starts (the long loops inside a
+        phase poll it too, see deadline.py).
+        """
+        if self.deadline is not None:
+            self.deadline.check(name)
+        return self.diagnostics.phase(name) if self.diagnostics is not None else _NO_DIAGNOSTICS
@@ -0,0 +1,316 @@
+"""
+Persistent Parse Cache - SQL Parser AST v6.0
+
+💾 SQLite-backed parse result cache that survives restarts
+
+Results are keyed like ParseCache (hash of parser namespace + SQL text), so a
+view whose text is unchanged is served from disk and only edited views are
+parsed again. A new parser version or option set uses a new namespace and
+never sees older entries.
+
+- every put is one SQLite transaction, so a crash never leaves a torn entry
+- max_bytes / max_entries evict least recently used entries
+- warm_load() reads the hottest entries into memory in one query, so a
+  startup that reparses thousands of views does not hit disk per statement
+- disk errors degrade to cache misses; parse() never fails because of the cache
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+from .parse_cache import ParseCache
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parse_cache_accessed ON parse_cache (accessed);
+CREATE INDEX IF NOT EXISTS parse_cache_namespace ON parse_cache (namespace);
+CREATE TABLE IF NOT EXISTS parse_cache_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO parse_cache_totals (id, entries, bytes)
+    SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM parse_cache;
+CREATE TRIGGER IF NOT EXISTS parse_cache_totals_insert AFTER INSERT ON parse_cache BEGIN
+    UPDATE parse_cache_totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS parse_cache_totals_update AFTER UPDATE OF size ON parse_cache BEGIN
+    UPDATE parse_cache_totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS parse_cache_totals_delete AFTER DELETE ON parse_cache BEGIN
+    UPDATE parse_cache_totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0;
+END;
+"""
+
+# Entry count and byte total kept by the triggers above, so bounds checks
+# do not scan the table on every put
+_TOTALS = "SELECT entries, bytes FROM parse_cache_totals WHERE id = 0"
+
+
+class PersistentParseCache:
+    """💾 Thread-safe on-disk LRU cache of parse results (same interface as ParseCache)"""
+
+    # Access times of hits are written back in batches of this size
+    TOUCH_BATCH = 256
+
+    make_key = staticmethod(ParseCache.make_key)
+
+    def __init__(self, path: str, namespace: str = "", max_bytes: Optional[int] = None,
+                 max_entries: Optional[int] = None, timeout: float = 30.0):
+        """Open (or create) the cache database
+
+        Args:
+            path: SQLite file; several processes may share it
+            namespace: Tag stored with every entry (the parser passes its version
+                and result-affecting options); warm_load() and purge_stale() use it
+            max_bytes: Optional upper bound on the total serialized size of all entries
+            max_entries: Optional upper bound on the number of entries
+            timeout: Seconds to wait for another process holding the write lock
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = path
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # One transaction, so the totals row and its triggers appear together
+        self._conn.executescript("BEGIN IMMEDIATE;" + _SCHEMA + "COMMIT;")
+
+        self._lock = threading.Lock()
+        self._warm: Dict[str, str] = {}      # key -> payload preloaded by warm_load()
+        self._touched: Dict[str, float] = {}  # key -> access time not yet written
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a private copy of the cached result, or None on a miss"""
+        with self._lock:
+            payload = self._warm.get(key)
+            if payload is None:
+                try:
+                    row = self._conn.execute("SELECT payload FROM parse_cache WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error as e:
+                    self._failed("read", e)
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                payload = row[0]
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._flush_touches()
+        return json.loads(payload)
+
+    def put(self, key: str, result: Dict[str, Any]) -> bool:
+        """Store a result atomically, evicting least recently used entries to stay in bounds
+
+        Returns False when the result cannot be cached (not serializable, larger
+        than max_bytes on its own, or the write failed).
+        """
+        try:
+            payload = json.dumps(result, ensure_ascii=False, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return False
+
+        size = len(payload.encode('utf-8'))
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        with self._lock:
+            try:
+                with self._transaction():
+                    # An upsert (not INSERT OR REPLACE) so the totals triggers see the old size
+                    self._conn.execute(
+                        "INSERT INTO parse_cache (key, namespace, payload, size, accessed) "
+                        "VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                        "namespace = excluded.namespace, payload = excluded.payload, "
+                        "size = excluded.size, accessed = excluded.accessed",
+                        (key, self.namespace, payload, size, time.time()))
+                    self._touched.pop(key, None)
+                    self._evict()
+            except sqlite3.Error as e:
+                self._failed("write", e)
+                return False
+            if key in self._warm:
+                self._warm[key] = payload
+        return True
+
+    def warm_load(self, max_bytes: Optional[int] = None) -> int:
+        """💾 Preload this namespace's entries into memory, most recently used first
+
+        Args:
+            max_bytes: Stop once this many payload bytes are loaded (default: all)
+
+        Returns:
+            Number of entries loaded
+        """
+        loaded_bytes = 0
+        with self._lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT key, payload, size FROM parse_cache WHERE namespace = ? ORDER BY accessed DESC",
+                    (self.namespace,))
+                for key, payload, size in rows:
+                    if max_bytes is not None and loaded_bytes + size > max_bytes:
+                        break
+                    self._warm[key] = payload
+                    loaded_bytes += size
+            except sqlite3.Error as e:
+                self._failed("warm load", e)
+            return len(self._warm)
+
+    def purge_stale(self) -> int:
+        """Delete entries written under any other namespace (e.g. older parser versions)"""
+        with self._lock:
+            try:
+                with self._transaction():
+                    cursor = self._conn.execute("DELETE FROM parse_cache WHERE namespace != ?", (self.namespace,))
+                return cursor.rowcount
+            except sqlite3.Error as e:
+                self._failed("purge", e)
+                return 0
+
+    def clear(self):
+        """Drop all entries (every namespace) and reset counters"""
+        with self._lock:
+            with self._transaction():
+                self._conn.execute("DELETE FROM parse_cache")
+            self._warm.clear()
+            self._touched.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.errors = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            self._flush_touches()
+            entries, total_bytes = self._conn.execute(_TOTALS).fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "entries": entries,
+                "bytes": total_bytes,
+                "warm": len(self._warm),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "path": self.path
+            }
+
+    def close(self):
+        """Write pending access times and close the database"""
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+    def __enter__(self) -> 'PersistentParseCache':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(_TOTALS).fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._warm:
+                return True
+            return self._conn.execute("SELECT 1 FROM parse_cache WHERE key = ?", (key,)).fetchone() is not None
+
+    # 🔧 Internals (called with self._lock held)
+
+    def _transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT (ROLLBACK on error) on the autocommit connection"""
+        return _Transaction(self._conn)
+
+    def _evict(self):
+        """Delete least recently used entries until both limits hold"""
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        entries, total_bytes = self._conn.execute(_TOTALS).fetchone()
+        if ((self.max_entries is None or entries <= self.max_entries) and
+                (self.max_bytes is None or total_bytes <= self.max_bytes)):
+            return
+
+        self._write_touches()
+        victims: List[str] = []
+        for key, size in self._conn.execute("SELECT key, size FROM parse_cache ORDER BY accessed ASC"):
+            if ((self.max_entries is None or entries <= self.max_entries) and
+                    (self.max_bytes is None or total_bytes <= self.max_bytes)):
+                break
+            victims.append(key)
+            entries -= 1
+            total_bytes -= size
+        self._conn.executemany("DELETE FROM parse_cache WHERE key = ?", [(key,) for key in victims])
+        for key in victims:
+            self._warm.pop(key, None)
+        self.evictions += len(victims)
+
+    def _flush_touches(self):
+        """Write batched access times in their own transaction"""
+        if not self._touched:
+            return
+        try:
+            with self._transaction():
+                self._write_touches()
+        except sqlite3.Error as e:
+            self._failed("touch", e)
+            self._touched.clear()
+
+    def _write_touches(self):
+        if self._touched:
+            self._conn.executemany("UPDATE parse_cache SET accessed = ? WHERE key = ?",
+                                   [(accessed, key) for key, accessed in self._touched.items()])
+            self._touched.clear()
+
+    def _failed(self, operation: str, error: Exception):
+        self.errors += 1
+        logger.warning("Persistent parse cache %s failed (%s): %s", operation, self.path, error)
+
+
+class _Transaction:
+    """Context manager for an immediate (write-locked) SQLite transaction"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self._conn.execute("COMMIT")
+        else:
+            self._conn.execute("ROLLBACK")
+        return False
@@ -0,0 +1,171 @@
+"""
+Parse Profiler - SQL Parser AST v6.0
+
+⏱️ Per-phase timing histograms aggregated across many parse calls
+
+Pass a ParseProfiler to SQLParserAST (profiler=...) and every parse feeds its
+phase timings and allocation counts into fixed log-scale histograms. The
+slowest statements are kept with their timing breakdown, which answers
+"why does this one view take 800 ms" without running cProfile by hand.
+"""
+
+import heapq
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional, Tuple
+
+# Histogram bucket upper bounds in milliseconds (the last bucket is open-ended)
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0
+)
+
+# Characters of SQL kept with each slow-statement record
+_SQL_PREVIEW_CHARS = 200
+
+
+class PhaseHistogram:
+    """📊 Timing histogram and allocation totals for one phase"""
+
+    __slots__ = ('bounds', 'counts', 'count', 'total_ms', 'min_ms', 'max_ms', 'allocated_blocks')
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = float('inf')
+        self.max_ms = 0.0
+        self.allocated_blocks = 0
+
+    def add(self, ms: float, blocks: int = 0):
+        """Record one observation"""
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+        self.allocated_blocks += blocks
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of observations
+
+        Accurate to one bucket; the open-ended last bucket reports the maximum.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(fraction * self.count + 0.5))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return min(self.bounds[index], self.max_ms) if index < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics and non-empty buckets keyed by '<=bound' labels"""
+        buckets = {}
+        for index, bucket in enumerate(self.counts):
+            if bucket:
+                label = f"<={self.bounds[index]:g}ms" if index < len(self.bounds) else f">{self.bounds[-1]:g}ms"
+                buckets[label] = bucket
+        return {
+            "count": self.count,
+            "totalMs": round(self.total_ms, 3),
+            "meanMs": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "minMs": round(self.min_ms, 3) if self.count else 0.0,
+            "maxMs": round(self.max_ms, 3),
+            "p50Ms": round(self.percentile(0.50), 3),
+            "p90Ms": round(self.percentile(0.90), 3),
+            "p99Ms": round(self.percentile(0.99), 3),
+            "allocatedBlocks": self.allocated_blocks,
+            "histogram": buckets
+        }
+
+
+class ParseProfiler:
+    """⏱️ Thread-safe aggregator of per-phase parse timings"""
+
+    def __init__(self, keep_slowest: int = 10, buckets_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        """Initialize profiler
+
+        Args:
+            keep_slowest: Number of slowest parses kept with their phase breakdown
+            buckets_ms: Ascending histogram bucket upper bounds in milliseconds
+        """
+        if keep_slowest < 0:
+            raise ValueError("keep_slowest must be >= 0")
+        if list(buckets_ms) != sorted(buckets_ms) or not buckets_ms:
+            raise ValueError("buckets_ms must be a non-empty ascending sequence")
+
+        self.keep_slowest = keep_slowest
+        self.buckets_ms = tuple(buckets_ms)
+        self.phases: Dict[str, PhaseHistogram] = {}
+        self.parses = 0
+        self.cache_hits = 0
+        self._slowest: List[Tuple[float, int, Dict[str, Any]]] = []  # min-heap on total ms
+        self._lock = threading.Lock()
+
+    def record(self, report: Dict[str, Any], sql: Optional[str] = None):
+        """Add one parse's diagnostics report (ParseDiagnostics.to_dict())"""
+        timings = report.get("timingsMs", {})
+        allocations = report.get("allocatedBlocks", {})
+        with self._lock:
+            self.parses += 1
+            if report.get("cacheHit"):
+                self.cache_hits += 1
+            for name, ms in timings.items():
+                histogram = self.phases.get(name)
+                if histogram is None:
+                    histogram = self.phases[name] = PhaseHistogram(self.buckets_ms)
+                histogram.add(ms, allocations.get(name, 0))
+
+            if self.keep_slowest:
+                total = timings.get("total", 0.0)
+                entry = (total, self.parses, {
+                    "totalMs": total,
+                    "sql": sql[:_SQL_PREVIEW_CHARS] if sql is not None else None,
+                    "timingsMs": dict(timings)
+                })
+                if len(self._slowest) < self.keep_slowest:
+                    heapq.heappush(self._slowest, entry)
+                elif total > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, entry)
+
+    def __call__(self, report: Dict[str, Any]):
+        """Allow use as a diagnostics_callback"""
+        self.record(report)
+
+    def slowest(self) -> List[Dict[str, Any]]:
+        """Slowest recorded parses, slowest first"""
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._slowest, key=lambda item: -item[0])]
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregated per-phase statistics as a JSON-serializable dict"""
+        with self._lock:
+            phases = {name: histogram.to_dict() for name, histogram in self.phases.items()}
+            parses, cache_hits = self.parses, self.cache_hits
+        return {
+            "parses": parses,
+            "cacheHits": cache_hits,
+            "phases": phases,
+            "slowest": self.slowest()
+        }
+
+    def reset(self):
+        """Drop all recorded data"""
+        with self._lock:
+            self.phases.clear()
+            self.parses = 0
+            self.cache_hits = 0
+            self._slowest = []
+
+    def format_table(self) -> str:
+        """Plain-text per-phase summary, one row per phase"""
+        stats = self.stats()
+        lines = [f"{'phase':<28}{'count':>8}{'mean ms':>10}{'p90 ms':>10}{'max ms':>10}{'blocks':>10}"]
+        for name, phase in stats["phases"].items():
+            indent = '  ' * name.count('.')
+            lines.append(f"{indent + name:<28}{phase['count']:>8}{phase['meanMs']:>10.3f}"
+                         f"{phase['p90Ms']:>10.3f}{phase['maxMs']:>10.3f}{phase['allocatedBlocks']:>10}")
+        return '\n'.join(lines)
@@ -0,0 +1,321 @@
+"""
+Regex Registry - SQL Parser AST v6.0
+
+🧮 One place where every core regex is declared, compiled once and measured
+
+Modules declare their patterns at import time with regex(); compilation is
+lazy (first use) unless warm() is called. When stats are enabled every call
+records a count and cumulative time per pattern, so hot patterns show up in
+REGEX_REGISTRY.stats().
+
+LazyClause replaces `KEYWORD\s+(.*?)TERMINATOR` clause patterns, which the
+backtracking engine runs in quadratic time on input without a terminator,
+with an equivalent linear-time search. LineScopedPattern does the same for
+MULTILINE rule patterns that re would retry at every opener of a long line.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class TrackedPattern:
+    """🧮 Lazily compiled pattern with the re.Pattern call API plus usage stats"""
+
+    __slots__ = ('name', 'pattern', 'flags', '_compiled', '_registry', 'calls', 'total_time')
+
+    def __init__(self, pattern: str, flags: int, name: str, registry: 'RegexRegistry'):
+        self.name = name
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled = None
+        self._registry = registry
+        self.calls = 0
+        self.total_time = 0.0
+
+    @property
+    def compiled(self):
+        """The compiled re.Pattern (compiled on first access)"""
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = re.compile(self.pattern, self.flags)
+        return compiled
+
+    def _timed(self, method: str, *args):
+        start = time.perf_counter()
+        try:
+            result = getattr(self._compiled or self.compiled, method)(*args)
+            if method == 'finditer':
+                # Materialize so the scan time is attributed to this pattern
+                result = iter(list(result))
+            return result
+        finally:
+            self.calls += 1
+            self.total_time += time.perf_counter() - start
+
+    def search(self, string: str, *args):
+        if self._registry.stats_enabled:
+            return self._timed('search', string, *args)
+        return (self._compiled or self.compiled).search(string, *args)
+
+    def match(self, string: str, *args):
+        if self._registry.stats_enabled:
+            return self._timed('match', string, *args)
+        return (self._compiled or self.compiled).match(string, *args)
+
+    def fullmatch(self, string: str, *args):
+        if self._registry.stats_enabled:
+            return self._timed('fullmatch', string, *args)
+        return (self._compiled or self.compiled).fullmatch(string, *args)
+
+    def findall(self, string: str, *args):
+        if self._registry.stats_enabled:
+            return self._timed('findall', string, *args)
+        return (self._compiled or self.compiled).findall(string, *args)
+
+    def finditer(self, string: str, *args):
+        if self._registry.stats_enabled:
+            return self._timed('finditer', string, *args)
+        return (self._compiled or self.compiled).finditer(string, *args)
+
+    def sub(self, repl, string: str, count: int = 0):
+        if self._registry.stats_enabled:
+            return self._timed('sub', repl, string, count)
+        return (self._compiled or self.compiled).sub(repl, string, count)
+
+    def subn(self, repl, string: str, count: int = 0):
+        if self._registry.stats_enabled:
+            return self._timed('subn', repl, string, count)
+        return (self._compiled or self.compiled).subn(repl, string, count)
+
+    def split(self, string: str, maxsplit: int = 0):
+        if self._registry.stats_enabled:
+            return self._timed('split', string, maxsplit)
+        return (self._compiled or self.compiled).split(string, maxsplit)
+
+    def __repr__(self):
+        return f"TrackedPattern({self.name!r}, {self.pattern!r})"
+
+
+class RegexRegistry:
+    """🧮 Registry of TrackedPatterns keyed by (pattern, flags)"""
+
+    def __init__(self):
+        self._patterns: Dict[Tuple[str, int], TrackedPattern] = {}
+        self._lock = threading.Lock()
+        self.stats_enabled = False
+
+    def register(self, pattern: str, flags: int = 0, name: Optional[str] = None) -> TrackedPattern:
+        """Declare a pattern (idempotent: the same pattern and flags share one entry)"""
+        key = (pattern, flags)
+        tracked = self._patterns.get(key)
+        if tracked is None:
+            with self._lock:
+                tracked = self._patterns.get(key)
+                if tracked is None:
+                    tracked = TrackedPattern(pattern, flags, name or pattern, self)
+                    self._patterns[key] = tracked
+        return tracked
+
+    def warm(self) -> int:
+        """Compile every registered pattern now; returns the number of patterns"""
+        patterns = list(self._patterns.values())
+        for tracked in patterns:
+            tracked.compiled
+        return len(patterns)
+
+    def enable_stats(self, enabled: bool = True):
+        """Turn per-pattern call counting and timing on or off"""
+        self.stats_enabled = enabled
+
+    def reset_stats(self):
+        """Zero all call counts and timings"""
+        for tracked in list(self._patterns.values()):
+            tracked.calls = 0
+            tracked.total_time = 0.0
+
+    def stats(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-pattern call counts and cumulative time, hottest first"""
+        report = [
+            {
+                "name": tracked.name,
+                "pattern": tracked.pattern,
+                "calls": tracked.calls,
+                "totalMs": round(tracked.total_time * 1000.0, 3),
+                "compiled": tracked._compiled is not None
+            }
+            for tracked in list(self._patterns.values())
+        ]
+        report.sort(key=lambda entry: (entry["totalMs"], entry["calls"]), reverse=True)
+        return report[:top] if top else report
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+
+# Process-wide registry used by all core modules
+REGEX_REGISTRY = RegexRegistry()
+
+
+def regex(pattern: str, flags: int = 0, name: Optional[str] = None) -> TrackedPattern:
+    """Declare a pattern in the shared registry"""
+    return REGEX_REGISTRY.register(pattern, flags, name)
+
+
+class ClauseMatch:
+    """Match-like result of LazyClause.search: group 0 and the clause body (group 1)"""
+
+    __slots__ = ('string', '_spans')
+
+    def __init__(self, string: str, start: int, end: int, body_start: int, body_end: int):
+        self.string = string
+        self._spans = ((start, end), (body_start, body_end))
+
+    def span(self, group: int = 0) -> Tuple[int, int]:
+        return self._spans[group]
+
+    def start(self, group: int = 0) -> int:
+        return self._spans[group][0]
+
+    def end(self, group: int = 0) -> int:
+        return self._spans[group][1]
+
+    def group(self, group: int = 0) -> str:
+        start, end = self._spans[group]
+        return self.string[start:end]
+
+    def __repr__(self):
+        return f"<ClauseMatch span={self._spans[0]} body={self.group(1)!r}>"
+
+
+class LazyClause:
+    """🧮 Linear-time search for `OPENER(.*?)(?:CLOSER|$)` with re.DOTALL
+
+    The plain pattern retries the terminator after every character of the
+    body, and rescans the rest of the string from every later opener when no
+    terminator exists, so clause extraction goes quadratic on large or
+    malformed statements. LazyClause finds the same match with single forward
+    scans:
+
+    - the first opener is located once; later openers can only see a subset
+      of the terminators the first one saw, so they are never tried
+    - the terminator is searched behind a (?<!\s) guard, which skips the
+      inside of whitespace runs (a match there implies one at the run start)
+
+    Requirements: the opener ends with a greedy `\s+` and the closer starts
+    with `\s+`. `pattern` holds the equivalent regular expression.
+    """
+
+    __slots__ = ('name', 'pattern', 'end_anchor', 'lookahead', 'opener', 'closer', '_closer_at')
+
+    def __init__(self, opener: str, closer: str, flags: int = 0, name: Optional[str] = None,
+                 end_anchor: bool = False, lookahead: bool = False):
+        """Declare a clause pattern
+
+        Args:
+            opener: Pattern of the clause keyword, ending with `\s+` (e.g. r'\bWHERE\s+')
+            closer: Pattern of the terminator, starting with `\s+`
+            flags: re flags for opener and closer (DOTALL is implied for the body)
+            name: Registry name prefix
+            end_anchor: Also end the clause at `$` (end of string or before a final newline)
+            lookahead: Leave the terminator out of the match, like (?=CLOSER)
+        """
+        name = name or opener
+        terminator = f'(?=(?:{closer}){"|$" if end_anchor else ""})' if lookahead else \
+            f'(?:{closer}{"|$" if end_anchor else ""})'
+        self.name = name
+        self.pattern = f'{opener}(.*?){terminator}'
+        self.end_anchor = end_anchor
+        self.lookahead = lookahead
+        self.opener = regex(opener, flags, f'{name}.opener')
+        self.closer = regex(rf'(?<!\s)(?:{closer})', flags, f'{name}.closer')
+        self._closer_at = regex(closer, flags, f'{name}.closer_at')
+
+    def search(self, string: str) -> Optional[ClauseMatch]:
+        """First clause in string (same result as re.search(self.pattern, string, flags | DOTALL))"""
+        opened = self.opener.search(string)
+        if opened is None:
+            return None
+        body_start = opened.end()
+
+        closed = self.closer.search(string, body_start)
+        anchor = None
+        if self.end_anchor:
+            anchor = len(string) - 1 if string.endswith('\n') and len(string) - 1 >= body_start else len(string)
+        if closed is not None and (anchor is None or closed.start() <= anchor):
+            end = closed.start() if self.lookahead else closed.end()
+            return ClauseMatch(string, opened.start(), end, body_start, closed.start())
+        if anchor is not None:
+            return ClauseMatch(string, opened.start(), anchor, body_start, anchor)
+
+        # Only left to try: the opener's trailing whitespace run giving back one
+        # character, so an empty body is followed directly by the terminator
+        start = body_start - 1
+        if start - 1 > opened.start() and string[start - 1].isspace():
+            closed = self._closer_at.match(string, start)
+            if closed is not None:
+                return ClauseMatch(string, opened.start(), start if self.lookahead else closed.end(), start, start)
+        return None
+
+    def __repr__(self):
+        return f"LazyClause({self.name!r}, {self.pattern!r})"
+
+
+class LineScopedPattern:
+    """🧮 search()/sub() that try each line only once for `OPENER<line-bound body>` patterns
+
+    For MULTILINE patterns such as FROM\s+(.*?)\s+WHERE\s+(.*?)(?=...|$),
+    whose body after the opener cannot cross a line break: a later opener
+    whose body starts on the same line as a failed one sees a subset of what
+    the failed one saw, so it is skipped. re would instead rescan the rest of
+    the line from every opener, which is quadratic on one-line dumps.
+
+    Requirements: every match starts with an opener match and the body starts
+    where the opener match ends. The pattern must not match the empty string.
+    """
+
+    __slots__ = ('name', 'pattern', 'flags', 'compiled', 'opener')
+
+    def __init__(self, pattern: str, flags: int, name: str, opener: str):
+        self.name = name
+        self.pattern = pattern
+        self.flags = flags
+        self.compiled = regex(pattern, flags, name)
+        self.opener = regex(opener, flags, f'{name}.opener')
+
+    def search(self, string: str, pos: int = 0):
+        """Leftmost match at or after pos (same result as re.search)"""
+        line_end = -1  # end of the line of the last failed body
+        while True:
+            opened = self.opener.search(string, pos)
+            if opened is None:
+                return None
+            pos = opened.end()
+            if line_end >= 0 and pos <= line_end:
+                continue
+            match = self.compiled.match(string, opened.start())
+            if match is not None:
+                return match
+            line_end = string.find('\n', pos)
+            if line_end < 0:
+                return None
+
+    def sub(self, repl, string: str, count: int = 0) -> str:
+        """Same result as re.sub (repl may be a callable or a template)"""
+        pieces = []
+        last = 0
+        replaced = 0
+        while not count or replaced < count:
+            match = self.search(string, last)
+            if match is None:
+                break
+            pieces.append(string[last:match.start()])
+            pieces.append(repl(match) if callable(repl) else match.expand(repl))
+            last = match.end()
+            replaced += 1
+        pieces.append(string[last:])
+        return ''.join(pieces)
+
+    def __repr__(self):
+        return f"LineScopedPattern({self.name!r}, {self.pattern!r})"
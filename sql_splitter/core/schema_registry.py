@@ -0,0 +1,118 @@
+"""
+Schema Registry - SQL Parser AST v6.0
+
+🗄️ One shared set of database (schema) names for `db.` prefix handling
+
+The normalizer, the parser and every extractor ask the same SchemaRegistry
+whether a name is a database, so `db.table` / `db.table.field` prefixes are
+recognized (and stripped) consistently with a constant-time lookup. The
+default registry holds the built-in names; deployments with many schemas load
+their own from a config file or from information_schema.SCHEMATA and pass it
+to SQLParserAST(schema_registry=...).
+"""
+
+import hashlib
+import json
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Built-in database names (used when no registry is configured)
+DEFAULT_DATABASE_NAMES = frozenset({'momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db'})
+
+# MySQL's own schemas, skipped when loading from information_schema
+SYSTEM_SCHEMAS = frozenset({'information_schema', 'mysql', 'performance_schema', 'sys'})
+
+_SCHEMATA_QUERY = "SELECT SCHEMA_NAME FROM information_schema.SCHEMATA"
+
+
+class SchemaRegistry:
+    """🗄️ Immutable set of database names with O(1) membership and prefix splitting"""
+
+    __slots__ = ('names', '_folded')
+
+    def __init__(self, names: Iterable[str] = DEFAULT_DATABASE_NAMES):
+        """Args: names: Database names, matched case-sensitively (see contains_ignore_case)"""
+        self.names = frozenset(name.strip() for name in names if name and name.strip())
+        self._folded = frozenset(name.lower() for name in self.names)
+
+    @classmethod
+    def from_file(cls, path: str, include_defaults: bool = False) -> 'SchemaRegistry':
+        """Load names from a JSON list or a text file with one name per line (`#` comments)"""
+        with open(path, encoding='utf-8') as handle:
+            text = handle.read()
+        if text.lstrip().startswith('['):
+            names = json.loads(text)
+        else:
+            names = [line.split('#', 1)[0] for line in text.splitlines()]
+        return cls(_with_defaults(names, include_defaults))
+
+    @classmethod
+    def from_information_schema(cls, connection, include_defaults: bool = False,
+                                include_system: bool = False) -> 'SchemaRegistry':
+        """Load the schema names of a live MySQL server
+
+        Args:
+            connection: Any DB-API 2.0 connection (pymysql, mysql-connector, ...)
+            include_defaults: Keep the built-in names as well
+            include_system: Also register information_schema, mysql, sys, ...
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute(_SCHEMATA_QUERY)
+            names = [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+        if not include_system:
+            names = [name for name in names if name.lower() not in SYSTEM_SCHEMAS]
+        return cls(_with_defaults(names, include_defaults))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def contains_ignore_case(self, name: str) -> bool:
+        """Membership ignoring case (for patterns that match SQL case-insensitively)"""
+        return name.lower() in self._folded
+
+    def split_prefix(self, identifier: str) -> Tuple[Optional[str], str]:
+        """Split `db.rest` into ('db', 'rest'); (None, identifier) when there is no database prefix"""
+        head, dot, rest = identifier.partition('.')
+        if dot and head in self.names:
+            return head, rest
+        return None, identifier
+
+    def strip_prefix(self, identifier: str) -> str:
+        """`db.table.field` -> `table.field`, `db.table` -> `table`; other identifiers unchanged"""
+        return self.split_prefix(identifier)[1]
+
+    def union(self, names: Iterable[str]) -> 'SchemaRegistry':
+        """New registry with extra names added"""
+        return SchemaRegistry(self.names.union(names))
+
+    def fingerprint(self) -> str:
+        """Stable digest of the names (mixed into result cache keys)"""
+        return hashlib.sha1('\n'.join(sorted(self.names)).encode('utf-8')).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self.names))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SchemaRegistry) and other.names == self.names
+
+    def __hash__(self) -> int:
+        return hash(self.names)
+
+    def __reduce__(self):
+        return (SchemaRegistry, (sorted(self.names),))
+
+    def __repr__(self):
+        return f"SchemaRegistry({len(self.names)} names)"
+
+
+def _with_defaults(names: Iterable[str], include_defaults: bool) -> Iterable[str]:
+    return DEFAULT_DATABASE_NAMES.union(names) if include_defaults else names
+
+
+# Registry used by every component unless one is passed in
+DEFAULT_SCHEMA_REGISTRY = SchemaRegistry()
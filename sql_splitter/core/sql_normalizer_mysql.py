@@ -12,8 +12,60 @@ Location: 01_core_parser (moved from 04_normalization for better integration)
 
 import re
 import json
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field
+
+from .regex_registry import regex, LineScopedPattern, TrackedPattern
+from .schema_registry import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY
+from .deadline import ParseDeadline, ParseTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# 🧮 Precompiled patterns (declared once in the shared regex registry)
+_WHITESPACE_RUN = regex(r'\s+', 0, 'whitespace_run')
+_BACKTICK_IDENTIFIER = regex(r'`([a-zA-Z_][a-zA-Z0-9_.]*)`', 0, 'normalizer.backtick_identifier')
+_DOTTED_IDENTIFIER = regex(r'\b[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)+\b', 0, 'normalizer.dotted_identifier')
+_AND_SEPARATOR = regex(r'(?<!\s)\s+AND\s+', re.IGNORECASE, 'normalizer.and_separator')
+_ALIAS_EQUALITY = regex(r'([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)',
+                        0, 'normalizer.alias_equality')
+
+# Handle JOIN syntax carefully to avoid duplication (applied in order)
+_JOIN_FIX_RULES = [
+    # Fix compound JOINs that cause duplication
+    (r'\bleft\s+inner\s+join\b', 'LEFT JOIN'),
+    (r'\bright\s+inner\s+join\b', 'RIGHT JOIN'),
+    (r'\binner\s+inner\s+join\b', 'INNER JOIN'),
+    (r'\bleft\s+left\s+join\b', 'LEFT JOIN'),
+    (r'\bright\s+right\s+join\b', 'RIGHT JOIN'),
+
+    # Standard JOIN case normalization
+    (r'\bleft\s+join\b', 'LEFT JOIN'),
+    (r'\bright\s+join\b', 'RIGHT JOIN'),
+    (r'\binner\s+join\b', 'INNER JOIN'),
+    (r'\bfull\s+outer\s+join\b', 'FULL OUTER JOIN'),
+    (r'\bfull\s+join\b', 'FULL JOIN'),
+
+    # Convert standalone 'join' to 'INNER JOIN'
+    (r'\s+join\s+(?![a-zA-Z])', ' INNER JOIN '),
+]
+_JOIN_FIXES = tuple(
+    (regex(pattern, re.IGNORECASE, f'normalizer.join_fix.{index}'), replacement)
+    for index, (pattern, replacement) in enumerate(_JOIN_FIX_RULES, 1)
+)
+
+# Check for JOIN syntax issues (duplication)
+_JOIN_SYNTAX_ISSUES = tuple(
+    (regex(pattern, re.IGNORECASE, f'normalizer.join_issue.{index}'), error_msg)
+    for index, (pattern, error_msg) in enumerate([
+        (r'LEFT\s+INNER\s+JOIN', "Invalid JOIN: LEFT INNER JOIN"),
+        (r'RIGHT\s+INNER\s+JOIN', "Invalid JOIN: RIGHT INNER JOIN"),
+        (r'INNER\s+INNER\s+JOIN', "Invalid JOIN: INNER INNER JOIN"),
+        (r'LEFT\s+LEFT\s+JOIN', "Invalid JOIN: LEFT LEFT JOIN"),
+        (r'RIGHT\s+RIGHT\s+JOIN', "Invalid JOIN: RIGHT RIGHT JOIN"),
+    ], 1)
+)
 
 @dataclass
 class NormalizationRule:
@@ -23,13 +75,265 @@ class NormalizationRule:
     replacement: str
     description: str
     flags: int = re.IGNORECASE | re.MULTILINE
+    # Fixed prefix of every match; set it for patterns whose body stays on one
+    # line so a failed line is not rescanned from each later opener
+    opener: Optional[str] = None
+    compiled: Union[TrackedPattern, LineScopedPattern] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        name = f'normalizer.rule.{self.name}'
+        if self.opener is None:
+            self.compiled = regex(self.pattern, self.flags, name)
+        else:
+            self.compiled = LineScopedPattern(self.pattern, self.flags, name, self.opener)
+
+# ⚡ Fused single-pass scanners
+#
+# The fused engine folds runs of consecutive rules into one scanner each and
+# reproduces the rule-by-rule output exactly, including which rules changed
+# the text. Sequential passes interact only through shared whitespace (one
+# rule's trailing whitespace is the next rule's leading whitespace), so each
+# scanner leaves a whitespace run unconsumed when the next site claims it
+# and decides its replacement from the neighbouring sites.
+#
+# Every scanner starts with a single case-sensitive character class so re can
+# skip non-candidate positions in C; the first character is then dispatched
+# with lookbehinds and the keywords are matched case-insensitively with (?i:).
+# Leading-whitespace branches only start at the first character of a run
+# (a match inside the run implies one at its start), which keeps long runs of
+# blanks linear.
+
+_FUSED_SPACING_RULES = ('normalize_select_spacing', 'normalize_from_spacing',
+                        'normalize_where_spacing', 'normalize_as_keyword')
+_SPACING_RULE_BY_INITIAL = {'F': 1, 'W': 2, 'A': 3}
+_SPACING_CLAIM = r'(?i:FROM|WHERE|AS)\s'
+_FUSED_SPACING_SCANNER = regex(r"""
+    [\ssS](?:
+        (?<=[sS])(?P<select>(?i:elect))(?=\s)
+            (?:(?=(?P<select_ws>\s+))(?P=select_ws)(?!""" + _SPACING_CLAIM + r"""))?
+      | (?<=\s)(?<!\s\s)(?P<lead>\s*)(?P<keyword>(?i:FROM|WHERE|AS))(?=\s)
+            (?:(?=(?P<keyword_ws>\s+))(?P=keyword_ws)(?!""" + _SPACING_CLAIM + r"""))?
+    )
+""", re.VERBOSE, 'normalizer.fused.keyword_spacing')
+
+# Context-dependent rules that still run as their own passes (between the two fused scanners)
+_STRUCTURAL_RULES = ('remove_db_prefix_select_fields', 'remove_db_prefix_where_conditions', 'remove_db_prefix_group_by',
+                     'remove_db_prefix_join_tables', 'convert_comma_separated_from_to_joins')
+
+_FUSED_OPERATOR_RULES = ('normalize_all_operators', 'normalize_comma_spacing', 'normalize_group_by_spacing',
+                         'normalize_order_by_spacing', 'normalize_with_spacing')
+_CLAUSE_KEYWORD_BY_INITIAL = {'G': ('GROUP BY', 2), 'O': ('ORDER BY', 3), 'W': ('WITH', 4)}
+_OPERATOR_AHEAD = r'(?:[=<>]|!=)'
+_CLAUSE_KEYWORD = r'(?i:GROUP\s+BY|ORDER\s+BY|WITH)'
+# Whitespace follows the keyword once operators and commas are spaced
+_CLAUSE_KEYWORD_TAIL = r'(?=\s*' + _OPERATOR_AHEAD + r'|\s+(?![\s,]))'
+_FUSED_OPERATOR_SCANNER = regex(r"""
+    [\s=<>!,gGoOwW](?:
+        # Leading whitespace owned by the operator, comma or keyword that follows
+        (?<=\s)(?<!\s\s)(?P<lead>\s*)(?=""" + _OPERATOR_AHEAD + r"""|,|""" + _CLAUSE_KEYWORD + _CLAUSE_KEYWORD_TAIL + r""")
+      | (?<=[=<>!])(?P<op>(?<=<)[=>]?|(?<=>)=?|(?<=!)=|(?<==))(?P<op_trail>\s*)
+      | (?<=,)(?P<comma_trail>\s*)
+      | (?<=[\s=<>,][gGoOwW])
+        (?P<keyword>(?<=[gG])(?i:ROUP\s+BY)|(?<=[oO])(?i:RDER\s+BY)|(?<=[wW])(?i:ITH))""" + _CLAUSE_KEYWORD_TAIL + r"""
+            (?:(?=(?P<keyword_ws>\s+))(?P=keyword_ws)(?!""" + _OPERATOR_AHEAD + r"""|""" + _CLAUSE_KEYWORD + _CLAUSE_KEYWORD_TAIL + r"""))?
+    )
+""", re.VERBOSE, 'normalizer.fused.operator_spacing')
+_OPERATOR_START = regex(_OPERATOR_AHEAD, 0, 'normalizer.fused.operator_start')
+
+# The standalone-JOIN fix (last rule) can fire on the JOIN that ends any other
+# fix, so it rides along as an optional tail. LEFT LEFT INNER JOIN collapses to
+# LEFT JOIN because the LEFT INNER JOIN fix runs before the LEFT LEFT JOIN fix.
+_FUSED_JOIN_SCANNER = regex(r"""
+    [\slLrRiIfF](?:
+        (?<=\s)(?:(?<!\s\s)|(?!\s))(?P<standalone>\s*(?i:join)\s+(?![a-zA-Z]))
+      | (?<!\w.)(?:
+            (?<=[lL])(?i:eft\s+(?:left\s+(?:inner\s+join|join)|inner\s+join|join))
+          | (?<=[rR])(?i:ight\s+(?:right\s+(?:inner\s+join|join)|inner\s+join|join))
+          | (?<=[iI])(?i:nner\s+(?:inner\s+join|join))
+          | (?<=[fF])(?i:ull\s+(?P<outer>outer\s+)?join)
+        )\b(?P<tail>\s+(?![a-zA-Z]))?
+    )
+""", re.VERBOSE, 'normalizer.fused.join_fixes')
+_JOIN_FIX_BY_INITIAL = {'L': 'LEFT JOIN', 'R': 'RIGHT JOIN', 'I': 'INNER JOIN', 'F': 'FULL JOIN'}
+
+
+def _fused_keyword_spacing(sql: str, fired: set) -> str:
+    """⚡ SELECT/FROM/WHERE/AS spacing rules in one pass (exact sequential output)"""
+    changed = [False] * len(_FUSED_SPACING_RULES)
+    last = [-1, -1, False]  # end of previous keyword, its rule index, whether it fired
+
+    def replace(match):
+        start = match.start()
+        if match.group('select') is not None:
+            end = match.end('select')
+            trailing = sql[end:match.end()]
+            run = trailing or _WHITESPACE_RUN.match(sql, end).group()
+            if sql[start:end] != 'SELECT' or run != ' ':
+                changed[0] = True
+            last[:] = [end, 0, True]
+            return 'SELECT ' if trailing else 'SELECT'
+
+        lead = sql[start:match.end('lead')]
+        word = match.group('keyword')
+        keyword = word.upper()
+        rule = _SPACING_RULE_BY_INITIAL[keyword[0]]
+        end = match.end('keyword')
+        trailing = sql[end:match.end()]
+        adjacent = last[0] == start
+        # A rule cannot reuse the whitespace its own previous match consumed
+        fires = not (adjacent and last[1] == rule and last[2])
+
+        if fires:
+            lead_seen = ' ' if adjacent and last[2] and last[1] < rule else lead
+            if trailing:
+                trail_seen = trailing
+            else:
+                after = _WHITESPACE_RUN.match(sql, end)
+                next_rule = _SPACING_RULE_BY_INITIAL[sql[after.end()].upper()]
+                trail_seen = ' ' if next_rule < rule else after.group()
+            if lead_seen != ' ' or word != keyword or trail_seen != ' ':
+                changed[rule] = True
+            replacement = ' ' + keyword + (' ' if trailing else '')
+        else:
+            replacement = ' ' + word + trailing
+
+        last[:] = [end, rule, fires]
+        return replacement
+
+    sql = _FUSED_SPACING_SCANNER.sub(replace, sql)
+    fired.update(name for name, hit in zip(_FUSED_SPACING_RULES, changed) if hit)
+    return sql
+
+
+def _fused_operator_spacing(sql: str, fired: set) -> str:
+    """⚡ Operator, comma and GROUP BY/ORDER BY/WITH spacing rules in one pass (exact sequential output)"""
+    changed = [False] * len(_FUSED_OPERATOR_RULES)
+    state = {'lead_end': -1, 'lead': '', 'op_end': -1, 'comma_end': -1, 'comma_trail': '',
+             'keyword': (-1, -1, False)}
+    # Adjacent operator matches can shift whitespace between each other without
+    # changing the text, so they are compared as one chain
+    op_chain = ['', '']
+
+    def replace(match):
+        start, end = match.start(), match.end()
+        if match.group('lead') is not None:
+            # Emitted by the operator, comma or keyword that follows
+            state['lead_end'] = end
+            state['lead'] = match.group(0)
+            return ''
+        lead = state['lead'] if state['lead_end'] == start else None
+        if lead is not None:
+            start -= len(lead)
+
+        if match.group('op') is not None:
+            op = sql[match.start():match.end('op')]
+            if start != state['op_end']:
+                if op_chain[0] != op_chain[1]:
+                    changed[0] = True
+                op_chain[:] = ['', '']
+                if lead is None and start == state['comma_end']:
+                    lead = state['comma_trail']
+            op_chain[0] += (lead or '') + op + match.group('op_trail')
+            op_chain[1] += ' ' + op + ' '
+            state['op_end'] = end
+            # The comma rule runs next and strips the space before a comma
+            return ' ' + op if sql.startswith(',', end) else ' ' + op + ' '
+
+        if match.group('comma_trail') is not None:
+            if lead is None and start == state['op_end']:
+                lead = ' '
+            trail = match.group('comma_trail')
+            operator_next = _OPERATOR_START.match(sql, end) is not None
+            if lead or (' ' if operator_next else trail) != ' ':
+                changed[1] = True
+            state['comma_end'] = end
+            state['comma_trail'] = trail
+            # An operator right after the comma brings its own leading space
+            return ',' if operator_next else ', '
+
+        keyword_start = match.start()
+        word = sql[keyword_start:match.end('keyword')]
+        keyword, rule = _CLAUSE_KEYWORD_BY_INITIAL[word[0].upper()]
+        keyword_end = match.end('keyword')
+        trailing = sql[keyword_end:end]
+        last_end, last_rule, last_fired = state['keyword']
+        adjacent = lead is not None and last_end == start
+        fires = not (adjacent and last_rule == rule and last_fired)
+
+        if fires:
+            if lead is None:
+                lead_seen = ' '
+            else:
+                lead_seen = ' ' if adjacent and last_fired and last_rule < rule else lead
+            if trailing:
+                trail_seen = trailing
+            else:
+                after = _WHITESPACE_RUN.match(sql, keyword_end)
+                after_end = after.end() if after else keyword_end
+                if _OPERATOR_START.match(sql, after_end):
+                    trail_seen = ' '
+                else:
+                    next_rule = _CLAUSE_KEYWORD_BY_INITIAL[sql[after_end].upper()][1]
+                    trail_seen = ' ' if next_rule < rule else after.group()
+            if lead_seen != ' ' or word != keyword or trail_seen != ' ':
+                changed[rule] = True
+            replacement = ('' if lead is None else ' ') + keyword + (' ' if trailing else '')
+        else:
+            replacement = ' ' + word + trailing
+
+        state['keyword'] = (keyword_end, rule, fires)
+        return replacement
+
+    sql = _FUSED_OPERATOR_SCANNER.sub(replace, sql)
+    if op_chain[0] != op_chain[1]:
+        changed[0] = True
+    fired.update(name for name, hit in zip(_FUSED_OPERATOR_RULES, changed) if hit)
+    return sql
+
+
+def _fused_join_fixes(sql: str) -> str:
+    """⚡ All JOIN syntax fixes in one pass (exact sequential output)"""
+
+    def replace(match):
+        if match.group('standalone') is not None:
+            return ' INNER JOIN '
+        replacement = _JOIN_FIX_BY_INITIAL[sql[match.start()].upper()]
+        if match.group('outer') is not None:
+            replacement = 'FULL OUTER JOIN'
+        if match.group('tail') is not None:
+            # The standalone fix then rewrites the JOIN this fix just produced
+            return replacement[:-len(' JOIN')] + ' INNER JOIN '
+        return replacement
+
+    return _FUSED_JOIN_SCANNER.sub(replace, sql)
 
 class MySQLCompatibleNormalizer:
     """🐬 MySQL-compatible SQL normalization engine - Core Parser Integration"""
     
-    def __init__(self):
+    ENGINES = ("fused", "legacy")
+    
+    def __init__(self, engine: str = "fused", schemas: Optional[SchemaRegistry] = None):
+        """Initialize normalizer
+        
+        Args:
+            engine: "fused" folds the spacing, operator and JOIN rules into single-pass
+                scanners; "legacy" applies every rule as its own re.sub pass. Both
+                produce the same SQL and report the same applied rules.
+            schemas: Database names whose `db.` prefixes are removed (default: the
+                built-in registry)
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown normalization engine: {engine!r}")
+        
+        self.engine = engine
+        self.schemas = DEFAULT_SCHEMA_REGISTRY if schemas is None else schemas
         self.rules = self._load_mysql_compatible_rules()
         self.normalization_log = []
+        self._builtin_rules = tuple(self.rules)
+        self._rules_by_name = {rule.name: rule for rule in self.rules}
+        # Deadline of the normalize_query() call running on each thread (rule
+        # callbacks cannot take it as an argument; the normalizer is shared)
+        self._calls = threading.local()
     
     def _load_mysql_compatible_rules(self) -> List[NormalizationRule]:
         """Load MySQL-compatible normalization rules - NO function conversion"""
@@ -73,30 +377,31 @@ class MySQLCompatibleNormalizer:
             ),
             
             # Phase 3: Unified DB prefix removal
+            # ((?<!\s) stops the lazy bodies from retrying a terminator inside whitespace runs)
             NormalizationRule(
                 name="remove_db_prefix_select_fields",
-                pattern=r'SELECT\s+(.*?)(?=\s+FROM|$)',
+                pattern=r'SELECT\s+(.*?)(?=(?<!\s)\s+FROM|$)',
                 replacement=lambda m: 'SELECT ' + self._smart_remove_db_prefixes(m.group(1), 'SELECT'),
                 description="Remove DB prefixes from SELECT fields (user strategy: field=parts[-1])"
             ),
             
             NormalizationRule(
                 name="remove_db_prefix_where_conditions", 
-                pattern=r'WHERE\s+(.*?)(?=\s+GROUP\s+BY|\s+ORDER\s+BY|\s+LIMIT|$)',
+                pattern=r'WHERE\s+(.*?)(?=(?<!\s)(?:\s+GROUP\s+BY|\s+ORDER\s+BY|\s+LIMIT)|$)',
                 replacement=lambda m: 'WHERE ' + self._smart_remove_db_prefixes(m.group(1), 'WHERE'),
                 description="Remove DB prefixes from WHERE conditions (user strategy: field=parts[-1])"
             ),
             
             NormalizationRule(
                 name="remove_db_prefix_group_by",
-                pattern=r'GROUP\s+BY\s+(.*?)(?=\s+ORDER\s+BY|\s+HAVING|\s+LIMIT|$)',
+                pattern=r'GROUP\s+BY\s+(.*?)(?=(?<!\s)(?:\s+ORDER\s+BY|\s+HAVING|\s+LIMIT)|$)',
                 replacement=lambda m: 'GROUP BY ' + self._smart_remove_db_prefixes(m.group(1), 'GROUP BY'),
                 description="Remove DB prefixes from GROUP BY fields (user strategy: field=parts[-1])"
             ),
             
             NormalizationRule(
                 name="remove_db_prefix_join_tables",
-                pattern=r'((?:LEFT|RIGHT|INNER|OUTER)?\s*JOIN\s+)([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)',
+                pattern=r'((?:LEFT|RIGHT|INNER|OUTER|(?<!\s))\s*JOIN\s+)([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)',
                 replacement=lambda m: m.group(1) + self._smart_remove_db_prefixes(m.group(2), 'JOIN'),
                 description="Remove DB prefixes from JOIN tables (user strategy: table=parts[-1])"
             ),
@@ -104,8 +409,11 @@ class MySQLCompatibleNormalizer:
             # Phase 4: Old-style comma-separated FROM to JOIN conversion
             NormalizationRule(
                 name="convert_comma_separated_from_to_joins",
-                pattern=r'FROM\s+(.*?)\s+WHERE\s+(.*?)(?=\s+GROUP\s+BY|\s+ORDER\s+BY|\s+LIMIT|$)',
-                replacement=lambda m: self._convert_comma_from_to_joins(m.group(1), m.group(2)),
+                # Same matches as FROM\s+(.*?)\s+WHERE\s+(.*?)(?=\s+GROUP\s+BY|...|$); the second
+                # branch is that pattern's empty FROM list when two or more spaces precede WHERE
+                pattern=r'FROM(?:\s+(.*?)(?<!\s)|\s+(?=\s))\s+WHERE\s+(.*?)(?=(?<!\s)(?:\s+GROUP\s+BY|\s+ORDER\s+BY|\s+LIMIT)|$)',
+                opener=r'FROM\s+',
+                replacement=lambda m: self._convert_comma_from_to_joins(m.group(1) or '', m.group(2)),
                 description="Convert old-style comma-separated FROM to modern JOIN syntax (FROM t1 a, t2 b WHERE a.id = b.id → FROM t1 a JOIN t2 b ON a.id = b.id)"
             ),
             
@@ -166,11 +474,9 @@ class MySQLCompatibleNormalizer:
         """
         
         # Known database names to remove
-        known_databases = {'momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db'}
+        known_databases = self.schemas.names
         
         # Process each identifier in the text
-        import re
-        
         def smart_replace(match):
             identifier = match.group(0)
             parts = identifier.split('.')
@@ -198,9 +504,8 @@ class MySQLCompatibleNormalizer:
                 else:
                     return identifier
         
-        # Pattern to match identifiers with dots
-        pattern = r'\b[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)+\b'
-        result = re.sub(pattern, smart_replace, text)
+        # Replace identifiers with dots
+        result = _DOTTED_IDENTIFIER.sub(smart_replace, text)
         
         return result
 
@@ -219,8 +524,6 @@ class MySQLCompatibleNormalizer:
         Returns:
             Converted FROM ... WHERE clause
         """
-        import re
-        
         # Parse table aliases from FROM clause
         tables = []
         for table_part in from_clause.split(','):
@@ -238,20 +541,28 @@ class MySQLCompatibleNormalizer:
         if len(tables) < 2:
             # No comma separation, return as-is
             return f"FROM {from_clause} WHERE {where_clause}"
+
+        # ⚡ alias -> table (first table wins, like a front-to-back scan)
+        tables_by_alias = {}
+        for table in tables:
+            tables_by_alias.setdefault(table['alias'], table)
         
         # Extract JOIN conditions from WHERE clause
         join_conditions = []
         remaining_conditions = []
+        deadline = getattr(self._calls, 'deadline', None)
         
         # Split WHERE conditions by AND
-        conditions = re.split(r'\s+AND\s+', where_clause, flags=re.IGNORECASE)
+        conditions = _AND_SEPARATOR.split(where_clause)
         
         for condition in conditions:
+            if deadline is not None:
+                deadline.poll()
             condition = condition.strip()
             
             # Look for equality conditions between different table aliases
             # Pattern: alias1.field = alias2.field
-            equality_match = re.match(r'([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)', condition)
+            equality_match = _ALIAS_EQUALITY.match(condition)
             
             if equality_match:
                 left_alias = equality_match.group(1)
@@ -260,10 +571,8 @@ class MySQLCompatibleNormalizer:
                 right_field = equality_match.group(4)
                 
                 # Check if both aliases exist in our tables
-                left_exists = any(t['alias'] == left_alias for t in tables)
-                right_exists = any(t['alias'] == right_alias for t in tables)
-                
-                if left_exists and right_exists and left_alias != right_alias:
+                if (left_alias in tables_by_alias and right_alias in tables_by_alias
+                        and left_alias != right_alias):
                     # This is a JOIN condition
                     join_conditions.append({
                         'left_alias': left_alias,
@@ -282,8 +591,8 @@ class MySQLCompatibleNormalizer:
             # No JOIN conditions found, return as-is (might be a cross join scenario)
             return f"FROM {from_clause} WHERE {where_clause}"
         
-        # Start with the first table
-        result_from = f"FROM {tables[0]['name']} {tables[0]['alias']}"
+        # Start with the first table (pieces are joined once at the end)
+        result_from = [f"FROM {tables[0]['name']} {tables[0]['alias']}"]
         
         # Add JOINs for other tables based on conditions
         joined_aliases = {tables[0]['alias']}
@@ -295,54 +604,34 @@ class MySQLCompatibleNormalizer:
             # Determine which table to JOIN
             if left_alias in joined_aliases and right_alias not in joined_aliases:
                 # JOIN the right table
-                right_table = next(t for t in tables if t['alias'] == right_alias)
-                result_from += f" JOIN {right_table['name']} {right_table['alias']} ON {join_cond['condition']}"
+                right_table = tables_by_alias[right_alias]
+                result_from.append(f" JOIN {right_table['name']} {right_table['alias']} ON {join_cond['condition']}")
                 joined_aliases.add(right_alias)
             elif right_alias in joined_aliases and left_alias not in joined_aliases:
                 # JOIN the left table
-                left_table = next(t for t in tables if t['alias'] == left_alias)
-                result_from += f" JOIN {left_table['name']} {left_table['alias']} ON {join_cond['condition']}"
+                left_table = tables_by_alias[left_alias]
+                result_from.append(f" JOIN {left_table['name']} {left_table['alias']} ON {join_cond['condition']}")
                 joined_aliases.add(left_alias)
         
         # Add any remaining tables as JOINs (without specific conditions)
         for table in tables:
             if table['alias'] not in joined_aliases:
-                result_from += f" JOIN {table['name']} {table['alias']}"
+                result_from.append(f" JOIN {table['name']} {table['alias']}")
         
         # Add remaining WHERE conditions if any
         if remaining_conditions:
-            result_from += f" WHERE {' AND '.join(remaining_conditions)}"
+            result_from.append(f" WHERE {' AND '.join(remaining_conditions)}")
         
-        return result_from
+        return ''.join(result_from)
 
     def _normalize_mysql_join_syntax(self, sql: str) -> str:
         """MySQL-compatible JOIN syntax normalization"""
         
-        # Handle JOIN syntax carefully to avoid duplication
-        join_fixes = [
-            # Fix compound JOINs that cause duplication
-            (r'\bleft\s+inner\s+join\b', 'LEFT JOIN'),
-            (r'\bright\s+inner\s+join\b', 'RIGHT JOIN'),
-            (r'\binner\s+inner\s+join\b', 'INNER JOIN'),
-            (r'\bleft\s+left\s+join\b', 'LEFT JOIN'),
-            (r'\bright\s+right\s+join\b', 'RIGHT JOIN'),
-            
-            # Standard JOIN case normalization
-            (r'\bleft\s+join\b', 'LEFT JOIN'),
-            (r'\bright\s+join\b', 'RIGHT JOIN'),
-            (r'\binner\s+join\b', 'INNER JOIN'),
-            (r'\bfull\s+outer\s+join\b', 'FULL OUTER JOIN'),
-            (r'\bfull\s+join\b', 'FULL JOIN'),
-            
-            # Convert standalone 'join' to 'INNER JOIN'
-            (r'\s+join\s+(?![a-zA-Z])', ' INNER JOIN '),
-        ]
-        
         result = sql
         
         # Apply JOIN fixes in order
-        for pattern, replacement in join_fixes:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        for pattern, replacement in _JOIN_FIXES:
+            result = pattern.sub(replacement, result)
         
         return result
     
@@ -367,78 +656,146 @@ class MySQLCompatibleNormalizer:
         if 'FROM' not in sql_upper:
             errors.append("Missing FROM keyword")
         
-        # Check for JOIN syntax issues (duplication)
-        join_issues = [
-            (r'LEFT\s+INNER\s+JOIN', "Invalid JOIN: LEFT INNER JOIN"),
-            (r'RIGHT\s+INNER\s+JOIN', "Invalid JOIN: RIGHT INNER JOIN"),
-            (r'INNER\s+INNER\s+JOIN', "Invalid JOIN: INNER INNER JOIN"),
-            (r'LEFT\s+LEFT\s+JOIN', "Invalid JOIN: LEFT LEFT JOIN"),
-            (r'RIGHT\s+RIGHT\s+JOIN', "Invalid JOIN: RIGHT RIGHT JOIN"),
-        ]
-        
-        for pattern, error_msg in join_issues:
-            if re.search(pattern, sql, re.IGNORECASE):
+        for pattern, error_msg in _JOIN_SYNTAX_ISSUES:
+            if pattern.search(sql):
                 errors.append(error_msg)
         
         return len(errors) == 0, errors
 
-    def normalize_query(self, sql: str) -> Tuple[str, List[str], List[str]]:
-        """🐬 Normalize single query with MySQL compatibility"""
+    def _apply_rule(self, rule: NormalizationRule, sql: str, applied: set) -> str:
+        """Apply one rule as its own pass, recording it when it changes the SQL"""
+        deadline = getattr(self._calls, 'deadline', None)
+        if deadline is not None:
+            deadline.check()
+        # Handle callable replacements (lambda functions)
+        if callable(rule.replacement):
+            try:
+                normalized_sql = rule.compiled.sub(rule.replacement, sql)
+            except ParseTimeoutError:
+                raise
+            except Exception as e:
+                logger.warning("Normalization rule '%s' failed: %s", rule.name, e)
+                return sql
+        else:
+            normalized_sql = rule.compiled.sub(rule.replacement, sql)
+        
+        if normalized_sql != sql:
+            applied.add(rule.name)
+        return normalized_sql
+
+    def _apply_rules_sequential(self, sql: str) -> Tuple[str, List[str]]:
+        """🐢 Apply every rule as a separate pass, in order"""
+        applied = set()
+        for rule in self.rules:
+            sql = self._apply_rule(rule, sql, applied)
+        return sql, [rule.name for rule in self.rules if rule.name in applied]
+
+    def _apply_rules_fused(self, sql: str) -> Tuple[str, List[str]]:
+        """⚡ Apply the built-in rules with fused scanners
         
+        Plan: backticks (skipped when there are none) → one keyword-spacing pass →
+        the context-dependent DB prefix / comma-FROM rules → one operator, comma and
+        clause-keyword pass → final whitespace cleanup.
+        """
+        applied = set()
+        rules = self._rules_by_name
+        
+        if '`' in sql:
+            sql = self._apply_rule(rules['remove_backticks'], sql, applied)
+        sql = _fused_keyword_spacing(sql, applied)
+        for name in _STRUCTURAL_RULES:
+            sql = self._apply_rule(rules[name], sql, applied)
+        sql = _fused_operator_spacing(sql, applied)
+        sql = self._apply_rule(rules['final_cleanup_spaces'], sql, applied)
+        
+        return sql, [rule.name for rule in self.rules if rule.name in applied]
+
+    def normalize_query(self, sql: str,
+                        deadline: Optional[ParseDeadline] = None) -> Tuple[str, List[str], List[str]]:
+        """🐬 Normalize single query with MySQL compatibility
+
+        Args:
+            sql: Query to normalize
+            deadline: Time budget of the calling parse; checked before every rule
+                pass and polled by the comma-FROM conversion
+        """
+        previous = getattr(self._calls, 'deadline', None)
+        self._calls.deadline = deadline
+        try:
+            return self._normalize_query(sql, deadline)
+        finally:
+            self._calls.deadline = previous
+
+    def _normalize_query(self, sql: str, deadline: Optional[ParseDeadline]) -> Tuple[str, List[str], List[str]]:
         normalized_sql = sql.strip()
         applied_rules = []
         validation_errors = []
         
-        print(f"🔍 Normalizing MySQL query (length: {len(sql)})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Normalizing MySQL query (length: %d)", len(sql))
         
         # Phase 1: Apply safe normalization rules
-        for rule in self.rules:
-            original_sql = normalized_sql
-            
-            # Handle callable replacements (lambda functions)
-            if callable(rule.replacement):
-                try:
-                    normalized_sql = re.sub(rule.pattern, rule.replacement, normalized_sql, flags=rule.flags)
-                except Exception as e:
-                    print(f"⚠️  Rule '{rule.name}' failed: {e}")
-                    continue
-            else:
-                normalized_sql = re.sub(rule.pattern, rule.replacement, normalized_sql, flags=rule.flags)
-            
-            if original_sql != normalized_sql:
-                applied_rules.append(rule.name)
+        # (the fused plan is tied to the built-in rules; customized rule lists run rule by rule)
+        if self.engine == "fused" and tuple(self.rules) == self._builtin_rules:
+            normalized_sql, applied_rules = self._apply_rules_fused(normalized_sql)
+        else:
+            normalized_sql, applied_rules = self._apply_rules_sequential(normalized_sql)
         
         # Phase 2: Fix JOIN syntax carefully
+        if deadline is not None:
+            deadline.check()
         original_sql = normalized_sql
-        normalized_sql = self._normalize_mysql_join_syntax(normalized_sql)
+        if self.engine == "fused":
+            normalized_sql = _fused_join_fixes(normalized_sql)
+        else:
+            normalized_sql = self._normalize_mysql_join_syntax(normalized_sql)
         
         if original_sql != normalized_sql:
             applied_rules.append("normalize_mysql_join_syntax")
         
         # Phase 3: Final cleanup
         normalized_sql = normalized_sql.strip()
-        normalized_sql = re.sub(r'\s+', ' ', normalized_sql)
+        normalized_sql = _WHITESPACE_RUN.sub(' ', normalized_sql)
         
         # Phase 4: MySQL syntax validation
         is_valid, syntax_errors = self._validate_mysql_syntax(normalized_sql)
         
         if not is_valid:
-            print(f"⚠️  MySQL validation failed, using minimal normalization")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("MySQL validation failed (%s), using minimal normalization",
+                             "; ".join(syntax_errors))
             validation_errors.extend(syntax_errors)
             
             # Minimal safe normalization
             minimal_sql = sql.strip()
-            minimal_sql = re.sub(r'`([a-zA-Z_][a-zA-Z0-9_.]*)`', r'\1', minimal_sql)  # Remove backticks only
-            minimal_sql = re.sub(r'\s+', ' ', minimal_sql)  # Space cleanup only
+            minimal_sql = _BACKTICK_IDENTIFIER.sub(r'\1', minimal_sql)  # Remove backticks only
+            minimal_sql = _WHITESPACE_RUN.sub(' ', minimal_sql)  # Space cleanup only
             
             normalized_sql = minimal_sql
             applied_rules = ["minimal_mysql_normalization"]
         
-        print(f"✅ MySQL normalized (rules: {len(applied_rules)}, valid: {is_valid})")
-        print(f"🔍 Normalized SQL: {normalized_sql}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("MySQL normalized (rules: %d, valid: %s): %s",
+                         len(applied_rules), is_valid, normalized_sql)
         
         return normalized_sql, applied_rules, validation_errors
 
+# 🐬 Process-wide normalizer behind the standalone functions (built on first use)
+_default_normalizer: Optional[MySQLCompatibleNormalizer] = None
+_default_normalizer_lock = threading.Lock()
+
+
+def _get_default_normalizer() -> MySQLCompatibleNormalizer:
+    """Shared normalizer of the standalone functions, so the rules are loaded once per process"""
+    global _default_normalizer
+    normalizer = _default_normalizer
+    if normalizer is None:
+        with _default_normalizer_lock:
+            if _default_normalizer is None:
+                _default_normalizer = MySQLCompatibleNormalizer()
+            normalizer = _default_normalizer
+    return normalizer
+
 # 🎯 USER-REQUESTED FEATURE: Standalone normalization functions for external use
 def normalize_sql_query(sql: str, enable_mysql_compatibility: bool = True) -> str:
     """🐬 Standalone function for external SQL normalization
@@ -456,13 +813,12 @@ def normalize_sql_query(sql: str, enable_mysql_compatibility: bool = True) -> st
     if not enable_mysql_compatibility:
         # Basic normalization only
         sql = sql.strip()
-        sql = re.sub(r'`([a-zA-Z_][a-zA-Z0-9_.]*)`', r'\1', sql)  # Remove backticks
-        sql = re.sub(r'\s+', ' ', sql)  # Space cleanup
+        sql = _BACKTICK_IDENTIFIER.sub(r'\1', sql)  # Remove backticks
+        sql = _WHITESPACE_RUN.sub(' ', sql)  # Space cleanup
         return sql
     
     # Full MySQL normalization
-    normalizer = MySQLCompatibleNormalizer()
-    normalized_sql, applied_rules, validation_errors = normalizer.normalize_query(sql)
+    normalized_sql, applied_rules, validation_errors = _get_default_normalizer().normalize_query(sql)
     
     return normalized_sql
 
@@ -476,8 +832,7 @@ def get_normalization_rules() -> List[str]:
         rules = get_normalization_rules()
         print(f"Available rules: {rules}")
     """
-    normalizer = MySQLCompatibleNormalizer()
-    return [rule.name for rule in normalizer.rules]
+    return [rule.name for rule in _get_default_normalizer().rules]
 
 def validate_mysql_syntax(sql: str) -> Tuple[bool, List[str]]:
     """🐬 Validate MySQL syntax without normalization
@@ -491,8 +846,7 @@ def validate_mysql_syntax(sql: str) -> Tuple[bool, List[str]]:
     Usage:
         valid, errors = validate_mysql_syntax("SELECT * FROM users")
     """
-    normalizer = MySQLCompatibleNormalizer()
-    return normalizer._validate_mysql_syntax(sql)
+    return _get_default_normalizer()._validate_mysql_syntax(sql)
 
 # 🎯 Export key functions for external use
 __all__ = [
@@ -9,120 +9,388 @@ import re
 import json
 import sys
 import os
-from typing import List, Dict, Any, Optional, Set, Tuple
+import logging
+import threading
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable, Iterable
 from .ast_nodes import *
 from .sql_tokenizer import SQLTokenizer, TokenStream
-from .join_handler import JoinHandler, parse_joins_from_sql
+from .join_handler import JoinHandler
 from .cte_handler import CTEHandler, parse_cte_from_sql
 from .table_extractor import TableExtractor, extract_all_tables_from_sql
 from .content_extractor import ContentExtractor, extract_content_from_sql
+from .parse_cache import ParseCache
+from .persistent_cache import PersistentParseCache
+from .diagnostics import ParseDiagnostics
+from .parse_context import ParseContext
+from .deadline import ParseDeadline, ParseTimeoutError
+from .profiler import ParseProfiler
+from .regex_registry import regex
+from .schema_registry import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY
 
 # 🐬 Import MySQL normalization functionality (now local in core parser)
 from .sql_normalizer_mysql import MySQLCompatibleNormalizer, normalize_sql_query
 
+logger = logging.getLogger(__name__)
+
+# 🧮 Precompiled patterns (declared once in the shared regex registry)
+_WHITESPACE_RUN = regex(r'\s+', 0, 'whitespace_run')
+# Handles patterns like: (`mt_item`.`Details_OrderID` = `mv_order`.`OrderID`)
+_PARENTHESIZED_EQUI_JOIN = regex(
+    r'\(\s*`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*=\s*`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\)',
+    0, 'parser.parenthesized_equi_join')
+_EQUI_JOIN = regex(
+    r'`?(?<![a-zA-Z0-9_])[0-9]*([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*=\s*`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?',
+    0, 'parser.equi_join')
+_TABLE_FIELD_REFERENCE = regex(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\b', 0, 'parser.table_field_reference')
+
+# Pattern to match DB.table.field or DB.table references: groups are (kept lead,
+# candidate database, rest); the candidate is checked against the schema registry
+_DB_PREFIX_CLEANUP_PATTERNS = (
+    # DB.table.field pattern
+    regex(r'\b()(\w+)\.([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*)\b',
+          re.IGNORECASE, 'parser.db_prefix.table_field'),
+    # DB.table pattern (most common)
+    regex(r'\b()(\w+)\.([a-zA-Z_][a-zA-Z0-9_]*)\b',
+          re.IGNORECASE, 'parser.db_prefix.table'),
+    # JOIN DB.table pattern (specifically for JOIN clauses)
+    regex(r'\b(JOIN\s+)(\w+)\.([a-zA-Z_][a-zA-Z0-9_]*)\b',
+          re.IGNORECASE, 'parser.db_prefix.join_table'),
+    # LEFT/RIGHT/INNER JOIN DB.table patterns
+    regex(r'\b((?:LEFT|RIGHT|INNER|OUTER|FULL)\s+JOIN\s+)(\w+)\.([a-zA-Z_][a-zA-Z0-9_]*)\b',
+          re.IGNORECASE, 'parser.db_prefix.typed_join_table'),
+)
+
+_AGGREGATION_CALL_PATTERNS = tuple(
+    regex(pattern, 0, f'parser.aggregation_call.{index}')
+    for index, pattern in enumerate([
+        r'\bCOUNT\s*\(',
+        r'\bSUM\s*\(',
+        r'\bAVG\s*\(',
+        r'\bMIN\s*\(',
+        r'\bMAX\s*\(',
+        r'\bGROUP_CONCAT\s*\(',
+    ], 1)
+)
+_WINDOW_CALL_PATTERNS = tuple(
+    regex(pattern, 0, f'parser.window_call.{index}')
+    for index, pattern in enumerate([
+        r'\bROW_NUMBER\s*\(\s*\)\s+OVER\s*\(',
+        r'\bRANK\s*\(\s*\)\s+OVER\s*\(',
+        r'\bDENSE_RANK\s*\(\s*\)\s+OVER\s*\(',
+        r'\bLEAD\s*\(',
+        r'\bLAG\s*\(',
+    ], 1)
+)
+
 class SQLParserAST:
     """
     🚀 Complete AST-based SQL parser with two-phase architecture
     
     Phase 1: Structure parsing → Build AST tree
     Phase 2: Content extraction → Generate expect.md compliant JSON
+    
+    The parser only holds configuration; per-call state lives in a ParseContext,
+    so one instance can be shared across threads.
     """
 
-    def __init__(self, enable_normalization: bool = True):
+    def __init__(self, enable_normalization: bool = True, use_token_stream: bool = False,
+                 cache_size: int = 0, cache_max_bytes: Optional[int] = None,
+                 cache_by_normalized_sql: bool = False, collect_diagnostics: bool = False,
+                 diagnostics_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 profile_timings: bool = False, profiler: Optional[ParseProfiler] = None,
+                 parse_timeout: Optional[float] = None, cache_path: Optional[str] = None,
+                 schema_registry: Optional[SchemaRegistry] = None):
         """🚀 Initialize AST parser with optional MySQL normalization
         
         Args:
             enable_normalization: Enable MySQL normalization (default: True)
+            use_token_stream: Tokenize once and feed the same token stream to the
+                CTE, JOIN, table and content phases instead of rescanning the
+                SQL string with regexes in every phase (default: False)
+            cache_size: Maximum number of results kept in the LRU result cache
+                (default: 0, cache disabled)
+            cache_max_bytes: Optional limit on the total serialized size of cached results
+            cache_by_normalized_sql: Key the cache on the normalized SQL instead of the
+                raw input, so formatting-only variants share one entry
+            collect_diagnostics: Attach applied rules, validation warnings and phase
+                timings to every result under 'diagnostics' (default: False)
+            diagnostics_callback: Optional callable receiving the diagnostics dict
+                after every parse, whether or not they are attached to the result
+            profile_timings: Attach per-phase wall time and allocated-block counts
+                (normalize, structure.cte/joins/tables, content.fields/where/output, ...) to
+                every result under metadata.timings (default: False)
+            profiler: Optional ParseProfiler aggregating phase timings of every
+                parse into histograms (see core/profiler.py)
+            parse_timeout: Default per-parse time budget in seconds for parse()
+                (default: None, unlimited); see parse(timeout=...)
+            cache_path: SQLite file for a persistent result cache that survives
+                restarts (see core/persistent_cache.py); cache_size and
+                cache_max_bytes then bound it by entries and bytes (0 / None:
+                unbounded)
+            schema_registry: Database names whose `db.` prefixes are stripped from
+                tables, fields and joins (default: the built-in names); see
+                SchemaRegistry.from_file / from_information_schema
         """
+        if parse_timeout is not None and not parse_timeout > 0:
+            raise ValueError("parse_timeout must be a positive number of seconds")
+
         self.parser_id = "sqlsplit"
         self.version = "6.0_ast_complete_normalized"
+        self.use_token_stream = use_token_stream
+        
+        # Options needed to rebuild an equivalent parser (e.g. in batch worker processes)
+        self.parser_options = {
+            "enable_normalization": enable_normalization,
+            "use_token_stream": use_token_stream,
+            "cache_size": cache_size,
+            "cache_max_bytes": cache_max_bytes,
+            "cache_by_normalized_sql": cache_by_normalized_sql,
+            "collect_diagnostics": collect_diagnostics,
+            "profile_timings": profile_timings,
+            "parse_timeout": parse_timeout,
+            "cache_path": cache_path,
+            "schema_registry": schema_registry
+        }
         
-        # Initialize modular components
-        self.tokenizer = SQLTokenizer()
-        self.join_handler = JoinHandler()
-        self.cte_handler = CTEHandler()
-        self.table_extractor = TableExtractor()
-        self.content_extractor = ContentExtractor()
+        # 🗄️ Database names shared by the normalizer and every per-parse handler
+        self.schemas = DEFAULT_SCHEMA_REGISTRY if schema_registry is None else schema_registry
         
         # 🐬 Initialize MySQL normalization functionality (user-controllable)
         self.normalization_enabled = enable_normalization
         if self.normalization_enabled:
-            self.mysql_normalizer = MySQLCompatibleNormalizer()
+            self.mysql_normalizer = MySQLCompatibleNormalizer(schemas=self.schemas)
         else:
             self.mysql_normalizer = None
         
-        # State variables
-        self.table_aliases = {}
-        self.database_name = ""
-        self.detected_databases = set()
+        # 🗄️ Optional LRU result cache (successful results only), in memory or on disk
+        self.cache_by_normalized_sql = cache_by_normalized_sql
+        if cache_path is not None:
+            self.result_cache = PersistentParseCache(cache_path, self._cache_namespace(), cache_max_bytes,
+                                                     cache_size or None)
+        elif cache_size > 0:
+            self.result_cache = ParseCache(cache_size, cache_max_bytes)
+        else:
+            self.result_cache = None
+        
+        # 🩺 Diagnostics channel (no collector is created when both are off)
+        self.collect_diagnostics = collect_diagnostics
+        self.diagnostics_callback = diagnostics_callback
+        self.profile_timings = profile_timings
+        self.profiler = profiler
+        
+        # ⏳ Default per-parse time budget
+        self.parse_timeout = parse_timeout
+
+    def parse(self, sql: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """🚀 Main parse method - Two-phase AST parsing
+        
+        Args:
+            sql: SQL statement to parse
+            timeout: Time budget in seconds for this call (default: the parser's
+                parse_timeout). It is checked at every phase boundary and polled
+                inside the long loops (see core/deadline.py); a parse
+                that runs out returns an error result with "errorType": "timeout"
+                and the budget details under "timeout" instead of raising.
+        """
+        if timeout is None:
+            timeout = self.parse_timeout
+        deadline = ParseDeadline(timeout) if timeout is not None else None
+        
+        if (not self.collect_diagnostics and self.diagnostics_callback is None
+                and not self.profile_timings and self.profiler is None):
+            return self._parse(sql, None, deadline)
+        
+        diagnostics = ParseDiagnostics()
+        result = self._parse(sql, diagnostics, deadline)
+        diagnostics.finish()
+        
+        report = diagnostics.to_dict()
+        if self.collect_diagnostics:
+            result['diagnostics'] = report
+        if self.profile_timings:
+            result.setdefault('metadata', {})['timings'] = diagnostics.phase_report()
+        if self.profiler is not None:
+            self.profiler.record(report, sql)
+        if self.diagnostics_callback is not None:
+            try:
+                self.diagnostics_callback(report)
+            except Exception as e:
+                logger.warning("Diagnostics callback failed: %s", e)
+        
+        return result
 
-    def parse(self, sql: str) -> Dict[str, Any]:
-        """🚀 Main parse method - Two-phase AST parsing"""
+    def _parse(self, sql: str, diagnostics: Optional[ParseDiagnostics],
+               deadline: Optional[ParseDeadline] = None) -> Dict[str, Any]:
+        """Run the parse pipeline, recording into diagnostics when a collector is given"""
         try:
-            # 🔄 Reset state
-            self._reset_state()
+            # 🗄️ Cache lookup on the raw input
+            cache_key = None
+            if self.result_cache is not None and not self.cache_by_normalized_sql:
+                cache_key = self.result_cache.make_key(self._cache_namespace(), sql)
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    if diagnostics is not None:
+                        diagnostics.cache_hit = True
+                    return cached
             
-            # 🚨 FIXED: Store original SQL for fallback WHERE extraction
-            self.original_sql = sql
+            # 🧵 Fresh per-call state
+            ctx = ParseContext(sql, diagnostics, deadline, self.schemas)
             
             # 📝 Normalize SQL
-            normalized_sql = self._normalize_sql(sql)
+            with ctx.phase('normalize'):
+                normalized_sql = self._normalize_sql(sql, diagnostics, deadline)
+            
+            # 🗄️ Cache lookup on the normalized SQL
+            if self.result_cache is not None and self.cache_by_normalized_sql:
+                cache_key = self.result_cache.make_key(self._cache_namespace(), normalized_sql)
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    if diagnostics is not None:
+                        diagnostics.cache_hit = True
+                    return cached
+            
+            # ⚡ Token mode: tokenize exactly once, every phase shares the stream
+            token_stream = None
+            if self.use_token_stream:
+                with ctx.phase('tokenize'):
+                    token_stream = ctx.tokenizer.tokenize_stream(normalized_sql)
             
             # 🎯 PHASE 1: Structure Parsing
-            ast_tree = self._build_ast_tree(normalized_sql)
+            with ctx.phase('structure'):
+                ast_tree = self._build_ast_tree(ctx, normalized_sql, token_stream)
             
             # 🎯 PHASE 2: Content Extraction  
-            result = self._extract_content_from_ast(normalized_sql, ast_tree)
+            with ctx.phase('content'):
+                result = self._extract_content_from_ast(ctx, normalized_sql, ast_tree, token_stream)
+            
+            if cache_key is not None and result.get('success'):
+                self.result_cache.put(cache_key, result)
             
             return result
             
+        except ParseTimeoutError as e:
+            if diagnostics is not None:
+                diagnostics.note(f"Parse timed out: {e}")
+            result = self._create_error_result(str(e))
+            result["errorType"] = "timeout"
+            result["timeout"] = e.to_dict()
+            return result
         except Exception as e:
+            if diagnostics is not None:
+                diagnostics.note(f"Parse failed: {e}")
             return self._create_error_result(str(e))
 
+    def parse_many(self, sqls: Iterable[str], workers: Optional[int] = None,
+                   chunksize: int = 16) -> List[Dict[str, Any]]:
+        """🏭 Parse many statements, fanning out over a process pool
+
+        Results come back in input order. Each worker process holds its own warm
+        parser built with this parser's options; workers=1 parses in-process with
+        this instance (and its cache).
+        """
+        from .batch import parse_sql_batch
+        
+        if workers == 1:
+            return [self.parse(sql) for sql in sqls]
+        return parse_sql_batch(sqls, workers=workers, chunksize=chunksize, **self.parser_options)
+
+    def cache_info(self) -> Dict[str, Any]:
+        """🗄️ Get result cache statistics (hits, misses, evictions, entries, bytes)"""
+        if self.result_cache is None:
+            return {"enabled": False}
+        info = self.result_cache.info()
+        info["enabled"] = True
+        return info
+
+    def clear_cache(self):
+        """🗄️ Drop all cached results and reset cache counters"""
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    def warm_cache(self, max_bytes: Optional[int] = None) -> int:
+        """💾 Preload the persistent cache into memory; returns the number of entries loaded
+
+        Call once at startup before reparsing stored view definitions: unchanged
+        statements are then answered without touching disk. A no-op (0) for the
+        in-memory cache.
+        """
+        if isinstance(self.result_cache, PersistentParseCache):
+            return self.result_cache.warm_load(max_bytes)
+        return 0
+
+    def _cache_namespace(self) -> str:
+        """Parser configuration that changes results, mixed into every cache key"""
+        namespace = f"{self.version}|norm={self.normalization_enabled}|tokens={self.use_token_stream}"
+        if self.schemas != DEFAULT_SCHEMA_REGISTRY:
+            namespace += f"|schemas={self.schemas.fingerprint()}"
+        return namespace
+
     def parse_to_json(self, sql: str, indent: int = 2) -> str:
         """Parse SQL and return formatted JSON string"""
         result = self.parse(sql)
         return json.dumps(result, indent=indent, ensure_ascii=False)
 
-    def _build_ast_tree(self, sql: str) -> QueryNode:
-        """🎯 PHASE 1: Build AST tree from SQL"""
+    def _build_ast_tree(self, ctx: ParseContext, sql: str,
+                        token_stream: Optional[TokenStream] = None) -> QueryNode:
+        """🎯 PHASE 1: Build AST tree from SQL (or from a shared token stream)"""
         
         # 🔧 FIXED: Store normalized SQL for later use in extraction methods
-        self.normalized_sql = sql
+        ctx.normalized_sql = sql
         
         # Create main query node
         query_node = QueryNode()
         
         # 1️⃣ Parse CTE (WITH clause) first
-        with_node, cte_tables, referenced_tables = parse_cte_from_sql(sql)
+        with ctx.phase('structure.cte'):
+            if token_stream is not None:
+                token_stream.reset()
+                with_node = ctx.cte_handler.parse_cte_from_tokens(token_stream)
+                cte_tables = ctx.cte_handler.get_all_cte_tables()
+            else:
+                with_node, cte_tables, referenced_tables = parse_cte_from_sql(sql)
         if with_node:
             query_node.set_with_clause(with_node)
             # Store CTE information
             for cte_name in cte_tables:
-                self.table_aliases[cte_name] = cte_name
+                ctx.table_aliases[cte_name] = cte_name
         
         # 2️⃣ Parse JOINs (complex nested patterns) - FIXED: Collect aliases immediately
-        joins, join_aliases = parse_joins_from_sql(sql)
-        self.table_aliases.update(join_aliases)
+        with ctx.phase('structure.joins'):
+            if token_stream is not None:
+                token_stream.reset()
+                joins = ctx.join_handler.parse_joins_from_tokens(token_stream)
+                join_aliases = ctx.join_handler.table_aliases
+            else:
+                # The stream is kept on the context; WHERE splitting reuses it
+                ctx.sql_tokens = ctx.tokenizer.tokenize_stream(sql)
+                joins = ctx.join_handler.parse_joins_from_tokens(ctx.sql_tokens)
+                join_aliases = ctx.join_handler.table_aliases
+        ctx.table_aliases.update(join_aliases)
         for join in joins:
             query_node.add_join(join)
         
         # 3️⃣ Extract all tables (comprehensive detection) - FIXED: Collect aliases immediately  
         all_cte_tables = cte_tables if cte_tables else set()
-        tables, table_aliases = extract_all_tables_from_sql(sql, all_cte_tables)
-        self.table_aliases.update(table_aliases)
+        with ctx.phase('structure.tables'):
+            if token_stream is not None:
+                token_stream.reset()
+                tables, table_aliases = ctx.table_extractor.extract_tables_from_tokens(token_stream, all_cte_tables)
+            else:
+                tables, table_aliases = ctx.table_extractor.extract_all_tables(sql, all_cte_tables)
+        ctx.table_aliases.update(table_aliases)
         
         # 🔧 FIXED: Store extracted tables and joins for direct access
-        self.extracted_tables = list(tables) if tables else []
-        self.extracted_joins = joins if joins else []
+        ctx.extracted_tables = list(tables) if tables else []
+        ctx.extracted_joins = joins if joins else []
         
         # 4️⃣ Create FROM clause node
         if tables:
             from_node = FromNode()
+            aliases_by_table = self._aliases_by_table(ctx)
             for table_name in tables:
                 # Skip CTE tables from FROM clause (they're in WITH)
                 if table_name not in all_cte_tables:
-                    alias = self._find_alias_for_table(table_name)
+                    alias = aliases_by_table.get(table_name)
                     table_ref = create_table_reference(table_name, alias)
                     from_node.add_table_reference(table_ref)
             
@@ -135,72 +403,91 @@ class SQLParserAST:
         
         return query_node
 
-    def _extract_content_from_ast(self, sql: str, ast_tree: QueryNode) -> Dict[str, Any]:
+    def _extract_content_from_ast(self, ctx: ParseContext, sql: str, ast_tree: QueryNode,
+                                  token_stream: Optional[TokenStream] = None) -> Dict[str, Any]:
         """🎯 PHASE 2: Extract content from AST for expect.md compliance"""
         
         # 🔧 FIXED: Set context for content extractor with complete table aliases
-        self.content_extractor.set_context(
-            self.table_aliases, 
-            self.database_name, 
-            self.detected_databases
+        ctx.content_extractor.set_context(
+            ctx.table_aliases, 
+            ctx.database_name, 
+            ctx.detected_databases
         )
         
         # Extract all components
-        group_by_fields = self.content_extractor.extract_group_by_fields(sql)
-        fields = self.content_extractor.extract_fields(sql, group_by_fields)
-        where_conditions = self.content_extractor.extract_where_conditions(sql)
-        
-        # 🚨 FIXED: Ensure WHERE conditions are extracted from original SQL if normalization affects them
-        if not where_conditions and hasattr(self, 'original_sql'):
-            # Try extracting from original SQL if normalized version failed
-            where_conditions = self.content_extractor.extract_where_conditions(self.original_sql)
-        
-        # 🚨 ADDITIONAL FIX: Direct WHERE extraction if content_extractor fails
-        if not where_conditions:
-            # Manual WHERE extraction as fallback
-            where_pattern = r'\bWHERE\s+(.*?)(?=\s+(?:GROUP\s+BY|ORDER\s+BY|HAVING|LIMIT|$))'
-            where_match = re.search(where_pattern, sql, re.IGNORECASE | re.DOTALL)
-            if where_match:
-                where_clause = where_match.group(1).strip()
-                if where_clause:
-                    where_conditions = [where_clause]
+        if token_stream is not None:
+            # ⚡ Clause boundaries are located once and shared by every content pass
+            with ctx.phase('content.clauses'):
+                clause_spans = ctx.content_extractor.find_clause_spans(token_stream)
+            with ctx.phase('content.group_by'):
+                group_by_fields = ctx.content_extractor.extract_group_by_fields_from_tokens(token_stream, clause_spans)
+            with ctx.phase('content.fields'):
+                fields = ctx.content_extractor.extract_fields_from_tokens(token_stream, group_by_fields, clause_spans)
+            with ctx.phase('content.where'):
+                where_node = ctx.content_extractor.extract_where_clause_from_tokens(token_stream, clause_spans)
+        else:
+            with ctx.phase('content.group_by'):
+                group_by_fields = ctx.content_extractor.extract_group_by_fields(sql)
+            with ctx.phase('content.fields'):
+                fields = ctx.content_extractor.extract_fields(sql, group_by_fields)
+            with ctx.phase('content.where'):
+                # 🌳 WHERE is split on tokens in both modes (depth-0 AND/OR, strings and groups intact)
+                sql_tokens = ctx.sql_tokens or ctx.tokenizer.tokenize_stream(sql)
+                where_node = ctx.content_extractor.extract_where_clause_from_tokens(sql_tokens)
+
+        if where_node is None and ctx.sql != sql and 'WHERE' in ctx.sql.upper():
+            # 🚨 Normalization turns comma joins into JOIN ... ON and can move the whole
+            # WHERE clause into the ON condition; report it from the original SQL
+            with ctx.phase('content.where'):
+                where_node = ctx.content_extractor.extract_where_clause(ctx.sql)
+
+        where_conditions = []
+        if where_node is not None:
+            ast_tree.set_where_clause(where_node)
+            where_conditions = where_node.condition_texts()
         
         # 🔧 FIXED: Update field table associations with correct aliases
-        for field in fields:
-            if not field.get('table') and field.get('field'):
-                # Try to determine table from field expression
-                field_expr = field['field']
-                for alias, table_name in self.table_aliases.items():
-                    if f'{alias}.' in field_expr or f'`{alias}`.' in field_expr:
-                        clean_table = self._remove_db_prefix_context_aware(table_name, "field_reference")
-                        if clean_table and self._is_valid_table_name(clean_table):
-                            field['table'] = clean_table
-                            break
-        
-        # 🎯 Extract tables from AST
-        tables = self._extract_tables_from_ast(ast_tree)
-        
-        # 🎯 Extract JOINs from AST  
-        joins = self._extract_joins_from_ast(ast_tree)
+        with ctx.phase('content.field_tables'):
+            for field in fields:
+                if not field.get('table') and field.get('field'):
+                    # Try to determine table from field expression
+                    field_expr = field['field']
+                    for alias, table_name in ctx.table_aliases.items():
+                        if f'{alias}.' in field_expr or f'`{alias}`.' in field_expr:
+                            clean_table = self._remove_db_prefix_context_aware(table_name, "field_reference")
+                            if clean_table and self._is_valid_table_name(clean_table):
+                                field['table'] = clean_table
+                                break
+        
+        with ctx.phase('content.ast'):
+            # 🎯 Extract tables from AST
+            tables = self._extract_tables_from_ast(ctx, ast_tree)
+            
+            # 🎯 Extract JOINs from AST  
+            joins = self._extract_joins_from_ast(ctx, ast_tree)
         
         # 🚨 FIXED: Use ContentExtractor's create_expect_md_output for correct aggregation
-        return self.content_extractor.create_expect_md_output(
-            tables, joins, fields, where_conditions
-        )
+        with ctx.phase('content.output'):
+            return ctx.content_extractor.create_expect_md_output(
+                tables, joins, fields, where_conditions
+            )
 
-    def _extract_tables_from_ast(self, ast_tree: QueryNode) -> List[str]:
+    def _extract_tables_from_ast(self, ctx: ParseContext, ast_tree: QueryNode) -> List[str]:
         """🎯 Context-aware table extraction from AST tree - FIXED for direct extraction"""
         tables = set()
         
         # 🔧 FIXED: Use extracted_tables as primary source since they're correctly detected
-        if hasattr(self, 'extracted_tables') and self.extracted_tables:
-            for table_name in self.extracted_tables:
+        deadline = ctx.deadline
+        if ctx.extracted_tables:
+            for table_name in ctx.extracted_tables:
+                if deadline is not None:
+                    deadline.poll()
                 clean_table = self._remove_db_prefix_context_aware(table_name, "table_reference")
                 if clean_table and self._is_valid_table_name(clean_table):
                     tables.add(clean_table)
         
         # 🔧 FIXED: Use table_aliases as secondary source since they contain all discovered tables
-        for alias, table_name in self.table_aliases.items():
+        for alias, table_name in ctx.table_aliases.items():
             clean_table = self._remove_db_prefix_context_aware(table_name, "table_reference")
             if clean_table and self._is_valid_table_name(clean_table):
                 tables.add(clean_table)
@@ -225,13 +512,15 @@ class SQLParserAST:
         # 🎯 Apply context-aware final cleaning
         return self._clean_table_list_context_aware(list(tables), "table_reference")
 
-    def _extract_joins_from_ast(self, ast_tree: QueryNode) -> List[Dict[str, Any]]:
+    def _extract_joins_from_ast(self, ctx: ParseContext, ast_tree: QueryNode) -> List[Dict[str, Any]]:
         """🎯 Context-aware JOIN extraction from AST tree - FIXED for direct extraction"""
         joins = []
         
         # 🔧 FIXED: Use extracted_joins as primary source since join_handler works correctly
-        if hasattr(self, 'extracted_joins') and self.extracted_joins:
-            for join in self.extracted_joins:
+        if ctx.extracted_joins:
+            for join in ctx.extracted_joins:
+                if ctx.deadline is not None:
+                    ctx.deadline.poll()
                 # Apply context-aware DB prefix removal to table name
                 clean_right_table = self._remove_db_prefix_context_aware(join.table_reference.table_name, "table_reference")
                 
@@ -244,17 +533,17 @@ class SQLParserAST:
                     # If left_table is empty, try to infer from context or use placeholder
                     if not left_table:
                         # Look for first table in aliases or use main table
-                        if self.table_aliases:
+                        if ctx.table_aliases:
                             # Use the first non-right table as left table
-                            for alias, table_name in self.table_aliases.items():
+                            for alias, table_name in ctx.table_aliases.items():
                                 clean_left = self._remove_db_prefix_context_aware(table_name, "table_reference")
                                 if clean_left != clean_right_table and self._is_valid_table_name(clean_left):
                                     left_table = clean_left
                                     break
                         
                         # Fallback to extracted tables
-                        if not left_table and hasattr(self, 'extracted_tables'):
-                            for table in self.extracted_tables:
+                        if not left_table:
+                            for table in ctx.extracted_tables:
                                 clean_left = self._remove_db_prefix_context_aware(table, "table_reference")
                                 if clean_left != clean_right_table and self._is_valid_table_name(clean_left):
                                     left_table = clean_left
@@ -300,9 +589,7 @@ class SQLParserAST:
         
         # Pattern to extract table.field = table.field from JOIN conditions
         # Handles patterns like: (`mt_item`.`Details_OrderID` = `mv_order`.`OrderID`)
-        condition_pattern = r'\(\s*`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*=\s*`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\)'
-        
-        match = re.search(condition_pattern, condition)
+        match = _PARENTHESIZED_EQUI_JOIN.search(condition)
         if match:
             left_table = self._remove_db_prefix_context_aware(match.group(1), "table_reference")
             left_field = match.group(2)
@@ -312,9 +599,7 @@ class SQLParserAST:
             return left_table, left_field, right_field, clean_condition
         
         # Fallback: Try simpler pattern without parentheses
-        simple_pattern = r'`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*=\s*`?([a-zA-Z_][a-zA-Z0-9_]*)`?\.`?([a-zA-Z_][a-zA-Z0-9_]*)`?'
-        
-        simple_match = re.search(simple_pattern, condition)
+        simple_match = _EQUI_JOIN.search(condition)
         if simple_match:
             left_table = self._remove_db_prefix_context_aware(simple_match.group(1), "table_reference")
             left_field = simple_match.group(2)
@@ -326,42 +611,45 @@ class SQLParserAST:
         # If no pattern matches, return empty values
         return "", "", "", clean_condition
 
-    def _find_alias_for_table(self, table_name: str) -> Optional[str]:
-        """Find alias for table name"""
-        for alias, actual_table in self.table_aliases.items():
-            if actual_table == table_name and alias != table_name:
-                return alias
-        return None
+    def _aliases_by_table(self, ctx: ParseContext) -> Dict[str, str]:
+        """First alias of every aliased table (one pass instead of a scan per table)"""
+        aliases = {}
+        for alias, actual_table in ctx.table_aliases.items():
+            if alias != actual_table:
+                aliases.setdefault(actual_table, alias)
+        return aliases
 
-    def _normalize_sql(self, sql: str) -> str:
+    def _normalize_sql(self, sql: str, diagnostics: Optional[ParseDiagnostics] = None,
+                       deadline: Optional[ParseDeadline] = None) -> str:
         """🐬 Normalize SQL for parsing with MySQL compatibility"""
         if not self.normalization_enabled:
             # Basic normalization only
             sql = sql.strip()
             sql = sql.replace('&lt;', '<').replace('&gt;', '>')
-            sql = re.sub(r'\s+', ' ', sql)
+            sql = _WHITESPACE_RUN.sub(' ', sql)
             return sql
         
         try:
             # 🐬 Use integrated MySQL-compatible normalization
-            normalized_sql, applied_rules, validation_errors = self.mysql_normalizer.normalize_query(sql)
-            
-            # Log normalization for debugging
-            if applied_rules:
-                print(f"🐬 Applied {len(applied_rules)} MySQL normalization rules")
+            normalized_sql, applied_rules, validation_errors = self.mysql_normalizer.normalize_query(sql, deadline)
             
-            if validation_errors:
-                print(f"⚠️ MySQL validation warnings: {len(validation_errors)}")
-                # Continue with normalized SQL even if there are warnings
+            # Record normalization for debugging (continue even if there are warnings)
+            if diagnostics is not None:
+                diagnostics.applied_rules.extend(applied_rules)
+                diagnostics.validation_warnings.extend(validation_errors)
             
             return normalized_sql
             
+        except ParseTimeoutError:
+            raise
         except Exception as e:
-            print(f"⚠️ MySQL normalization failed: {e}, using basic normalization")
+            logger.warning("MySQL normalization failed: %s, using basic normalization", e)
+            if diagnostics is not None:
+                diagnostics.note(f"MySQL normalization failed: {e}")
             # Fallback to basic normalization
             sql = sql.strip()
             sql = sql.replace('&lt;', '<').replace('&gt;', '>')
-            sql = re.sub(r'\s+', ' ', sql)
+            sql = _WHITESPACE_RUN.sub(' ', sql)
             return sql
 
     def _is_valid_table_name(self, name: str) -> bool:
@@ -379,17 +667,6 @@ class SQLParserAST:
         
         return True
 
-    def _reset_state(self):
-        """Reset parser state"""
-        self.table_aliases.clear()
-        self.database_name = ""
-        self.detected_databases.clear()
-        
-        # Reset component states
-        self.join_handler.reset()
-        self.cte_handler.reset()
-        self.table_extractor.reset()
-
     def _remove_db_prefix_context_aware(self, identifier: str, context: str = "unknown") -> str:
         """🎯 Context-aware database prefix removal
         
@@ -415,7 +692,7 @@ class SQLParserAST:
                 return str(identifier) if identifier is not None else ""
         
         # Known database names that could appear as prefixes
-        known_databases = {'momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db'}
+        known_databases = self.schemas.names
         
         if '.' in identifier:
             # Pattern: prefix.suffix (e.g., momo.mt_item, table.field)
@@ -498,47 +775,37 @@ class SQLParserAST:
         if not isinstance(condition, str):
             condition = str(condition) if condition is not None else ""
         
-        import re
-        
-        # Pattern to match DB.table.field or DB.table references
-        known_databases = ['momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db']
-        db_pattern = '|'.join(re.escape(db) for db in known_databases)
-        
-        # Enhanced patterns for comprehensive database prefix removal
-        patterns = [
-            # DB.table.field pattern
-            rf'\b({db_pattern})\.([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*)\b',
-            # DB.table pattern (most common)
-            rf'\b({db_pattern})\.([a-zA-Z_][a-zA-Z0-9_]*)\b',
-            # JOIN DB.table pattern (specifically for JOIN clauses)
-            rf'\b(JOIN\s+)({db_pattern})\.([a-zA-Z_][a-zA-Z0-9_]*)\b',
-            # LEFT/RIGHT/INNER JOIN DB.table patterns
-            rf'\b((?:LEFT|RIGHT|INNER|OUTER|FULL)\s+JOIN\s+)({db_pattern})\.([a-zA-Z_][a-zA-Z0-9_]*)\b'
-        ]
-        
         cleaned_condition = condition
         
-        # Apply all patterns for comprehensive cleaning
-        for pattern in patterns:
-            if 'JOIN\\s+' in pattern:
-                # For JOIN patterns, keep the JOIN keyword but remove DB prefix
-                def replace_join_match(match):
-                    if len(match.groups()) == 3:  # JOIN DB.table
-                        return match.group(1) + match.group(3)  # JOIN + table
-                    elif len(match.groups()) == 4:  # LEFT JOIN DB.table
-                        return match.group(1) + match.group(4)  # LEFT JOIN + table
-                    return match.group(0)
-                
-                cleaned_condition = re.sub(pattern, replace_join_match, cleaned_condition, flags=re.IGNORECASE)
-            else:
-                # For field/table patterns, remove DB prefix
-                def replace_match(match):
-                    return match.group(2)  # Just the table.field or table part
-                
-                cleaned_condition = re.sub(pattern, replace_match, cleaned_condition, flags=re.IGNORECASE)
+        # Apply all patterns for comprehensive cleaning (JOIN patterns keep the JOIN keyword)
+        for pattern in _DB_PREFIX_CLEANUP_PATTERNS:
+            cleaned_condition = self._strip_database_prefixes(pattern, cleaned_condition)
         return cleaned_condition
 
-    def _create_enhanced_visualization_output(self, tables: List[str], joins: List[Dict[str, Any]], 
+    def _strip_database_prefixes(self, pattern, text: str) -> str:
+        """pattern.sub() keeping lead + rest, for matches whose candidate is a registered database
+
+        A rejected candidate is a whole word run, so the search resumes one
+        character later, exactly as a pattern with the names spelled out would.
+        """
+        pieces = []
+        copied = position = 0
+        while True:
+            match = pattern.search(text, position)
+            if match is None:
+                break
+            if self.schemas.contains_ignore_case(match.group(2)):
+                pieces.append(text[copied:match.start()])
+                pieces.append(match.group(1) + match.group(3))
+                copied = position = match.end()
+            else:
+                position = match.start() + 1
+        if not pieces:
+            return text
+        pieces.append(text[copied:])
+        return ''.join(pieces)
+
+    def _create_enhanced_visualization_output(self, ctx: ParseContext, tables: List[str], joins: List[Dict[str, Any]], 
                                             fields: List[Dict[str, Any]], where_conditions: List[str], 
                                             sql: str) -> Dict[str, Any]:
         """🎨 Create enhanced JSON output for SQL visualization components
@@ -550,6 +817,7 @@ class SQLParserAST:
         - metadata with aliasMapping and unresolved items
         
         Args:
+            ctx: State of the parse in progress (table aliases)
             tables: List of table names
             joins: List of JOIN information
             fields: List of field information
@@ -567,7 +835,7 @@ class SQLParserAST:
         unresolved_fields = []
         
         for field in fields:
-            enhanced_field = self._enhance_field_for_visualization(field, tables, sql)
+            enhanced_field = self._enhance_field_for_visualization(ctx, field, tables, sql)
             enhanced_fields.append(enhanced_field)
             
             # Track field categories for metadata
@@ -583,11 +851,11 @@ class SQLParserAST:
         
         # Create metadata section
         metadata = {
-            "aliasMapping": dict(self.table_aliases),
+            "aliasMapping": dict(ctx.table_aliases),
             "aggregationFields": aggregation_fields,
             "computedFields": computed_fields,
             "unresolved": {
-                "aliases": self._get_unresolved_aliases(sql),
+                "aliases": self._get_unresolved_aliases(ctx, sql),
                 "fields": unresolved_fields
             }
         }
@@ -605,12 +873,13 @@ class SQLParserAST:
         
         return result
 
-    def _enhance_field_for_visualization(self, field: Dict[str, Any], tables: List[str], sql: str) -> Dict[str, Any]:
+    def _enhance_field_for_visualization(self, ctx: ParseContext, field: Dict[str, Any], tables: List[str], sql: str) -> Dict[str, Any]:
         """🎨 Enhance individual field with visualization attributes
         
         Determines fieldType and adds relevant metadata for visualization components.
         
         Args:
+            ctx: State of the parse in progress
             field: Original field dictionary
             tables: List of available tables
             sql: Original SQL for context analysis
@@ -624,7 +893,7 @@ class SQLParserAST:
         field_alias = field.get('alias', '')
         
         # Determine field type based on content analysis
-        field_type, aggregation_scope, involved_tables = self._analyze_field_type(field_name, tables, sql)
+        field_type, aggregation_scope, involved_tables = self._analyze_field_type(ctx, field_name, tables, sql)
         
         # Create enhanced field dictionary
         enhanced_field = {
@@ -650,7 +919,7 @@ class SQLParserAST:
         
         return enhanced_field
 
-    def _analyze_field_type(self, field_name: str, tables: List[str], sql: str) -> Tuple[str, Optional[List[str]], Optional[List[str]]]:
+    def _analyze_field_type(self, ctx: ParseContext, field_name: str, tables: List[str], sql: str) -> Tuple[str, Optional[List[str]], Optional[List[str]]]:
         """🔍 Analyze field to determine type and scope for visualization
         
         Returns:
@@ -663,38 +932,21 @@ class SQLParserAST:
         field_upper = field_name.upper()
         
         # Check for aggregation functions
-        aggregation_patterns = [
-            r'\bCOUNT\s*\(',
-            r'\bSUM\s*\(',
-            r'\bAVG\s*\(',
-            r'\bMIN\s*\(',
-            r'\bMAX\s*\(',
-            r'\bGROUP_CONCAT\s*\(',
-        ]
-        
-        for pattern in aggregation_patterns:
-            if re.search(pattern, field_upper):
+        for pattern in _AGGREGATION_CALL_PATTERNS:
+            if pattern.search(field_upper):
                 # This is an aggregation function
                 if 'COUNT(*)' in field_upper:
                     # COUNT(*) involves all tables in FROM clause
                     return "aggregation", tables.copy() if tables else None, tables.copy() if tables else None
                 else:
                     # Other aggregations - try to determine involved tables
-                    involved = self._extract_tables_from_expression(field_name, tables)
+                    involved = self._extract_tables_from_expression(ctx, field_name, tables)
                     return "aggregation", involved, involved
         
         # Check for window functions
-        window_patterns = [
-            r'\bROW_NUMBER\s*\(\s*\)\s+OVER\s*\(',
-            r'\bRANK\s*\(\s*\)\s+OVER\s*\(',
-            r'\bDENSE_RANK\s*\(\s*\)\s+OVER\s*\(',
-            r'\bLEAD\s*\(',
-            r'\bLAG\s*\(',
-        ]
-        
-        for pattern in window_patterns:
-            if re.search(pattern, field_upper):
-                involved = self._extract_tables_from_expression(field_name, tables)
+        for pattern in _WINDOW_CALL_PATTERNS:
+            if pattern.search(field_upper):
+                involved = self._extract_tables_from_expression(ctx, field_name, tables)
                 return "expression", None, involved
         
         # Check for complex expressions
@@ -705,17 +957,18 @@ class SQLParserAST:
         ]
         
         if any(indicator in field_upper for indicator in expression_indicators):
-            involved = self._extract_tables_from_expression(field_name, tables)
+            involved = self._extract_tables_from_expression(ctx, field_name, tables)
             field_type = "computed" if any(op in field_upper for op in ['CASE', 'IF(']) else "expression"
             return field_type, None, involved
         
         # Default: simple column
         return "column", None, None
 
-    def _extract_tables_from_expression(self, expression: str, available_tables: List[str]) -> List[str]:
+    def _extract_tables_from_expression(self, ctx: ParseContext, expression: str, available_tables: List[str]) -> List[str]:
         """🔍 Extract table references from a complex expression
         
         Args:
+            ctx: State of the parse in progress (table aliases)
             expression: The field expression to analyze
             available_tables: List of available table names
         
@@ -726,28 +979,28 @@ class SQLParserAST:
         involved_tables = set()
         
         # Look for table.field patterns in the expression
-        table_field_pattern = r'\b([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\b'
-        matches = re.findall(table_field_pattern, expression)
+        matches = _TABLE_FIELD_REFERENCE.findall(expression)
         
         for table_name, field_name in matches:
             # Check if this is a known table or alias
             clean_table = self._remove_db_prefix_context_aware(table_name, "field_reference")
             if clean_table in available_tables:
                 involved_tables.add(clean_table)
-            elif table_name in self.table_aliases:
-                resolved_table = self.table_aliases[table_name]
+            elif table_name in ctx.table_aliases:
+                resolved_table = ctx.table_aliases[table_name]
                 clean_resolved = self._remove_db_prefix_context_aware(resolved_table, "field_reference")
                 if clean_resolved in available_tables:
                     involved_tables.add(clean_resolved)
         
         return list(involved_tables) if involved_tables else None
 
-    def _get_unresolved_aliases(self, sql: str) -> List[str]:
+    def _get_unresolved_aliases(self, ctx: ParseContext, sql: str) -> List[str]:
         """🔍 Get list of aliases that couldn't be mapped to tables
         
         This helps with debugging and provides transparency for visualization components.
         
         Args:
+            ctx: State of the parse in progress (table aliases)
             sql: Original SQL to analyze
         
         Returns:
@@ -757,12 +1010,11 @@ class SQLParserAST:
         unresolved = []
         
         # Extract all potential aliases from SQL
-        alias_pattern = r'\b([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\b'
-        matches = re.findall(alias_pattern, sql)
+        matches = _TABLE_FIELD_REFERENCE.findall(sql)
         
         for potential_alias, field_name in matches:
             # Check if this alias is known
-            if potential_alias not in self.table_aliases and potential_alias not in ['SELECT', 'FROM', 'WHERE', 'JOIN']:
+            if potential_alias not in ctx.table_aliases and potential_alias not in ['SELECT', 'FROM', 'WHERE', 'JOIN']:
                 # This might be an unresolved alias
                 if potential_alias not in unresolved:
                     unresolved.append(potential_alias)
@@ -804,16 +1056,34 @@ class SQLParserAST:
 SQLSplitParser = SQLParserAST
 SQLSplitParserProduction = SQLParserAST
 
+# 🎯 Process-wide parsers behind the convenience functions (one per mode, built on first use)
+_shared_parsers: Dict[bool, SQLParserAST] = {}
+_shared_parsers_lock = threading.Lock()
+
+
+def _get_shared_parser(use_token_stream: bool = False) -> SQLParserAST:
+    """Shared parser of the convenience functions (safe to use from any thread)"""
+    parser = _shared_parsers.get(use_token_stream)
+    if parser is None:
+        with _shared_parsers_lock:
+            parser = _shared_parsers.get(use_token_stream)
+            if parser is None:
+                parser = _shared_parsers[use_token_stream] = SQLParserAST(use_token_stream=use_token_stream)
+    return parser
+
 # 🎯 Convenience functions
-def parse_sql(sql: str) -> Dict[str, Any]:
+def parse_sql(sql: str, use_token_stream: bool = False) -> Dict[str, Any]:
     """Parse SQL and return expect.md compliant result"""
-    parser = SQLParserAST()
-    return parser.parse(sql)
+    return _get_shared_parser(use_token_stream).parse(sql)
 
 def parse_sql_to_json(sql: str, indent: int = 2) -> str:
     """Parse SQL and return formatted JSON string"""
-    parser = SQLParserAST()
-    return parser.parse_to_json(sql, indent)
+    return _get_shared_parser().parse_to_json(sql, indent)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """🖥️ `sql-splitter` console entry point (see core/cli.py)"""
+    from .cli import main as cli_main
+    return cli_main(argv)
 
 # 📊 Module metadata
 __version__ = "6.0_ast_complete"
@@ -10,10 +10,15 @@ Status: ✅ Context-aware SQL tokenization for AST parsing
 """
 
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from array import array
+from bisect import bisect_right
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator, FrozenSet
 from dataclasses import dataclass
 from enum import Enum
 
+from .regex_registry import regex
+from .deadline import ParseDeadline
+
 class TokenType(Enum):
     """SQL token types"""
     KEYWORD = "KEYWORD"
@@ -43,6 +48,125 @@ class Token:
     def __repr__(self):
         return f"Token({self.type.name}, '{self.value}', {self.position})"
 
+# 🧱 Lexical building blocks (shared with the statement splitter)
+# MySQL only reads `--` as a comment when whitespace or a control character
+# (or the end of input) follows it: `5--3` is 5 - (-3)
+LINE_COMMENT_PATTERN = r'--(?![^\x00-\x20])[^\n]*'
+BLOCK_COMMENT_PATTERN = r'/\*.*?(?:\*/|\Z)'
+QUOTED_IDENTIFIER_PATTERN = r'`[^`]*`?'
+STRING_LITERAL_PATTERN = r''''(?:[^'\\]|\\.|'')*'?|"(?:[^"\\]|\\.|"")*"?'''
+
+# 🔪 Master scanner: one alternation, tried left to right at every position
+_TOKEN_PATTERN = regex(r"""
+    (?P<whitespace>\s+)
+  | (?P<line_comment>""" + LINE_COMMENT_PATTERN + r""")
+  | (?P<block_comment>""" + BLOCK_COMMENT_PATTERN + r""")
+  | (?P<quoted>""" + QUOTED_IDENTIFIER_PATTERN + r""")
+  | (?P<string>""" + STRING_LITERAL_PATTERN + r""")
+  | (?P<number>\d[\d.]*)
+  | (?P<paren_open>\()
+  | (?P<paren_close>\))
+  | (?P<comma>,)
+  | (?P<operator>[=!<>][=<>]|[=!<>+\-*/%])
+  | (?P<punctuation>[.;])
+  | (?P<word>[^\W\d]\w*)
+  | (?P<other>.)
+""", re.VERBOSE | re.DOTALL, 'tokenizer.master_scanner')
+
+_CALL_LOOKAHEAD = regex(r'\s*\(', 0, 'tokenizer.call_lookahead')
+
+_TOKEN_KINDS = {
+    'line_comment': TokenType.COMMENT,
+    'block_comment': TokenType.COMMENT,
+    'quoted': TokenType.QUOTED_IDENTIFIER,
+    'string': TokenType.STRING_LITERAL,
+    'number': TokenType.NUMBER,
+    'paren_open': TokenType.PAREN_OPEN,
+    'paren_close': TokenType.PAREN_CLOSE,
+    'comma': TokenType.COMMA,
+    'operator': TokenType.OPERATOR,
+    'punctuation': TokenType.PUNCTUATION,
+    'other': TokenType.PUNCTUATION,
+}
+
+# 🗜️ Integer type codes for the compact token columns
+TOKEN_TYPES = tuple(TokenType)
+TOKEN_TYPE_CODES = {token_type: code for code, token_type in enumerate(TOKEN_TYPES)}
+_UPPERCASED_CODES = frozenset((TOKEN_TYPE_CODES[TokenType.KEYWORD], TOKEN_TYPE_CODES[TokenType.FUNCTION]))
+_COMMENT_CODE = TOKEN_TYPE_CODES[TokenType.COMMENT]
+_KIND_CODES = {kind: TOKEN_TYPE_CODES[token_type] for kind, token_type in _TOKEN_KINDS.items()}
+
+
+class CompactTokens:
+    """🗜️ Tokens stored as parallel array('i') columns over the scanned text
+
+    Holds one type code and the start/end offsets per token instead of one Token
+    object each. Values are sliced from the source on demand (keywords and
+    functions uppercased, as tokenize() does); indexing or iterating
+    materializes ordinary Token objects, so it can stand in for a token list.
+    """
+    __slots__ = ('source', 'types', 'starts', 'ends', '_line_starts')
+
+    def __init__(self, source: str, types: array = None, starts: array = None, ends: array = None):
+        self.source = source
+        self.types = types if types is not None else array('i')
+        self.starts = starts if starts is not None else array('i')
+        self.ends = ends if ends is not None else array('i')
+        self._line_starts = None
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Token, List[Token]]:
+        if isinstance(index, slice):
+            return [self._token(i) for i in range(*index.indices(len(self.types)))]
+        if index < 0:
+            index += len(self.types)
+        return self._token(index)
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.types)):
+            yield self._token(index)
+
+    def type_at(self, index: int) -> TokenType:
+        """Token type without materializing the token"""
+        return TOKEN_TYPES[self.types[index]]
+
+    def value_at(self, index: int) -> str:
+        """Token value sliced from the source"""
+        value = self.source[self.starts[index]:self.ends[index]]
+        return value.upper() if self.types[index] in _UPPERCASED_CODES else value
+
+    def line_column(self, position: int) -> Tuple[int, int]:
+        """1-based line and column of a source offset"""
+        if self._line_starts is None:
+            line_starts = array('i', [0])
+            newline = self.source.find('\n')
+            while newline != -1:
+                line_starts.append(newline + 1)
+                newline = self.source.find('\n', newline + 1)
+            self._line_starts = line_starts
+        line = bisect_right(self._line_starts, position)
+        return line, position - self._line_starts[line - 1] + 1
+
+    def without_comments(self) -> 'CompactTokens':
+        """Copy of the columns with COMMENT tokens dropped (whitespace is never stored)"""
+        types = self.types
+        if _COMMENT_CODE not in types:
+            return self
+        keep = [index for index, code in enumerate(types) if code != _COMMENT_CODE]
+        return CompactTokens(self.source, array('i', [types[i] for i in keep]),
+                             array('i', [self.starts[i] for i in keep]), array('i', [self.ends[i] for i in keep]))
+
+    def _token(self, index: int) -> Token:
+        position = self.starts[index]
+        line, column = self.line_column(position)
+        return Token(type=TOKEN_TYPES[self.types[index]], value=self.value_at(index),
+                     position=position, line=line, column=column)
+
+    def __repr__(self):
+        return f"CompactTokens({len(self.types)} tokens)"
+
 class SQLTokenizer:
     """Advanced SQL tokenizer with context awareness"""
 
@@ -69,154 +193,105 @@ class SQLTokenizer:
         'AND', 'OR', 'NOT', 'LIKE', 'IN', 'BETWEEN', 'IS', 'EXISTS'
     }
 
-    def __init__(self):
+    def __init__(self, deadline: Optional[ParseDeadline] = None):
         self.tokens = []
         self.position = 0
         self.line = 1
         self.column = 1
+        # Time budget of the parse call, polled once per token
+        self.deadline = deadline
 
     def tokenize(self, sql: str) -> List[Token]:
-        """Tokenize SQL string into tokens"""
+        """Tokenize SQL string into tokens in a single scan"""
         self.tokens = []
         self.position = 0
         self.line = 1
         self.column = 1
 
         sql = self._normalize_sql(sql)
-        i = 0
-
-        while i < len(sql):
-            char = sql[i]
-
-            # Skip whitespace but track position
-            if char.isspace():
-                if char == '\n':
-                    self.line += 1
-                    self.column = 1
+        line_start = 0
+        deadline = self.deadline
+
+        for match in _TOKEN_PATTERN.finditer(sql):
+            if deadline is not None:
+                deadline.poll()
+            kind = match.lastgroup
+            start = match.start()
+            text = match.group()
+            self.column = start - line_start + 1
+
+            if kind == 'word':
+                token_type = self._word_type(sql, text, match.end())
+                if token_type is TokenType.IDENTIFIER:
+                    self._add_token(token_type, text, start)
                 else:
-                    self.column += 1
-                i += 1
-                continue
-
-            # Handle comments
-            if char == '-' and i + 1 < len(sql) and sql[i + 1] == '-':
-                comment_start = i
-                while i < len(sql) and sql[i] != '\n':
-                    i += 1
-                self._add_token(TokenType.COMMENT, sql[comment_start:i], comment_start)
-                continue
-
-            # Handle multi-line comments
-            if char == '/' and i + 1 < len(sql) and sql[i + 1] == '*':
-                comment_start = i
-                i += 2
-                while i + 1 < len(sql) and not (sql[i] == '*' and sql[i + 1] == '/'):
-                    if sql[i] == '\n':
-                        self.line += 1
-                        self.column = 1
-                    i += 1
-                i += 2  # Skip closing */
-                self._add_token(TokenType.COMMENT, sql[comment_start:i], comment_start)
-                continue
+                    self._add_token(token_type, text.upper(), start)
+            elif kind != 'whitespace':
+                self._add_token(_TOKEN_KINDS[kind], text, start)
 
-            # Handle quoted identifiers (backticks)
-            if char == '`':
-                quoted_start = i
-                i += 1
-                while i < len(sql) and sql[i] != '`':
-                    i += 1
-                i += 1  # Skip closing backtick
-                self._add_token(TokenType.QUOTED_IDENTIFIER, sql[quoted_start:i], quoted_start)
-                continue
-
-            # Handle string literals
-            if char in ('"', "'"):
-                string_start = i
-                quote_char = char
-                i += 1
-                while i < len(sql):
-                    if sql[i] == quote_char:
-                        if i + 1 < len(sql) and sql[i + 1] == quote_char:
-                            i += 2  # Escaped quote
-                            continue
-                        else:
-                            i += 1  # End of string
-                            break
-                    i += 1
-                self._add_token(TokenType.STRING_LITERAL, sql[string_start:i], string_start)
-                continue
-
-            # Handle numbers
-            if char.isdigit():
-                num_start = i
-                while i < len(sql) and (sql[i].isdigit() or sql[i] == '.'):
-                    i += 1
-                self._add_token(TokenType.NUMBER, sql[num_start:i], num_start)
-                continue
-
-            # Handle parentheses
-            if char == '(':
-                self._add_token(TokenType.PAREN_OPEN, char, i)
-                i += 1
-                continue
-
-            if char == ')':
-                self._add_token(TokenType.PAREN_CLOSE, char, i)
-                i += 1
-                continue
-
-            # Handle comma
-            if char == ',':
-                self._add_token(TokenType.COMMA, char, i)
-                i += 1
-                continue
+            # Track line numbers for multi-line tokens (whitespace, comments, strings)
+            newlines = text.count('\n')
+            if newlines:
+                self.line += newlines
+                line_start = start + text.rfind('\n') + 1
 
-            # Handle operators and punctuation
-            if char in '=!<>+-*/%':
-                op_start = i
-                # Handle multi-character operators
-                if char in '=!<>' and i + 1 < len(sql) and sql[i + 1] in '=<>':
-                    i += 2
-                else:
-                    i += 1
-                operator = sql[op_start:i]
-                self._add_token(TokenType.OPERATOR, operator, op_start)
-                continue
+        return self.tokens
 
-            # Handle other punctuation
-            if char in '.,;':
-                self._add_token(TokenType.PUNCTUATION, char, i)
-                i += 1
-                continue
+    def tokenize_compact(self, sql: str) -> CompactTokens:
+        """🗜️ Tokenize SQL into array-backed columns instead of Token objects
 
-            # Handle identifiers and keywords
-            if char.isalpha() or char == '_':
-                ident_start = i
-                while i < len(sql) and (sql[i].isalnum() or sql[i] == '_'):
-                    i += 1
-                
-                identifier = sql[ident_start:i].upper()
-                
-                # Check if it's followed by parentheses (function)
-                next_non_space = self._skip_whitespace(sql, i)
-                if next_non_space < len(sql) and sql[next_non_space] == '(':
-                    if identifier in self.FUNCTIONS:
-                        self._add_token(TokenType.FUNCTION, identifier, ident_start)
-                    else:
-                        self._add_token(TokenType.IDENTIFIER, sql[ident_start:i], ident_start)
-                # Check if it's a keyword
-                elif identifier in self.KEYWORDS:
-                    self._add_token(TokenType.KEYWORD, identifier, ident_start)
-                # Regular identifier
-                else:
-                    self._add_token(TokenType.IDENTIFIER, sql[ident_start:i], ident_start)
+        Same tokens as tokenize(), but stored as type code and start/end offsets
+        into the normalized text, so large statements allocate three arrays
+        rather than one object (plus a value string) per token.
+        """
+        sql = self._normalize_sql(sql)
+        types, starts, ends = array('i'), array('i'), array('i')
+        deadline = self.deadline
+
+        for match in _TOKEN_PATTERN.finditer(sql):
+            if deadline is not None:
+                deadline.poll()
+            kind = match.lastgroup
+            if kind == 'whitespace':
                 continue
-
-            # Unknown character - treat as punctuation
-            self._add_token(TokenType.PUNCTUATION, char, i)
-            i += 1
-
-        return self.tokens
+            start, end = match.span()
+            if kind == 'word':
+                types.append(TOKEN_TYPE_CODES[self._word_type(sql, sql[start:end], end)])
+            else:
+                types.append(_KIND_CODES[kind])
+            starts.append(start)
+            ends.append(end)
+
+        return CompactTokens(sql, types, starts, ends)
+
+    def tokenize_stream(self, sql: str, compact: bool = False) -> 'TokenStream':
+        """Tokenize SQL once and wrap the tokens in a stream bound to the scanned text
+
+        The returned stream keeps a reference to the exact text that was scanned, so
+        consumers can slice clause text by token position instead of re-scanning SQL.
+        With compact=True the stream is backed by CompactTokens.
+        """
+        source = self._normalize_sql(sql)
+        if compact:
+            return TokenStream(self.tokenize_compact(source))
+        return TokenStream(self.tokenize(source), source=source)
+
+    def _word_type(self, sql: str, text: str, end: int) -> TokenType:
+        """Classify a word as FUNCTION, KEYWORD or IDENTIFIER"""
+        identifier = text.upper()
+        # Check if it's followed by parentheses (function)
+        if _CALL_LOOKAHEAD.match(sql, end):
+            if identifier in self.FUNCTIONS:
+                return TokenType.FUNCTION
+            # Keywords such as ON(...), IN(...), EXISTS(...) stay keywords
+            if identifier in self.KEYWORDS:
+                return TokenType.KEYWORD
+            return TokenType.IDENTIFIER
+        # Check if it's a keyword
+        if identifier in self.KEYWORDS:
+            return TokenType.KEYWORD
+        # Regular identifier
+        return TokenType.IDENTIFIER
 
     def _normalize_sql(self, sql: str) -> str:
         """Normalize SQL for tokenization"""
@@ -242,7 +317,6 @@ class SQLTokenizer:
             column=self.column
         )
         self.tokens.append(token)
-        self.column += len(value)
 
     def get_tokens_by_type(self, token_type: TokenType) -> List[Token]:
         """Get all tokens of specific type"""
@@ -293,23 +367,93 @@ class SQLTokenizer:
         
         return result
 
+# Identifier-like words that never act as a table alias after a table name
+NON_ALIAS_WORDS = {
+    'USING', 'CROSS', 'NATURAL', 'STRAIGHT_JOIN', 'USE', 'IGNORE', 'FORCE', 'FOR', 'LOCK'
+}
+
+# 🔢 Word codes: each uppercase word the parsers compare against has a fixed
+# integer, so stream checks compare ints instead of uppercasing strings. The
+# vocabulary is closed at import time; any other value codes as NO_WORD_CODE.
+NO_WORD_CODE = -1
+WORD_CODES: Dict[str, int] = {
+    word: code for code, word in enumerate(sorted(
+        SQLTokenizer.KEYWORDS | SQLTokenizer.FUNCTIONS | SQLTokenizer.OPERATORS | NON_ALIAS_WORDS |
+        {'(', ')', ',', '.', ';'}))
+}
+
+def word_code(value: str) -> int:
+    """Word code of a token value (case-insensitive), or NO_WORD_CODE"""
+    code = WORD_CODES.get(value)
+    if code is None:
+        code = WORD_CODES.get(value.upper(), NO_WORD_CODE)
+    return code
+
+def word_codes(*words: str) -> FrozenSet[int]:
+    """Codes of vocabulary words (KeyError for a word outside WORD_CODES)"""
+    return frozenset(WORD_CODES[word.upper()] for word in words)
+
+# match()/consume() arguments -> their codes (None when a word is outside the vocabulary)
+_MATCH_CODES: Dict[Tuple[str, ...], Optional[FrozenSet[int]]] = {}
+_MATCH_CODES_LIMIT = 1024
+
+def _codes_for(values: Tuple[str, ...]) -> Optional[FrozenSet[int]]:
+    codes = _MATCH_CODES.get(values, False)
+    if codes is False:
+        codes = frozenset(WORD_CODES.get(value.upper(), NO_WORD_CODE) for value in values)
+        if NO_WORD_CODE in codes:
+            codes = None
+        if len(_MATCH_CODES) < _MATCH_CODES_LIMIT:
+            _MATCH_CODES[values] = codes
+    return codes
+
+_TRIVIA_TYPES = (TokenType.WHITESPACE, TokenType.COMMENT)
+_KEYWORD = TOKEN_TYPE_CODES[TokenType.KEYWORD]
+_IDENTIFIER = TOKEN_TYPE_CODES[TokenType.IDENTIFIER]
+_QUOTED_IDENTIFIER = TOKEN_TYPE_CODES[TokenType.QUOTED_IDENTIFIER]
+_AS = WORD_CODES['AS']
+_DOT = WORD_CODES['.']
+_NON_ALIAS_CODES = word_codes(*NON_ALIAS_WORDS)
+
 class TokenStream:
-    """Token stream for easy parsing"""
+    """Token stream for easy parsing
+
+    🔢 Index-based: `position` indexes `tokens`, and the parallel `types`
+    (TokenType codes) and `codes` (word codes) arrays are built once, so
+    match()/consume() and the handlers' scan loops compare integers. A token
+    list without comments is shared rather than copied; CompactTokens are
+    used as they are.
+    """
     
-    def __init__(self, tokens: List[Token]):
-        self.tokens = [t for t in tokens if t.type != TokenType.WHITESPACE and t.type != TokenType.COMMENT]
+    def __init__(self, tokens: Union[List[Token], CompactTokens], source: str = None):
+        if isinstance(tokens, CompactTokens):
+            # Compact columns are filtered as arrays and materialize tokens on access
+            compact = tokens.without_comments()
+            source = tokens.source if source is None else source
+            self.tokens = compact
+            self.types = compact.types
+            values = map(compact.value_at, range(len(compact)))
+        else:
+            if any(t.type in _TRIVIA_TYPES for t in tokens):
+                tokens = [t for t in tokens if t.type not in _TRIVIA_TYPES]
+            self.tokens = tokens
+            self.types = array('i', [TOKEN_TYPE_CODES[t.type] for t in tokens])
+            values = (t.value for t in tokens)
+        self.codes = array('i', [word_code(value) for value in values])
         self.position = 0
+        # Text the tokens were scanned from (enables slicing clauses by position)
+        self.source = source
 
     def current(self) -> Optional[Token]:
         """Get current token"""
-        if self.position < len(self.tokens):
+        if self.position < len(self.types):
             return self.tokens[self.position]
         return None
 
     def peek(self, offset: int = 1) -> Optional[Token]:
         """Peek ahead at token"""
         pos = self.position + offset
-        if pos < len(self.tokens):
+        if pos < len(self.types):
             return self.tokens[pos]
         return None
 
@@ -321,34 +465,97 @@ class TokenStream:
 
     def consume(self, expected_value: str = None, expected_type: TokenType = None) -> Optional[Token]:
         """Consume token with optional validation"""
-        token = self.current()
-        if not token:
+        pos = self.position
+        if pos >= len(self.types):
             return None
             
-        if expected_value and token.value.upper() != expected_value.upper():
+        if expected_value and not self._matches_at(pos, (expected_value,)):
             return None
             
-        if expected_type and token.type != expected_type:
+        if expected_type and self.types[pos] != TOKEN_TYPE_CODES[expected_type]:
             return None
             
         self.position += 1
-        return token
+        return self.tokens[pos]
 
     def match(self, *values: str) -> bool:
         """Check if current token matches any of the values"""
-        token = self.current()
-        if not token:
+        if self.position >= len(self.types):
             return False
-        return token.value.upper() in [v.upper() for v in values]
+        return self._matches_at(self.position, values)
+
+    def _matches_at(self, pos: int, values: Tuple[str, ...]) -> bool:
+        """Case-insensitive value check by word code (string compare outside the vocabulary)"""
+        codes = _codes_for(values)
+        if codes is None:
+            return self.tokens[pos].value.upper() in {v.upper() for v in values}
+        return self.codes[pos] in codes
+
+    def match_keyword(self, keyword: str) -> bool:
+        """Check if the current token is the given (uppercase) keyword"""
+        pos = self.position
+        return (pos < len(self.types) and self.types[pos] == _KEYWORD and
+                self.codes[pos] == WORD_CODES.get(keyword, NO_WORD_CODE))
+
+    def match_next_keyword(self, keyword: str) -> bool:
+        """Check if the token after the current one is the given keyword"""
+        pos = self.position + 1
+        return (pos < len(self.types) and self.types[pos] == _KEYWORD and
+                self.codes[pos] == WORD_CODES.get(keyword, NO_WORD_CODE))
+
+    def consume_qualified_name(self) -> Optional[List[str]]:
+        """Consume a (possibly qualified) name like `db`.`table` and return its parts"""
+        types, codes, pos = self.types, self.codes, self.position
+        if pos >= len(types) or types[pos] not in (_IDENTIFIER, _QUOTED_IDENTIFIER):
+            return None
+
+        parts = [self.tokens[pos].value.strip('`')]
+        pos += 1
+        while pos + 1 < len(types) and codes[pos] == _DOT and types[pos + 1] in (_IDENTIFIER, _QUOTED_IDENTIFIER):
+            parts.append(self.tokens[pos + 1].value.strip('`'))
+            pos += 2
+        self.position = pos
+        return parts
+
+    def consume_alias(self) -> Optional[str]:
+        """Consume an optional `[AS] alias` following a table name"""
+        types, pos = self.types, self.position
+        if pos >= len(types):
+            return None
+
+        token_type = types[pos]
+        if token_type == _KEYWORD and self.codes[pos] == _AS:
+            if pos + 1 < len(types) and types[pos + 1] in (_IDENTIFIER, _QUOTED_IDENTIFIER):
+                self.position += 2
+                return self.tokens[pos + 1].value.strip('`')
+            return None
+
+        if token_type in (_IDENTIFIER, _QUOTED_IDENTIFIER) and self.codes[pos] not in _NON_ALIAS_CODES:
+            self.position += 1
+            return self.tokens[pos].value.strip('`')
+        return None
 
     def has_more(self) -> bool:
         """Check if more tokens available"""
-        return self.position < len(self.tokens)
+        return self.position < len(self.types)
 
     def reset(self):
         """Reset stream to beginning"""
         self.position = 0
 
+    def text(self, start_index: int, end_index: int) -> str:
+        """Source text spanning tokens [start_index, end_index)
+
+        Falls back to joining token values when the stream has no source text.
+        """
+        end_index = min(end_index, len(self.tokens))
+        if start_index >= end_index:
+            return ""
+        if self.source is None:
+            return ' '.join(t.value for t in self.tokens[start_index:end_index])
+        last = self.tokens[end_index - 1]
+        return self.source[self.tokens[start_index].position:last.position + len(last.value)]
+
 if __name__ == "__main__":
     print("🔪 SQL Tokenizer - SQL Parser AST v6.0")
     print("=" * 60)
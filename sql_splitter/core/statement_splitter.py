@@ -0,0 +1,255 @@
+"""
+Statement Splitter - SQL Parser AST v6.0
+
+✂️ Streaming splitter for SQL scripts and mysqldump files
+
+Reads a script in chunks (file objects, binary streams, mmap or plain
+strings) and yields one statement at a time, so only the statement being
+assembled is held in memory. Strings, backtick identifiers and comments are
+recognized with the same patterns as SQLTokenizer; the mysql client's
+`DELIMITER` command is honoured.
+
+Conventions:
+- The delimiter itself is not part of the yielded statement
+- Comments before a statement are dropped, comments inside it are kept
+- `/*! ... */` conditional comments count as code (mysqldump uses them)
+- A trailing statement without a delimiter is still yielded
+"""
+
+import codecs
+import mmap
+import re
+from typing import Iterator, Optional, Union, IO
+
+from .sql_tokenizer import (
+    LINE_COMMENT_PATTERN, BLOCK_COMMENT_PATTERN, QUOTED_IDENTIFIER_PATTERN, STRING_LITERAL_PATTERN
+)
+from .regex_registry import regex
+
+# `DELIMITER <token>` as the first word of a statement (mysql client command)
+_DELIMITER_COMMAND = regex(r'DELIMITER[ \t]+(\S*)[^\n]*(?:\n|\Z)', re.IGNORECASE, 'splitter.delimiter_command')
+_NON_SPACE = regex(r'\S', 0, 'splitter.non_space')
+
+# Characters needed after a statement's first code character to rule out `DELIMITER `
+_DELIMITER_PROBE = len('DELIMITER ')
+
+SQLSource = Union[str, bytes, IO, mmap.mmap]
+
+
+def _scanner(delimiter: str):
+    """Scanner for one delimiter: strings, identifiers, comments or the delimiter
+
+    The delimiter is tried before comments so that `--` or `//` style
+    delimiters are not read as comment openers.
+    """
+    return regex(
+        '(?P<string>' + STRING_LITERAL_PATTERN + ')'
+        '|(?P<quoted>' + QUOTED_IDENTIFIER_PATTERN + ')'
+        r'|(?P<conditional>/\*!.*?(?:\*/|\Z))'
+        '|(?P<delimiter>' + re.escape(delimiter) + ')'
+        '|(?P<comment>' + BLOCK_COMMENT_PATTERN + '|' + LINE_COMMENT_PATTERN + r'|#[^\n]*)',
+        re.DOTALL, f'splitter.scanner.{delimiter}')
+
+
+def _statement_body(delimiter: str):
+    """Run of complete tokens that cannot contain or start the delimiter
+
+    Used to jump over the inside of a statement in one match. Single characters
+    that could begin a comment or the delimiter are only taken when the
+    following characters are already in the buffer, and never where the
+    delimiter itself starts (`//`, `--`, `#` style delimiters).
+    """
+    first = re.escape(delimiter[0])
+    rest = delimiter[1:]
+    opener_guard = ''
+    if delimiter[0] in '-/#':
+        # The comment-opener branches below already take this character
+        opener_guard = r'(?=[\s\S]{%d})(?!%s)' % (len(delimiter), re.escape(delimiter))
+        delimiter_char = r'(?!)'
+    elif rest:
+        delimiter_char = first + r'(?=[\s\S]{%d})(?!%s)' % (len(rest), re.escape(rest))
+    else:
+        delimiter_char = r'(?!)'
+    return regex(
+        r'(?:[^\'"`/#\-' + first + r']+'
+        r"|'(?:[^'\\]|\\.|'')*'"
+        r'|"(?:[^"\\]|\\.|"")*"'
+        r'|`[^`]*`'
+        '|' + opener_guard + r'(?:/\*.*?\*/|(?:--(?=[\x00-\x20])|#)[^\n]*\n|-(?=[^-])|/(?=[^*]))'
+        '|' + delimiter_char + ')*',
+        re.DOTALL, f'splitter.body.{delimiter}')
+
+
+def _iter_chunks(source: SQLSource, chunk_size: int, encoding: str) -> Iterator[str]:
+    """Decoded text chunks of a string, text/binary stream or mmap
+
+    The generator receives the wanted size via send(); None keeps chunk_size.
+    """
+    if isinstance(source, str):
+        yield source
+        return
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        offset = 0
+        length = len(source)
+        while offset < length:
+            wanted = yield decoder.decode(source[offset:offset + chunk_size])
+            offset += chunk_size
+            chunk_size = wanted or chunk_size
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+        return
+
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            break
+        wanted = yield decoder.decode(data) if isinstance(data, bytes) else data
+        chunk_size = wanted or chunk_size
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+class StatementSplitter:
+    """✂️ Incremental SQL script splitter"""
+
+    def __init__(self, delimiter: str = ';', chunk_size: int = 1 << 16, encoding: str = 'utf-8'):
+        """Initialize splitter
+
+        Args:
+            delimiter: Statement delimiter at the start of the script
+            chunk_size: Characters (or bytes) read per step
+            encoding: Encoding used for binary streams and mmaps
+        """
+        if not delimiter or any(char.isspace() for char in delimiter):
+            raise ValueError("delimiter must be a non-empty string without whitespace")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.delimiter = delimiter
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+
+    def split(self, source: SQLSource) -> Iterator[str]:
+        """Yield the statements of a script, reading it incrementally"""
+        delimiter = self.delimiter
+        scanner = _scanner(delimiter)
+        body = _statement_body(delimiter)
+        chunks = _iter_chunks(source, self.chunk_size, self.encoding)
+
+        buffer = ""
+        position = 0      # Scan position in buffer
+        start = None      # Start of the current statement's code, if any
+        wanted = None     # Read size for the next chunk (grows while a token is unfinished)
+        eof = False
+
+        while True:
+            # Read the next chunk (first pass included)
+            if not eof:
+                try:
+                    chunk = next(chunks) if wanted is None else chunks.send(wanted)
+                except StopIteration:
+                    eof = True
+                    chunk = ""
+                # Keep only the statement being assembled
+                cut = position if start is None else start
+                buffer = buffer[cut:] + chunk
+                position -= cut
+                if start is not None:
+                    start = 0
+                wanted = None
+
+            need_more = False
+            while position < len(buffer):
+                if start is not None:
+                    # Inside a statement: skip straight to the next delimiter candidate
+                    position = body.match(buffer, position).end()
+                    if position == len(buffer):
+                        need_more = not eof
+                        break
+                match = scanner.search(buffer, position)
+                gap_end = match.start() if match else len(buffer)
+
+                if start is None:
+                    # First code character of the statement (comments and blanks skipped)
+                    code = _NON_SPACE.search(buffer, position, gap_end)
+                    if code:
+                        first = code.start()
+                        if len(buffer) - first < _DELIMITER_PROBE and not eof:
+                            position = first
+                            need_more = True
+                            break
+                        command = _DELIMITER_COMMAND.match(buffer, first)
+                        if command and command.end() == len(buffer) and not eof:
+                            # Wait for the whole DELIMITER line
+                            position = first
+                            need_more = True
+                            break
+                        if command and command.group(1):
+                            delimiter = command.group(1)
+                            scanner = _scanner(delimiter)
+                            body = _statement_body(delimiter)
+                            position = command.end()
+                            continue
+                        start = first
+
+                if match is None:
+                    # Leave room for a delimiter or comment opener split across chunks
+                    keep = 0 if eof else max(len(delimiter), 2) - 1
+                    position = max(position, len(buffer) - keep)
+                    need_more = not eof
+                    break
+
+                if match.end() == len(buffer) and not eof:
+                    # The token may continue in the next chunk
+                    position = match.start()
+                    need_more = True
+                    wanted = max(self.chunk_size, len(buffer) - position)
+                    break
+
+                kind = match.lastgroup
+                if kind == 'delimiter':
+                    if start is not None:
+                        statement = buffer[start:match.start()].rstrip()
+                        if statement:
+                            yield statement
+                        start = None
+                elif kind != 'comment' and start is None:
+                    start = match.start()
+                position = match.end()
+
+            if eof and not need_more:
+                break
+
+        if start is not None:
+            statement = buffer[start:].rstrip()
+            if statement:
+                yield statement
+
+
+def split_statements(source: SQLSource, delimiter: str = ';', chunk_size: int = 1 << 16,
+                     encoding: str = 'utf-8') -> Iterator[str]:
+    """✂️ Yield the statements of a SQL script (string, stream or mmap)"""
+    return StatementSplitter(delimiter, chunk_size, encoding).split(source)
+
+
+def split_sql_file(path: str, delimiter: str = ';', encoding: str = 'utf-8',
+                   use_mmap: bool = True, chunk_size: int = 1 << 20) -> Iterator[str]:
+    """✂️ Yield the statements of a SQL file, memory-mapping it when possible"""
+    with open(path, 'rb') as handle:
+        source: SQLSource = handle
+        mapped: Optional[mmap.mmap] = None
+        if use_mmap:
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                source = mapped
+            except (ValueError, OSError):
+                # Empty files and special files cannot be mapped
+                mapped = None
+        try:
+            yield from StatementSplitter(delimiter, chunk_size, encoding).split(source)
+        finally:
+            if mapped is not None:
+                mapped.close()
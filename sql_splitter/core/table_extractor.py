@@ -10,14 +10,258 @@ Status: ✅ Enhanced table detection for 100% expect.md compliance
 """
 
 import re
+import string
 from typing import List, Dict, Any, Optional, Tuple, Set
 from .ast_nodes import TableReferenceNode, create_table_reference
-from .sql_tokenizer import TokenStream, Token, TokenType
+from .sql_tokenizer import TokenStream, Token, TokenType, TOKEN_TYPE_CODES, WORD_CODES, word_codes
+from .regex_registry import regex
+from .schema_registry import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY, DEFAULT_DATABASE_NAMES
+from .deadline import ParseDeadline
+
+
+
+class _SegmentPattern:
+    """⏱️ Matches `OPENER [^stop]* TAIL` patterns in linear time
+
+    Every opener before the same stop character sees a subset of the text the
+    first one saw (and the greedy segment already took the last TAIL in it),
+    so after one attempt the scan resumes past that stop character instead of
+    rescanning the segment from each later opener.
+    """
+
+    __slots__ = ('pattern', 'opener', 'stop')
+
+    def __init__(self, pattern: str, opener: str, stop: str, flags: int, name: str):
+        self.pattern = regex(pattern, flags, name)
+        self.opener = regex(opener, flags, f'{name}.opener')
+        self.stop = stop
+
+    def step(self, sql: str, start: int, found: List[Any]) -> int:
+        """Attempt the pattern at an opener found at start
+
+        Appends the match (if any) to found and returns the position the next
+        opener search resumes from (past the end of sql once no stop character
+        is left), which gives the same matches as re.finditer(pattern, sql).
+        """
+        opened = self.opener.match(sql, start)
+        if opened is None:
+            return start + 1
+        match = self.pattern.match(sql, start)
+        if match is not None:
+            found.append(match)
+        boundary = sql.find(self.stop, opened.end())
+        if boundary < 0:
+            return len(sql) + 1
+        return max(match.end(), boundary + 1) if match is not None else boundary + 1
+
+
+# 🧮 Precompiled patterns (declared once in the shared regex registry)
+# Optional JOIN prefixes and leading name runs are only entered at the start of
+# their run ((?<!\s), (?<![A-Z_])) so a failed attempt never rescans the run
+_CROSS_DB_REFERENCE = regex(r'`([a-zA-Z_][a-zA-Z0-9_]*)`\.`([a-zA-Z_][a-zA-Z0-9_]*)`', 0, 'tables.cross_db_reference')
+
+_FROM_DB_TABLE_PATTERNS = (
+    regex(r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?', re.IGNORECASE, 'tables.from_db_table.1'),
+    regex(r'\bFROM\s+\(\(\(([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)', re.IGNORECASE, 'tables.from_db_table.2'),
+    regex(r'\bFROM\s+\(\(([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)', re.IGNORECASE, 'tables.from_db_table.3'),
+    regex(r'\bFROM\s+\(([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?', re.IGNORECASE, 'tables.from_db_table.4'),
+)
+
+_FROM_STANDARD_PATTERNS = (
+    # 🎯 Standard FROM (no backticks)
+    regex(r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?', re.IGNORECASE, 'tables.from_standard.1'),
+
+    # 🎯 Standard FROM (legacy backtick support)
+    regex(r'\bFROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?', re.IGNORECASE, 'tables.from_standard.2'),
+
+    # 🎯 Cross-database FROM (legacy backtick support)
+    regex(r'\bFROM\s+`[^`]+`\.`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?', re.IGNORECASE, 'tables.from_standard.3'),
+)
+
+_JOIN_DB_TABLE_PATTERNS = (
+    # 🎯 Database-prefixed JOINs (momo.table_name)
+    regex(r'(?:LEFT|RIGHT|INNER|FULL|OUTER|(?<!\s))\s*JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?', re.IGNORECASE, 'tables.join_db_table.1'),
+
+    # 🎯 Simple JOIN detection with database prefix
+    regex(r'\bjoin\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)\s+on', re.IGNORECASE, 'tables.join_db_table.2'),
+)
+
+_JOIN_STANDARD_PATTERNS = (
+    # 🎯 Standard JOINs (no database prefix)
+    regex(r'(?:LEFT|RIGHT|INNER|FULL|OUTER|(?<!\s))\s*JOIN\s+([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?', re.IGNORECASE, 'tables.join_standard.1'),
+
+    # 🎯 Legacy backtick JOINs
+    regex(r'(?:LEFT|RIGHT|INNER|FULL|OUTER|(?<!\s))\s*JOIN\s+`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?', re.IGNORECASE, 'tables.join_standard.2'),
+
+    # 🎯 Legacy cross-database JOINs
+    regex(r'(?:LEFT|RIGHT|INNER|FULL|OUTER|(?<!\s))\s*JOIN\s+`[^`]+`\.`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?', re.IGNORECASE, 'tables.join_standard.3'),
+)
+
+_FIELD_DB_TABLE_PATTERNS = (
+    # 🎯 Database-prefixed field references: momo.table.field
+    regex(r'\b([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\b', re.IGNORECASE, 'tables.field_db_table.1'),
+
+    # 🎯 Function parameters with database prefix: func(momo.table.field)
+    regex(r'(?<![A-Z_])[A-Z_]+\s*\(\s*([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)', re.IGNORECASE, 'tables.field_db_table.2'),
+
+    # 🎯 Complex expressions with database prefix
+    _SegmentPattern(r'(?:CASE|IF|WHEN|COALESCE)\s*[^(]*([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)',
+                    r'CASE|IF|WHEN|COALESCE', '(', re.IGNORECASE, 'tables.field_db_table.3'),
+)
+
+_FIELD_STANDARD_PATTERNS = (
+    # 🎯 Standard field references: `table`.`field`
+    regex(r'`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`', re.IGNORECASE, 'tables.field_standard.1'),
+
+    # 🎯 Cross-database field references: `db`.`table`.`field`
+    regex(r'`[^`]+`\.`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`', re.IGNORECASE, 'tables.field_standard.2'),
+
+    # 🎯 Function parameters: func(`table`.`field`)
+    regex(r'(?<![A-Z_])[A-Z_]+\s*\(\s*`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`', re.IGNORECASE, 'tables.field_standard.3'),
+
+    # 🎯 No backticks field references: table.field (two-part only)
+    regex(r'\b([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\b', re.IGNORECASE, 'tables.field_standard.4'),
+
+    # 🎯 Complex expressions with table references
+    _SegmentPattern(r'(?:CASE|IF|WHEN|COALESCE)\s*[^(]*`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
+                    r'CASE|IF|WHEN|COALESCE', '(', re.IGNORECASE, 'tables.field_standard.5'),
+)
+
+_WINDOW_PATTERNS = (
+    # 🎯 OVER with PARTITION BY
+    regex(r'OVER\s*\(\s*PARTITION\s+BY\s+`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`', re.IGNORECASE, 'tables.window.1'),
+
+    # 🎯 OVER with ORDER BY
+    _SegmentPattern(r'OVER\s*\([^)]*ORDER\s+BY\s+`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
+                    r'OVER\s*\(', ')', re.IGNORECASE, 'tables.window.2'),
+
+    # 🎯 General OVER clause table references
+    _SegmentPattern(r'OVER\s*\([^)]*`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
+                    r'OVER\s*\(', ')', re.IGNORECASE, 'tables.window.3'),
+)
+
+_SUBQUERY_PATTERNS = (
+    # 🎯 EXISTS subqueries
+    _SegmentPattern(r'EXISTS\s*\(\s*SELECT[^)]+FROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`',
+                    r'EXISTS\s*\(\s*SELECT', ')', re.IGNORECASE | re.DOTALL, 'tables.subquery.1'),
+
+    # 🎯 IN subqueries
+    _SegmentPattern(r'IN\s*\(\s*SELECT[^)]+FROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`',
+                    r'IN\s*\(\s*SELECT', ')', re.IGNORECASE | re.DOTALL, 'tables.subquery.2'),
+
+    # 🎯 Correlated subqueries
+    _SegmentPattern(r'\(\s*SELECT[^)]+FROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`[^)]*\)',
+                    r'\(\s*SELECT', ')', re.IGNORECASE | re.DOTALL, 'tables.subquery.3'),
+)
+
+
+class _ReferenceScanner:
+    """🔍 Runs a group of match patterns over the SQL in one pass
+
+    Each pattern is listed under an anchor regex that matches wherever the
+    pattern can start, together with the characters such a start can be. A
+    single scan finds every anchor position; there only the patterns listed
+    for the character at that position are tried. Every pattern still gets
+    exactly the matches finditer() (or _SegmentPattern) would give it, so the
+    cost is one scan plus the attempts at real candidates instead of one full
+    scan per pattern.
+    """
+
+    __slots__ = ('scanner', 'patterns', 'by_char', 'other', '_steps')
+
+    # Characters besides the ASCII pair that a letter matches under IGNORECASE
+    CASE_FOLDS = {'I': 'İı', 'K': 'K', 'S': 'ſ'}
+
+    def __init__(self, anchors: Tuple[Tuple[Optional[str], str, tuple], ...], flags: int, name: str):
+        """Args: anchors as (start characters or None for any other, anchor regex, patterns)"""
+        patterns: List[Any] = []
+        by_char: Dict[str, List[int]] = {}
+        other: List[int] = []
+        for starts, _, listed in anchors:
+            patterns.extend(pattern for pattern in listed if pattern not in patterns)
+            indexes = [patterns.index(pattern) for pattern in listed]
+            if starts is None:
+                other.extend(indexes)
+                continue
+            for start in starts:
+                for char in {start.lower(), start.upper()} | set(self.CASE_FOLDS.get(start.upper(), '')):
+                    by_char.setdefault(char, []).extend(indexes)
+
+        self.patterns = tuple(patterns)
+        self.by_char = {char: tuple(dict.fromkeys(indexes)) for char, indexes in by_char.items()}
+        self.other = tuple(other)
+        self.scanner = regex('(?=' + '|'.join(anchor for _, anchor, _ in anchors) + ')', flags, name)
+        self._steps = None
+
+    def scan(self, sql: str, deadline: Optional[ParseDeadline] = None) -> Dict[Any, List[Any]]:
+        """Map each pattern to its matches in order (match objects); polls deadline per anchor"""
+        steps = self._steps
+        if steps is None:
+            # Compiled match() for plain patterns, step() for segment patterns
+            steps = self._steps = tuple(
+                (pattern.step, True) if isinstance(pattern, _SegmentPattern) else (pattern.compiled.match, False)
+                for pattern in self.patterns)
+        found = [[] for _ in steps]
+        resume = [0] * len(steps)  # next position each pattern may match at
+        by_char, other = self.by_char, self.other
+        for anchor in self.scanner.finditer(sql):
+            if deadline is not None:
+                deadline.poll()
+            position = anchor.start()
+            for index in by_char.get(sql[position], other):
+                if position < resume[index]:
+                    continue
+                attempt, segment = steps[index]
+                if segment:
+                    resume[index] = attempt(sql, position, found[index])
+                else:
+                    match = attempt(sql, position)
+                    if match is not None:
+                        found[index].append(match)
+                        resume[index] = match.end()
+        return dict(zip(self.patterns, found))
+
+
+# 🔍 Anchors for the single reference scan: each one matches wherever the patterns
+# listed under it can start (same flags, so the same case and \b semantics); the
+# character at a candidate position picks the patterns tried there (None: whitespace)
+_NAME_START = string.ascii_letters + '_'
+_JOIN_TABLE_PATTERNS = _JOIN_DB_TABLE_PATTERNS[:1] + _JOIN_STANDARD_PATTERNS
+
+_REFERENCE_SCANNER = _ReferenceScanner((
+    ('`', r'`', (_CROSS_DB_REFERENCE,) + _FIELD_STANDARD_PATTERNS[:2]),
+    ('F', r'\bFROM\s', _FROM_DB_TABLE_PATTERNS + _FROM_STANDARD_PATTERNS),
+    ('LRIFOJ', r'(?:LEFT|RIGHT|INNER|FULL|OUTER)\s*JOIN\s|(?<!\s)JOIN\s', _JOIN_TABLE_PATTERNS),
+    (None, r'(?<!\s)\s+JOIN\s', _JOIN_TABLE_PATTERNS),
+    ('J', r'\bJOIN\s', _JOIN_DB_TABLE_PATTERNS[1:]),
+    (_NAME_START, r'\b[a-zA-Z_][a-zA-Z0-9_]+\.', (_FIELD_DB_TABLE_PATTERNS[0], _FIELD_STANDARD_PATTERNS[3])),
+    (_NAME_START, r'(?<![A-Z_])[A-Z_]+\s*\(', (_FIELD_DB_TABLE_PATTERNS[1], _FIELD_STANDARD_PATTERNS[2])),
+    ('CIW', r'CASE|IF|WHEN|COALESCE', (_FIELD_DB_TABLE_PATTERNS[2], _FIELD_STANDARD_PATTERNS[4])),
+    ('O', r'OVER\s*\(', _WINDOW_PATTERNS),
+    ('E', r'EXISTS\s*\(\s*SELECT', _SUBQUERY_PATTERNS[:1]),
+    ('I', r'IN\s*\(\s*SELECT', _SUBQUERY_PATTERNS[1:2]),
+    ('(', r'\(\s*SELECT', _SUBQUERY_PATTERNS[2:]),
+), re.IGNORECASE, 'tables.reference_scanner')
+
+# 🔢 Integer codes for the token scan loops (see TokenStream.types / TokenStream.codes)
+_KEYWORD = TOKEN_TYPE_CODES[TokenType.KEYWORD]
+_NAME_TYPES = (TOKEN_TYPE_CODES[TokenType.IDENTIFIER], TOKEN_TYPE_CODES[TokenType.QUOTED_IDENTIFIER])
+_COMMA = TOKEN_TYPE_CODES[TokenType.COMMA]
+_PAREN_OPEN = TOKEN_TYPE_CODES[TokenType.PAREN_OPEN]
+_FROM = WORD_CODES['FROM']
+_DOT = WORD_CODES['.']
 
 class TableExtractor:
     """Advanced table extraction with comprehensive pattern detection"""
 
-    def __init__(self):
+    KNOWN_DATABASES = DEFAULT_DATABASE_NAMES  # built-in names; instances use self.schemas
+    JOIN_KEYWORDS = {'JOIN', 'LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER'}
+    JOIN_KEYWORD_CODES = word_codes(*JOIN_KEYWORDS)
+
+    def __init__(self, schemas: Optional[SchemaRegistry] = None, deadline: Optional[ParseDeadline] = None):
+        self.schemas = DEFAULT_SCHEMA_REGISTRY if schemas is None else schemas
+        # Time budget of the parse call, polled by the reference scan
+        self.deadline = deadline
         self.detected_tables = set()
         self.table_aliases = {}
         self.database_schemas = set()
@@ -31,27 +275,37 @@ class TableExtractor:
             self.cte_tables.update(cte_tables)
             self.detected_tables.update(cte_tables)
 
+        # 🔍 One scan collects the matches of every pattern; the phases below
+        # apply them in order because aliases and schemas feed later phases
+        matches = _REFERENCE_SCANNER.scan(sql, self.deadline)
+
         # 🎯 Phase 1: Database schema detection
-        self._detect_database_schemas(sql)
+        self._detect_database_schemas(matches)
 
         # 🎯 Phase 2: FROM clause tables (all patterns)
-        self._extract_from_clause_tables(sql)
+        self._extract_from_clause_tables(matches)
 
         # 🎯 Phase 3: JOIN tables (comprehensive patterns)
-        self._extract_join_tables(sql)
+        self._extract_join_tables(matches)
 
         # 🎯 Phase 4: Field-referenced tables
-        self._extract_field_referenced_tables(sql)
+        self._extract_field_referenced_tables(matches)
 
         # 🎯 Phase 5: Window function tables
-        self._extract_window_function_tables(sql)
+        self._extract_window_function_tables(matches)
 
         # 🎯 Phase 6: Subquery tables
-        self._extract_subquery_tables(sql)
+        self._extract_subquery_tables(matches)
+
+        return self._filter_detected_tables(), self.table_aliases
 
-        # 🎯 SIMPLIFIED AND ROBUST: Remove known database names from final results
-        database_names = {'momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db'}
-        database_names.update(self.database_schemas)  # Include detected schemas
+    def _filter_detected_tables(self) -> List[str]:
+        """🎯 SIMPLIFIED AND ROBUST: Remove known database names from final results"""
+        known_databases = self.schemas.names
+        detected_schemas = self.database_schemas
+
+        def is_database(name: str) -> bool:
+            return name in known_databases or name in detected_schemas
         
         # Apply robust database prefix filtering to final results
         filtered_tables = set()
@@ -60,67 +314,39 @@ class TableExtractor:
             if '.' in table:
                 # Handle database.table patterns - extract only the table part
                 parts = table.split('.')
-                if len(parts) >= 2 and parts[0] in database_names:
+                if len(parts) >= 2 and is_database(parts[0]):
                     # This is a database.table pattern - extract the actual table name
                     actual_table = parts[1]
-                    if self._is_valid_table_name(actual_table) and actual_table not in database_names:
+                    if self._is_valid_table_name(actual_table) and not is_database(actual_table):
                         filtered_tables.add(actual_table)
                 else:
                     # Not a database prefix, keep as-is (if valid)
-                    if self._is_valid_table_name(table) and table not in database_names:
+                    if self._is_valid_table_name(table) and not is_database(table):
                         filtered_tables.add(table)
             else:
                 # No dot - this is a standalone name
                 # SIMPLE RULE: Skip if it's a known database name
-                if table not in database_names and self._is_valid_table_name(table):
+                if not is_database(table) and self._is_valid_table_name(table):
                     filtered_tables.add(table)
 
-        return sorted(list(filtered_tables)), self.table_aliases
+        return sorted(list(filtered_tables))
 
-    def _detect_database_schemas(self, sql: str) -> None:
+    def _detect_database_schemas(self, matches: Dict[Any, List[Any]]) -> None:
         """Detect database schemas"""
-        cross_db_pattern = r'`([a-zA-Z_][a-zA-Z0-9_]*)`\.`([a-zA-Z_][a-zA-Z0-9_]*)`'
-        matches = re.findall(cross_db_pattern, sql)
-
-        for db_candidate, table_candidate in matches:
-            if (re.match(r'^(main_db|analytics_db|test_db|prod_db|dev_db|momo)$', db_candidate) or 
+        for match in matches[_CROSS_DB_REFERENCE]:
+            db_candidate = match.group(1)
+            if (db_candidate in self.schemas or 
                 '_db' in db_candidate.lower() or
                 db_candidate.lower() in ['main', 'analytics', 'test', 'prod', 'dev']):
                 self.database_schemas.add(db_candidate)
 
-    def _extract_from_clause_tables(self, sql: str) -> None:
+    def _extract_from_clause_tables(self, matches: Dict[Any, List[Any]]) -> None:
         """🎯 Extract FROM clause tables (all nested patterns)"""
         
-        # 🎯 Handle database-prefixed patterns first (momo.table_name)
-        db_prefixed_patterns = [
-            # 🎯 Database-prefixed table names (momo.table_name)
-            r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-            
-            # 🎯 Bracketed FROM with database prefix: FROM (((momo.table
-            r'\bFROM\s+\(\(\(([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)',
-            
-            # 🎯 Double bracketed FROM with database prefix: FROM ((momo.table
-            r'\bFROM\s+\(\(([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)',
-            
-            # 🎯 Single bracketed FROM with database prefix: FROM (momo.table
-            r'\bFROM\s+\(([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-        ]
-        
         # 🎯 USER'S EXCELLENT SUGGESTION: Use simple dot-split for database-prefixed patterns
-        # Look for any database.table patterns in the SQL and split them properly
-        import re
-        
-        # Find all database.table patterns in FROM clauses
-        db_table_patterns = [
-            r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-            r'\bFROM\s+\(\(\(([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)',
-            r'\bFROM\s+\(\(([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)',
-            r'\bFROM\s+\(([a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-        ]
-        
-        for pattern in db_table_patterns:
-            matches = re.finditer(pattern, sql, re.IGNORECASE)
-            for match in matches:
+        # Look for any database.table patterns in FROM clauses and split them properly
+        for pattern in _FROM_DB_TABLE_PATTERNS:
+            for match in matches[pattern]:
                 full_name = match.group(1)  # e.g., "momo.mt_item"
                 alias = match.group(2) if len(match.groups()) >= 2 and match.group(2) else None
                 
@@ -132,7 +358,7 @@ class TableExtractor:
                         table_name = parts[1].strip()  # e.g., "mt_item"
                         
                         # Add database to detected schemas for filtering
-                        if db_name in ['momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db']:
+                        if db_name in self.schemas:
                             self.database_schemas.add(db_name)
                         
                         # Only add the actual table name, not the database prefix
@@ -142,20 +368,8 @@ class TableExtractor:
                                 self.table_aliases[alias] = table_name
         
         # 🎯 Handle standard patterns (no database prefix)
-        standard_patterns = [
-            # 🎯 Standard FROM (no backticks)
-            r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-            
-            # 🎯 Standard FROM (legacy backtick support)
-            r'\bFROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?',
-            
-            # 🎯 Cross-database FROM (legacy backtick support)
-            r'\bFROM\s+`[^`]+`\.`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?'
-        ]
-
-        for pattern in standard_patterns:
-            matches = re.finditer(pattern, sql, re.IGNORECASE)
-            for match in matches:
+        for pattern in _FROM_STANDARD_PATTERNS:
+            for match in matches[pattern]:
                 table_name = match.group(1)
                 alias = match.group(2) if len(match.groups()) >= 2 and match.group(2) else None
 
@@ -164,27 +378,14 @@ class TableExtractor:
                     if alias and len(alias) >= 1:  # ✅ Allow single-char aliases like 'o', 'c', 'u'
                         self.table_aliases[alias] = table_name
 
-    def _extract_join_tables(self, sql: str) -> None:
+    def _extract_join_tables(self, matches: Dict[Any, List[Any]]) -> None:
         """🎯 Extract JOIN tables (comprehensive patterns)"""
         
         # 🎯 USER'S EXCELLENT SUGGESTION: Apply dot-split approach to JOIN extraction too!
         
         # Handle database-prefixed JOIN patterns first (momo.table_name)
-        db_prefixed_join_patterns = [
-            # 🎯 Database-prefixed JOINs (momo.table_name)
-            r'(?:LEFT|RIGHT|INNER|FULL|OUTER)?\s*JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-            
-            # 🎯 Lowercase database-prefixed JOINs (join momo.table)
-            r'(?:left|right|inner|full|outer)?\s*join\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-            
-            # 🎯 Simple JOIN detection with database prefix
-            r'\bjoin\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]+)\s+on'
-        ]
-        
-        # Process database-prefixed JOIN patterns first
-        for pattern in db_prefixed_join_patterns:
-            matches = re.finditer(pattern, sql, re.IGNORECASE)
-            for match in matches:
+        for pattern in _JOIN_DB_TABLE_PATTERNS:
+            for match in matches[pattern]:
                 db_name = match.group(1)  # Database name (e.g., "momo")
                 table_name = match.group(2)  # Actual table name (e.g., "mv_order")
                 alias = None
@@ -194,7 +395,7 @@ class TableExtractor:
                     alias = match.group(3) if match.group(3) else None
                 
                 # Add database to detected schemas for filtering
-                if db_name and db_name in ['momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db']:
+                if db_name and db_name in self.schemas:
                     self.database_schemas.add(db_name)
                 
                 # Only add the actual table name, not the database prefix
@@ -204,31 +405,15 @@ class TableExtractor:
                         self.table_aliases[alias] = table_name
         
         # Handle standard JOIN patterns (no database prefix)
-        standard_join_patterns = [
-            # 🎯 Standard JOINs (no database prefix)
-            r'(?:LEFT|RIGHT|INNER|FULL|OUTER)?\s*JOIN\s+([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-            
-            # 🎯 Lowercase JOINs (no database prefix)
-            r'(?:left|right|inner|full|outer)?\s*join\s+([a-zA-Z_][a-zA-Z0-9_]+)(?:\s+(?:AS\s+)?([a-zA-Z_][a-zA-Z0-9_]*))?',
-            
-            # 🎯 Legacy backtick JOINs
-            r'(?:LEFT|RIGHT|INNER|FULL|OUTER)?\s*JOIN\s+`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?',
-            
-            # 🎯 Legacy cross-database JOINs
-            r'(?:LEFT|RIGHT|INNER|FULL|OUTER)?\s*JOIN\s+`[^`]+`\.`([a-zA-Z_][a-zA-Z0-9_]+)`(?:\s+(?:AS\s+)?`?([a-zA-Z_][a-zA-Z0-9_]*)`?)?'
-        ]
 
         # 🎯 PIPELINE TRACE FIX: Filter out known database names from standard JOIN patterns
-        known_database_names = {'momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db'}
-        
-        for pattern in standard_join_patterns:
-            matches = re.finditer(pattern, sql, re.IGNORECASE)
-            for match in matches:
+        for pattern in _JOIN_STANDARD_PATTERNS:
+            for match in matches[pattern]:
                 table_name = match.group(1)
                 alias = match.group(2) if len(match.groups()) >= 2 and match.group(2) else None
 
                 # 🚨 CRITICAL FIX: Never add known database names as tables
-                if table_name in known_database_names:
+                if table_name in self.schemas:
                     # This is a database name, not a table - skip it entirely
                     continue
 
@@ -237,69 +422,33 @@ class TableExtractor:
                     if alias and len(alias) > 1:
                         self.table_aliases[alias] = table_name
 
-    def _extract_field_referenced_tables(self, sql: str) -> None:
+    def _extract_field_referenced_tables(self, matches: Dict[Any, List[Any]]) -> None:
         """🎯 Extract tables from field references"""
         
         # 🎯 USER'S EXCELLENT SUGGESTION: Apply dot-split approach to field references too!
         
         # Handle database-prefixed field references first (momo.table.field)
-        db_prefixed_field_patterns = [
-            # 🎯 Database-prefixed field references: momo.table.field
-            r'\b([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\b',
-            
-            # 🎯 Function parameters with database prefix: func(momo.table.field)
-            r'[A-Z_]+\s*\(\s*([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)',
-            
-            # 🎯 Complex expressions with database prefix
-            r'(?:CASE|IF|WHEN|COALESCE)\s*[^(]*([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)'
-        ]
         
         # Process database-prefixed field patterns first
-        for pattern in db_prefixed_field_patterns:
-            matches = re.findall(pattern, sql, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple) and len(match) >= 3:
-                    db_name = match[0]    # Database name (e.g., "momo")
-                    table_name = match[1]  # Actual table name (e.g., "mt_item")
-                    field_name = match[2]  # Field name (e.g., "id")
-                    
-                    # Add database to detected schemas for filtering
-                    if db_name and db_name in ['momo', 'main_db', 'analytics_db', 'test_db', 'prod_db', 'dev_db']:
-                        self.database_schemas.add(db_name)
-                    
-                    # Only add the actual table name, not the database prefix
-                    if table_name and self._is_valid_table_name(table_name):
-                        # Resolve alias to actual table name
-                        actual_table = self.table_aliases.get(table_name, table_name)
-                        if actual_table not in self.database_schemas:
-                            self.detected_tables.add(actual_table)
+        for pattern in _FIELD_DB_TABLE_PATTERNS:
+            for match in matches[pattern]:
+                db_name, table_name, field_name = match.group(1, 2, 3)  # e.g. "momo", "mt_item", "id"
+
+                # Add database to detected schemas for filtering
+                if db_name and db_name in self.schemas:
+                    self.database_schemas.add(db_name)
+
+                # Only add the actual table name, not the database prefix
+                if table_name and self._is_valid_table_name(table_name):
+                    # Resolve alias to actual table name
+                    actual_table = self.table_aliases.get(table_name, table_name)
+                    if actual_table not in self.database_schemas:
+                        self.detected_tables.add(actual_table)
         
         # Handle standard field references (no database prefix)
-        standard_field_patterns = [
-            # 🎯 Standard field references: `table`.`field`
-            r'`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
-            
-            # 🎯 Cross-database field references: `db`.`table`.`field`  
-            r'`[^`]+`\.`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
-            
-            # 🎯 Function parameters: func(`table`.`field`)
-            r'[A-Z_]+\s*\(\s*`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
-            
-            # 🎯 No backticks field references: table.field (two-part only)
-            r'\b([a-zA-Z_][a-zA-Z0-9_]+)\.([a-zA-Z_][a-zA-Z0-9_]+)\b',
-            
-            # 🎯 Complex expressions with table references
-            r'(?:CASE|IF|WHEN|COALESCE)\s*[^(]*`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`'
-        ]
-
-        for pattern in standard_field_patterns:
-            matches = re.findall(pattern, sql, re.IGNORECASE)
-            for match in matches:
-                # Handle tuple results from regex groups
-                if isinstance(match, tuple):
-                    table_ref = match[0]  # First group is table name
-                else:
-                    table_ref = match
+        for pattern in _FIELD_STANDARD_PATTERNS:
+            for match in matches[pattern]:
+                table_ref = match.group(1)  # First group is table name
 
                 # Resolve alias to actual table name
                 actual_table = self.table_aliases.get(table_ref, table_ref)
@@ -308,116 +457,123 @@ class TableExtractor:
                     actual_table not in self.database_schemas):
                     self.detected_tables.add(actual_table)
 
-    def _extract_window_function_tables(self, sql: str) -> None:
+    def _extract_window_function_tables(self, matches: Dict[Any, List[Any]]) -> None:
         """🎯 Extract tables from window functions (OVER clause)"""
         
-        window_patterns = [
-            # 🎯 OVER with PARTITION BY
-            r'OVER\s*\(\s*PARTITION\s+BY\s+`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
-            
-            # 🎯 OVER with ORDER BY
-            r'OVER\s*\([^)]*ORDER\s+BY\s+`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`',
-            
-            # 🎯 General OVER clause table references
-            r'OVER\s*\([^)]*`([a-zA-Z_][a-zA-Z0-9_]+)`\.`[a-zA-Z_][a-zA-Z0-9_]*`'
-        ]
-
-        for pattern in window_patterns:
-            matches = re.findall(pattern, sql, re.IGNORECASE)
-            for table_ref in matches:
+        for pattern in _WINDOW_PATTERNS:
+            for match in matches[pattern]:
+                table_ref = match.group(1)
                 actual_table = self.table_aliases.get(table_ref, table_ref)
                 if (self._is_valid_table_name(actual_table) and 
                     actual_table not in self.database_schemas):
                     self.detected_tables.add(actual_table)
 
-    def _extract_subquery_tables(self, sql: str) -> None:
+    def _extract_subquery_tables(self, matches: Dict[Any, List[Any]]) -> None:
         """🎯 Extract tables from subqueries"""
         
         # 🎯 Find subqueries in SELECT clauses
-        subquery_patterns = [
-            # 🎯 EXISTS subqueries
-            r'EXISTS\s*\(\s*SELECT[^)]+FROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`',
-            
-            # 🎯 IN subqueries
-            r'IN\s*\(\s*SELECT[^)]+FROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`',
-            
-            # 🎯 Correlated subqueries
-            r'\(\s*SELECT[^)]+FROM\s+`([a-zA-Z_][a-zA-Z0-9_]+)`[^)]*\)',
-        ]
-
-        for pattern in subquery_patterns:
-            matches = re.findall(pattern, sql, re.IGNORECASE | re.DOTALL)
-            for table_name in matches:
+        for pattern in _SUBQUERY_PATTERNS:
+            for match in matches[pattern]:
+                table_name = match.group(1)
                 if self._is_valid_table_name(table_name):
                     self.detected_tables.add(table_name)
 
-    def extract_tables_from_tokens(self, token_stream: TokenStream) -> Tuple[List[str], Dict[str, str]]:
-        """Extract tables from token stream"""
+    def extract_tables_from_tokens(self, token_stream: TokenStream,
+                                   cte_tables: Set[str] = None) -> Tuple[List[str], Dict[str, str]]:
+        """🎯 Extract tables from token stream in a single pass
+
+        FROM/JOIN targets are read as they are met; qualified field references
+        (alias.field, db.table.field) are collected and resolved once all aliases are known.
+        """
         self.reset()
         
-        while token_stream.has_more():
-            token = token_stream.current()
+        if cte_tables:
+            self.cte_tables.update(cte_tables)
+            self.detected_tables.update(cte_tables)
+        
+        field_references = []
+        types, codes = token_stream.types, token_stream.codes
+        
+        while token_stream.position < len(types):
+            position = token_stream.position
+            token_type = types[position]
             
             # Look for FROM keyword
-            if (token and token.type == TokenType.KEYWORD and 
-                token.value.upper() == 'FROM'):
+            if token_type == _KEYWORD and codes[position] == _FROM:
                 self._extract_from_clause_from_tokens(token_stream)
             
             # Look for JOIN keywords
-            elif (token and token.type == TokenType.KEYWORD and 
-                  token.value.upper() in ['JOIN', 'LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER']):
+            elif token_type == _KEYWORD and codes[position] in self.JOIN_KEYWORD_CODES:
                 self._extract_join_from_tokens(token_stream)
             
+            # Qualified field references: alias.field or db.table.field
+            elif (token_type in _NAME_TYPES and
+                  position + 1 < len(types) and codes[position + 1] == _DOT):
+                parts = token_stream.consume_qualified_name()
+                if len(parts) >= 3:
+                    if parts[0] in self.schemas:
+                        self.database_schemas.add(parts[0])
+                    field_references.append(parts[1])
+                elif len(parts) == 2:
+                    field_references.append(parts[0])
+            
             else:
-                token_stream.advance()
+                token_stream.position += 1
 
-        return sorted(list(self.detected_tables)), self.table_aliases
+        # Resolve field qualifiers now that every FROM/JOIN alias has been seen
+        for table_ref in field_references:
+            actual_table = self.table_aliases.get(table_ref, table_ref)
+            if (self._is_valid_table_name(actual_table) and 
+                actual_table not in self.database_schemas):
+                self.detected_tables.add(actual_table)
+
+        return self._filter_detected_tables(), self.table_aliases
 
     def _extract_from_clause_from_tokens(self, token_stream: TokenStream) -> None:
-        """Extract FROM clause from tokens"""
+        """Extract FROM clause (including comma-separated lists) from tokens"""
         token_stream.advance()  # Skip FROM
+        types = token_stream.types
         
-        # Handle parentheses
-        if token_stream.current() and token_stream.current().type == TokenType.PAREN_OPEN:
-            self._skip_nested_parentheses(token_stream)
-        
-        # Get table name
-        table_token = token_stream.current()
-        if table_token and table_token.type == TokenType.QUOTED_IDENTIFIER:
-            table_name = table_token.value.strip('`')
-            if self._is_valid_table_name(table_name):
-                self.detected_tables.add(table_name)
-                token_stream.advance()
-                
-                # Check for alias
-                alias_token = token_stream.current()
-                if alias_token and alias_token.type == TokenType.QUOTED_IDENTIFIER:
-                    alias = alias_token.value.strip('`')
-                    self.table_aliases[alias] = table_name
-                    token_stream.advance()
+        while True:
+            # Step into nested JOIN groups: FROM (((a JOIN b ...
+            while (token_stream.has_more() and types[token_stream.position] == _PAREN_OPEN and
+                   not token_stream.match_next_keyword('SELECT')):
+                token_stream.position += 1
+            
+            # Derived tables are left to the main loop, which visits their inner FROM
+            self._read_table_reference_from_tokens(token_stream)
+            
+            if not (token_stream.has_more() and types[token_stream.position] == _COMMA):
+                break
+            token_stream.position += 1  # Skip comma between tables
 
     def _extract_join_from_tokens(self, token_stream: TokenStream) -> None:
         """Extract JOIN from tokens"""
         # Skip JOIN keywords
-        while (token_stream.current() and 
-               token_stream.current().type == TokenType.KEYWORD and
-               token_stream.current().value.upper() in ['LEFT', 'RIGHT', 'INNER', 'FULL', 'OUTER', 'JOIN']):
-            token_stream.advance()
+        types, codes = token_stream.types, token_stream.codes
+        while (token_stream.has_more() and
+               types[token_stream.position] == _KEYWORD and
+               codes[token_stream.position] in self.JOIN_KEYWORD_CODES):
+            token_stream.position += 1
         
-        # Get table name
-        table_token = token_stream.current()
-        if table_token and table_token.type == TokenType.QUOTED_IDENTIFIER:
-            table_name = table_token.value.strip('`')
-            if self._is_valid_table_name(table_name):
-                self.detected_tables.add(table_name)
-                token_stream.advance()
-                
-                # Check for alias
-                alias_token = token_stream.current()
-                if alias_token and alias_token.type == TokenType.QUOTED_IDENTIFIER:
-                    alias = alias_token.value.strip('`')
-                    self.table_aliases[alias] = table_name
-                    token_stream.advance()
+        self._read_table_reference_from_tokens(token_stream)
+
+    def _read_table_reference_from_tokens(self, token_stream: TokenStream) -> None:
+        """Read `[db.]table [AS] alias` at the current stream position"""
+        parts = token_stream.consume_qualified_name()
+        if not parts:
+            return
+        
+        table_name = parts[-1]
+        if len(parts) >= 2 and parts[-2] in self.schemas:
+            # Add database to detected schemas for filtering
+            self.database_schemas.add(parts[-2])
+        
+        if self._is_valid_table_name(table_name):
+            self.detected_tables.add(table_name)
+            alias = token_stream.consume_alias()
+            if alias:
+                self.table_aliases[alias] = table_name
 
     def _skip_nested_parentheses(self, token_stream: TokenStream) -> None:
         """Skip nested parentheses structure"""
@@ -457,8 +613,7 @@ class TableExtractor:
             return False
 
         # Skip obvious database names
-        if (re.match(r'^(main_db|analytics_db|test_db|prod_db|dev_db|momo)$', name) or
-            name.lower().endswith('_db')):
+        if name in self.schemas or name.lower().endswith('_db'):
             return False
 
         # Skip single character names (likely aliases)
@@ -494,9 +649,10 @@ class TableExtractor:
         # Don't clear CTE tables as they come from external source
 
 # Helper function for easy integration
-def extract_all_tables_from_sql(sql: str, cte_tables: Set[str] = None) -> Tuple[List[str], Dict[str, str]]:
+def extract_all_tables_from_sql(sql: str, cte_tables: Set[str] = None,
+                                schemas: Optional[SchemaRegistry] = None) -> Tuple[List[str], Dict[str, str]]:
     """Extract all tables from SQL"""
-    extractor = TableExtractor()
+    extractor = TableExtractor(schemas)
     return extractor.extract_all_tables(sql, cte_tables)
 
 if __name__ == "__main__":
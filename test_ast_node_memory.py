@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+AST Node Memory Test Script
+
+Checks that AST nodes are slotted, allocate their children list and
+attributes dict only when used, and keep the node API unchanged.
+"""
+
+import sys
+import os
+import copy
+import pickle
+import tracemalloc
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.ast_nodes import (
+    ASTNode, FieldNode, TableReferenceNode, ConditionNode, JoinNode, QueryNode, WithNode, CTENode,
+    create_join_condition, create_table_reference
+)
+
+
+def _bytes_per_node(factory, count=5000):
+    names = [f"table_{index}" for index in range(count)]
+    tracemalloc.start()
+    nodes = [factory(name) for name in names]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(nodes) == count
+    return current / count
+
+
+def test_nodes_have_no_instance_dict():
+    """Every node class is slotted all the way down"""
+    nodes = [ASTNode("X"), FieldNode("a.b", "b"), TableReferenceNode("t", "x"), ConditionNode("a = b"),
+             QueryNode(), WithNode()]
+    for node in nodes:
+        assert not hasattr(node, "__dict__"), type(node).__name__
+    try:
+        TableReferenceNode("t").undeclared = 1
+        assert False, "slotted node accepted an undeclared attribute"
+    except AttributeError:
+        pass
+
+
+def test_containers_are_lazy():
+    """Leaf nodes never allocate children or attributes"""
+    ref = create_table_reference("`orders`", "`o`")
+    assert ref._children is None and ref._attributes is None
+    assert ref.get_attribute("raw_sql", "missing") == "missing"
+    assert ref.find_children_by_type("FIELD") == [] and ref.find_first_child_by_type("FIELD") is None
+    assert ref._children is None and ref._attributes is None
+
+    ref.set_attribute("raw_sql", "orders o")
+    assert ref.get_attribute("raw_sql") == "orders o" and ref.attributes == {"raw_sql": "orders o"}
+
+
+def test_tree_api_unchanged():
+    """add_child, parent links and typed lookups behave as before"""
+    condition = create_join_condition("`o`.`customer_id` = `c`.`id`")
+    join = JoinNode("left", create_table_reference("customers", "c"), condition)
+    query = QueryNode()
+    query.add_join(join)
+    query.set_with_clause(WithNode())
+    query.with_clause.add_cte(CTENode("recent", QueryNode()))
+
+    assert join.join_type == "LEFT" and join.parent is query and condition.parent is join
+    assert (condition.left_table, condition.right_field) == ("o", "id")
+    assert query.find_children_by_type("JOIN") == [join] and query.joins == [join]
+    assert query.find_first_child_by_type("WITH") is query.with_clause
+    assert [child.node_type for child in join.children] == ["TABLE_REFERENCE", "CONDITION"]
+
+
+def test_nodes_copy_and_pickle():
+    """Slotted trees survive deepcopy and pickling"""
+    query = QueryNode()
+    query.add_join(JoinNode("INNER", TableReferenceNode("b", "y"), create_join_condition("`x`.`id` = `y`.`id`")))
+    query.set_attribute("raw_sql", "SELECT 1")
+    for clone in (copy.deepcopy(query), pickle.loads(pickle.dumps(query))):
+        join = clone.joins[0]
+        assert join.parent is clone and join.table_reference.alias == "y"
+        assert join.condition.left_table == "x" and clone.get_attribute("raw_sql") == "SELECT 1"
+
+
+def test_per_node_memory():
+    """Slotted leaf nodes stay well under the old ~270-300 B per node"""
+    table_refs = _bytes_per_node(lambda name: TableReferenceNode(name, "a"))
+    conditions = _bytes_per_node(ConditionNode)
+    print(f"TableReferenceNode: {table_refs:.0f} B/node, ConditionNode: {conditions:.0f} B/node")
+    assert table_refs < 180
+    assert conditions < 200
+
+
+if __name__ == "__main__":
+    test_nodes_have_no_instance_dict()
+    test_containers_are_lazy()
+    test_tree_api_unchanged()
+    test_nodes_copy_and_pickle()
+    test_per_node_memory()
+    print("✅ All AST node memory tests passed")
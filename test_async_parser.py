@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Async Parser Test Script
+
+Checks AsyncSQLParser and parse_async: results match SQLParserAST, the
+concurrency limit and max_pending backpressure hold, and cancelled callers
+leave the pool usable.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST, AsyncSQLParser, parse_async
+from sql_splitter.core.async_parser import ParserBusyError
+
+QUERIES = [f"SELECT o{index}.id, c.name FROM orders{index} o{index} JOIN customers c ON o{index}.cid = c.id "
+           f"WHERE o{index}.total > {index}" for index in range(12)]
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_thread_mode_matches_sync_parser():
+    """Thread mode returns exactly what SQLParserAST.parse returns"""
+    expected = [SQLParserAST().parse(sql) for sql in QUERIES]
+
+    async def main():
+        async with AsyncSQLParser(workers=3, mode="thread") as parser:
+            single = await parser.parse(QUERIES[0])
+            many = await parser.parse_many(QUERIES)
+            return single, many, parser.stats()
+
+    single, many, stats = _run(main())
+    assert single == expected[0]
+    assert many == expected
+    assert stats["completed"] == len(QUERIES) + 1 and stats["inFlight"] == 0
+
+
+def test_process_mode_and_parser_options():
+    """Process workers are built from the parser options"""
+    expected = [SQLParserAST(use_token_stream=True).parse(sql) for sql in QUERIES[:4]]
+
+    async def main():
+        async with AsyncSQLParser(workers=2, use_token_stream=True) as parser:
+            results = await parser.parse_many(QUERIES[:4])
+            timed_out = await parser.parse(QUERIES[0], timeout=1e-9)
+            return results, timed_out
+
+    results, timed_out = _run(main())
+    assert results == expected
+    assert timed_out["errorType"] == "timeout"
+
+
+def test_concurrency_limit():
+    """No more than max_concurrency parses are in the pool at once"""
+
+    async def main():
+        async with AsyncSQLParser(workers=4, mode="thread", max_concurrency=2) as parser:
+            tasks = [asyncio.ensure_future(parser.parse(sql)) for sql in QUERIES]
+            await asyncio.sleep(0)
+            in_flight, waiting = parser.in_flight, parser.waiting
+            results = await asyncio.gather(*tasks)
+            return in_flight, waiting, results
+
+    in_flight, waiting, results = _run(main())
+    assert in_flight == 2 and waiting == len(QUERIES) - 2
+    assert all(result["success"] for result in results)
+
+
+def test_max_pending_rejects_overflow():
+    """Callers beyond max_pending get ParserBusyError instead of queueing"""
+
+    async def main():
+        async with AsyncSQLParser(workers=1, mode="thread", max_concurrency=1, max_pending=2) as parser:
+            tasks = [asyncio.ensure_future(parser.parse(sql)) for sql in QUERIES[:5]]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            return outcomes, parser.stats()
+
+    outcomes, stats = _run(main())
+    assert [isinstance(outcome, dict) for outcome in outcomes] == [True, True, True, False, False]
+    assert all(isinstance(outcome, ParserBusyError) for outcome in outcomes[3:])
+    assert stats["rejected"] == 2
+
+
+def test_cancellation_keeps_pool_usable():
+    """Cancelled callers (waiting or running) do not leak slots"""
+
+    async def main():
+        async with AsyncSQLParser(workers=1, mode="thread", max_concurrency=1) as parser:
+            tasks = [asyncio.ensure_future(parser.parse(sql)) for sql in QUERIES[:4]]
+            await asyncio.sleep(0)
+            tasks[0].cancel()  # running
+            tasks[2].cancel()  # waiting
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            after = await parser.parse(QUERIES[5])
+            return outcomes, after, parser.stats()
+
+    outcomes, after, stats = _run(main())
+    assert isinstance(outcomes[0], asyncio.CancelledError)
+    assert isinstance(outcomes[2], asyncio.CancelledError)
+    assert outcomes[1]["success"] and outcomes[3]["success"]
+    assert after["success"]
+    assert stats["inFlight"] == 0 and stats["waiting"] == 0
+
+
+def test_parse_async_helper():
+    """parse_async offloads to the default executor with the shared parser"""
+    result = _run(parse_async(QUERIES[1]))
+    assert result == SQLParserAST().parse(QUERIES[1])
+
+
+def test_invalid_options():
+    for kwargs in ({"mode": "fiber"}, {"max_pending": -1}):
+        try:
+            AsyncSQLParser(**kwargs)
+            assert False, f"expected ValueError for {kwargs}"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_thread_mode_matches_sync_parser()
+    test_process_mode_and_parser_options()
+    test_concurrency_limit()
+    test_max_pending_rejects_overflow()
+    test_cancellation_keeps_pool_usable()
+    test_parse_async_helper()
+    test_invalid_options()
+    print("✅ All async parser tests passed")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Batch Parsing Test Script
+
+Checks that process-pool batch parsing returns the same results as
+sequential parsing, in input order.
+"""
+
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST, parse_sql_batch
+
+TEST_QUERIES = [
+    f"SELECT t{i}.id, t{i}.name FROM table_{i} t{i} WHERE t{i}.id > {i}"
+    for i in range(12)
+] + ["SELECT u.name FROM users u LEFT JOIN orders o ON u.id = o.user_id"]
+
+
+def test_parse_sql_batch_matches_sequential():
+    """Worker results are identical to in-process results and keep input order"""
+    expected = [SQLParserAST().parse(sql) for sql in TEST_QUERIES]
+    results = parse_sql_batch(TEST_QUERIES, workers=2, chunksize=3)
+    assert results == expected
+
+
+def test_parse_many_uses_parser_options():
+    """parse_many rebuilds workers from the calling parser's options"""
+    parser = SQLParserAST(enable_normalization=False)
+    expected = [parser.parse(sql) for sql in TEST_QUERIES[:4]]
+
+    assert parser.parse_many(TEST_QUERIES[:4], workers=2, chunksize=1) == expected
+    assert parser.parse_many(iter(TEST_QUERIES[:4]), workers=1) == expected
+
+
+if __name__ == "__main__":
+    test_parse_sql_batch_matches_sequential()
+    test_parse_many_uses_parser_options()
+    print("✅ Batch parsing tests passed")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness Test Script
+
+Smoke-tests the benchmark corpus, the scaling generators and the baseline
+comparison with tiny sizes, so the harness keeps working between releases.
+"""
+
+import sys
+import os
+import json
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from benchmarks.corpus import GENERATORS, load_expect_md_queries
+from benchmarks.run_benchmarks import run, compare
+
+
+def test_expect_md_corpus():
+    """Every docs/expect.md test case contributes its SELECT statement"""
+    queries = load_expect_md_queries()
+    assert {"mv_item", "mv_order"} <= set(queries)
+    assert all(sql.upper().startswith("SELECT") for sql in queries.values())
+
+
+def test_generators_scale():
+    """Generators are deterministic, grow with n and produce parseable SQL"""
+    parser = SQLParserAST()
+    for name, generator in GENERATORS.items():
+        assert generator(4) == generator(4), name
+        assert len(generator(8)) > len(generator(4)), name
+        assert parser.parse(generator(4))["success"], name
+    assert len(parser.parse(GENERATORS["nested_joins"](6))["joins"]) == 6
+
+
+def test_run_and_compare():
+    """A baseline document round-trips through JSON and flags regressions"""
+    document = run("scaling", ["long_where"], [2, 4], repeat=2, warmup=0)
+    assert set(document["cases"]) == {"long_where/2", "long_where/4"}
+    case = document["cases"]["long_where/4"]
+    assert case["success"] and case["parsesPerSec"] > 0 and case["p50Ms"] <= case["p99Ms"]
+
+    baseline = json.loads(json.dumps(document))
+    assert not any(row["regressed"] for row in compare(baseline, document))
+
+    slower = json.loads(json.dumps(document))
+    slower["cases"]["long_where/2"]["p50Ms"] *= 10
+    rows = {row["case"]: row for row in compare(baseline, slower)}
+    assert rows["long_where/2"]["regressed"] and not rows["long_where/4"]["regressed"]
+
+
+if __name__ == "__main__":
+    test_expect_md_corpus()
+    test_generators_scale()
+    test_run_and_compare()
+    print("✅ Benchmark harness tests passed")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+CLI Test Script
+
+Checks the sql-splitter console entry point: statement splitting, NDJSON
+output, --no-normalize / --workers and the throughput summary.
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.sql_parser_ast_v6_0 import main
+from sql_splitter.core.statement_splitter import split_statements
+
+DUMP = """SELECT o.id FROM orders o JOIN customers c ON o.cid = c.id;
+-- a comment with a ; in it
+SELECT 'a;b' AS `x;y` FROM t1 /* ; */ WHERE z = "q;";
+SELECT id FROM t2
+"""
+
+
+def _run(argv, stdin_text=""):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    old_stdin = sys.stdin
+    sys.stdin = io.StringIO(stdin_text)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main(argv)
+    finally:
+        sys.stdin = old_stdin
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+def test_statement_splitting():
+    """Semicolons in quotes and comments do not split; the tail is kept"""
+    statements = list(split_statements(io.StringIO(DUMP)))
+    assert len(statements) == 3
+    assert statements[1].endswith('WHERE z = "q;"')
+    assert statements[2] == "SELECT id FROM t2"
+
+
+def test_ndjson_from_stdin():
+    """One JSON line per statement, stats on stderr"""
+    code, out, err = _run([], DUMP)
+    lines = out.splitlines()
+
+    assert code == 0
+    assert len(lines) == 3
+    results = [json.loads(line) for line in lines]
+    assert all(result["success"] for result in results)
+    assert results[0]["joins"][0]["rightTable"] == "customers"
+    assert results[2]["tables"] == ["t2"]
+    assert "3 statements (0 failed)" in err
+
+
+def test_files_workers_and_output():
+    """Files are read in order; parallel workers keep input order"""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = os.path.join(tmp, "a.sql")
+        second = os.path.join(tmp, "b.sql")
+        target = os.path.join(tmp, "out.ndjson")
+        with open(first, "w") as handle:
+            handle.write(";\n".join(f"SELECT c{i} FROM table_{i}" for i in range(20)))
+        with open(second, "w") as handle:
+            handle.write("SELECT `x` FROM `last_table`;")
+
+        code, out, err = _run(["--workers", "2", "--chunksize", "3", "--no-normalize",
+                               "-q", "-o", target, first, second])
+        assert code == 0 and out == "" and err == ""
+
+        with open(target) as handle:
+            results = [json.loads(line) for line in handle]
+        assert [r["tables"][0] for r in results] == [f"table_{i}" for i in range(20)] + ["last_table"]
+
+
+def test_missing_file():
+    """Unreadable input is reported with a non-zero exit code"""
+    code, _, err = _run(["/nonexistent/input.sql"])
+    assert code == 1 and "sql-splitter:" in err
+
+
+def test_unwritable_output():
+    """A bad -o path is reported like any other error, without a traceback"""
+    with tempfile.TemporaryDirectory() as tmp:
+        target = os.path.join(tmp, "missing", "out.ndjson")
+        code, out, err = _run(["-o", target], DUMP)
+    assert code == 1 and out == ""
+    assert err.startswith("sql-splitter: cannot open -o:") and "Traceback" not in err
+
+
+if __name__ == "__main__":
+    test_statement_splitting()
+    test_ndjson_from_stdin()
+    test_files_workers_and_output()
+    test_missing_file()
+    test_unwritable_output()
+    print("✅ CLI tests passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compact Token Test Script
+
+Checks that SQLTokenizer.tokenize_compact produces the same tokens as
+tokenize (type, value, position, line and column) while storing them as
+array-backed columns, and that TokenStream runs directly on them.
+"""
+
+import sys
+import os
+import tracemalloc
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.sql_tokenizer import SQLTokenizer, CompactTokens, TokenStream, TokenType
+from sql_splitter.core.join_handler import JoinHandler
+from benchmarks.corpus import load_expect_md_queries, nested_joins, cte_chain
+
+QUERIES = list(load_expect_md_queries().values()) + [
+    nested_joins(10),
+    cte_chain(4),
+    "SELECT /* note */ a.x -- trailing\n, COUNT(b.y)\nFROM t a\n\nJOIN u b ON a.id = b.id WHERE a.s = 'multi\nline' AND b.n >= 1.5",
+    "select `q`.`x` from `db`.`q` where exists(select 1 from r) and q.v in (1, 2)",
+]
+
+
+def test_compact_matches_token_objects():
+    """Materialized compact tokens equal tokenize() output, including line/column"""
+    tokenizer = SQLTokenizer()
+    for sql in QUERIES:
+        expected = tokenizer.tokenize(sql)
+        compact = tokenizer.tokenize_compact(sql)
+        assert len(compact) == len(expected)
+        assert list(compact) == expected, sql[:60]
+        assert compact[-1] == expected[-1] and compact[1:4] == expected[1:4]
+
+
+def test_columns_and_lazy_values():
+    """Columns hold type codes and offsets; values are slices of the source"""
+    compact = SQLTokenizer().tokenize_compact("select Sum(x) from `t`")
+    assert compact.types.typecode == 'i' and compact.starts.typecode == 'i'
+    assert [compact.type_at(i) for i in range(3)] == [TokenType.KEYWORD, TokenType.FUNCTION, TokenType.PAREN_OPEN]
+    assert [compact.value_at(i) for i in range(len(compact))] == ['SELECT', 'SUM', '(', 'x', ')', 'FROM', '`t`']
+    assert compact.line_column(compact.starts[3]) == (1, 12)
+
+
+def test_token_stream_over_compact_tokens():
+    """TokenStream accepts CompactTokens and parses JOINs identically"""
+    tokenizer = SQLTokenizer()
+    for sql in QUERIES:
+        regular = tokenizer.tokenize_stream(sql)
+        compact = tokenizer.tokenize_stream(sql, compact=True)
+        assert isinstance(compact.tokens, CompactTokens)
+        assert compact.source == regular.source
+        assert list(compact.tokens) == regular.tokens
+
+        expected = [(j.join_type, j.table_reference.table_name, j.condition.condition_text)
+                    for j in JoinHandler().parse_joins_from_tokens(regular)]
+        actual = [(j.join_type, j.table_reference.table_name, j.condition.condition_text)
+                  for j in JoinHandler().parse_joins_from_tokens(compact)]
+        assert actual == expected, sql[:60]
+
+
+def test_compact_memory():
+    """A large statement keeps a small fraction of the Token-object footprint"""
+    sql = "\n".join([nested_joins(20)] * 50)
+    tokenizer = SQLTokenizer()
+
+    def retained(tokenize):
+        tracemalloc.start()
+        tokens = tokenize(sql)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return current, len(tokens)
+
+    objects, count = retained(tokenizer.tokenize)
+    compact, compact_count = retained(tokenizer.tokenize_compact)
+    assert compact_count == count
+    assert compact * 5 < objects, (compact, objects)
+
+
+if __name__ == "__main__":
+    test_compact_matches_token_objects()
+    test_columns_and_lazy_values()
+    test_token_stream_over_compact_tokens()
+    test_compact_memory()
+    print("✅ All compact token tests passed")
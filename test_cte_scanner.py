@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+CTE Scanner Test Script
+
+Checks the single-pass WITH-clause scan in CTEHandler: CTE bodies and the
+main query are found by bracket tracking (parens in strings ignored), both
+parse paths build the same CTE dependency DAG, and CTE-heavy queries scale
+linearly.
+"""
+
+import sys
+import os
+import time
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core import CTEHandler, SQLTokenizer, CTENode, WithNode, QueryNode
+from benchmarks.corpus import cte_chain
+
+SQL = ("WITH RECURSIVE base_rows AS (SELECT x FROM t1 WHERE s = ')' OR s = 'SELECT'), "
+       "`ranked` (id, y) AS (SELECT base_rows.id, t2.y FROM base_rows JOIN t2 ON base_rows.id = t2.id), "
+       "final AS (SELECT * FROM ranked JOIN base_rows USING (id)) "
+       "SELECT final.id FROM final WHERE final.y IN (SELECT 1)")
+
+
+def _analytics_query(count):
+    ctes = [f"step{index} AS (SELECT a.id, (SELECT MAX(v) FROM w{index} WHERE w{index}.id = a.id) m "
+            f"FROM {f'step{index - 1}' if index else 'events'} a WHERE a.id IN (SELECT id FROM s{index}))"
+            for index in range(count)]
+    return "WITH " + ", ".join(ctes) + f" SELECT * FROM step{count - 1}"
+
+
+def test_scan_finds_definitions_and_main_query():
+    """Bodies end at their matching paren; the main query starts at the depth-0 SELECT"""
+    handler = CTEHandler()
+    with_node, referenced = handler.parse_cte_from_sql(SQL)
+    assert [cte.name for cte in with_node.ctes] == ['base_rows', 'ranked', 'final']
+    assert all(cte.recursive for cte in with_node.ctes)
+    assert handler.cte_definitions['base_rows'] == "SELECT x FROM t1 WHERE s = ')' OR s = 'SELECT'"
+    assert handler._extract_main_query_after_with(SQL).startswith("SELECT final.id FROM final")
+    assert {'t1', 't2'} <= referenced and 'final' not in referenced
+
+    assert CTEHandler().parse_cte_from_sql("SELECT a FROM t GROUP BY a WITH ROLLUP")[0] is None
+    assert CTEHandler().parse_cte_from_sql("WITH unfinished AS (SELECT 1")[0] is None
+
+
+def test_dependency_graph():
+    """Each CTE lists the CTEs it reads; evaluation order puts readers last"""
+    handler = CTEHandler()
+    with_node, _ = handler.parse_cte_from_sql(SQL)
+    assert handler.get_cte_dependencies() == {'base_rows': [], 'ranked': ['base_rows'],
+                                              'final': ['base_rows', 'ranked']}
+    assert with_node.dependency_graph() == handler.get_cte_dependencies()
+    assert with_node.evaluation_order() == ['base_rows', 'ranked', 'final']
+
+    chain = CTEHandler()
+    chain.parse_cte_from_sql(cte_chain(6))
+    assert chain.get_cte_dependencies()['c5'] == ['c4']
+
+
+def test_evaluation_order():
+    """Topological order regardless of definition order; cycles fall back to definition order"""
+    with_node = WithNode()
+    for name, depends_on in (('report', ['totals', 'users']), ('totals', ['orders']),
+                             ('orders', []), ('users', [])):
+        cte = CTENode(name, QueryNode())
+        cte.depends_on = depends_on
+        with_node.add_cte(cte)
+    assert with_node.evaluation_order() == ['orders', 'users', 'totals', 'report']
+
+    with_node.ctes[2].depends_on = ['report']
+    assert with_node.evaluation_order() == ['users', 'report', 'totals', 'orders']
+
+
+def test_string_and_token_paths_agree():
+    """Definitions and dependencies match between parse_cte_from_sql and parse_cte_from_tokens"""
+    for sql in (SQL, cte_chain(8), _analytics_query(12)):
+        text_handler = CTEHandler()
+        text_handler.parse_cte_from_sql(sql)
+        token_handler = CTEHandler()
+        token_handler.parse_cte_from_tokens(SQLTokenizer().tokenize_stream(sql))
+        assert text_handler.cte_definitions == token_handler.cte_definitions
+        assert text_handler.get_cte_dependencies() == token_handler.get_cte_dependencies()
+
+
+def test_many_ctes_scale_linearly():
+    """Four times the CTEs (and subqueries) take well under sixteen times as long"""
+    handler = CTEHandler()
+
+    def timed(count):
+        sql = _analytics_query(count)
+        start = time.perf_counter()
+        with_node, _ = handler.parse_cte_from_sql(sql)
+        elapsed = time.perf_counter() - start
+        assert len(with_node.ctes) == count
+        return elapsed
+
+    timed(100)
+    small = min(timed(1000) for _ in range(3))
+    large = min(timed(4000) for _ in range(3))
+    assert large < small * 6, (small, large)
+
+if __name__ == "__main__":
+    test_scan_finds_definitions_and_main_query()
+    test_dependency_graph()
+    test_evaluation_order()
+    test_string_and_token_paths_agree()
+    test_many_ctes_scale_linearly()
+    print("✅ All CTE scanner tests passed")
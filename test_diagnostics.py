@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Diagnostics Channel Test Script
+
+Checks that parsing is silent on stdout and that applied rules, validation
+warnings and timings are only reported when diagnostics are requested.
+"""
+
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+
+TEST_SQL = "SELECT `u`.`name` FROM `users` `u` LEFT JOIN `orders` `o` ON `u`.`id` = `o`.`user_id`"
+
+
+def test_parse_is_silent(capsys):
+    """The hot path no longer writes to stdout"""
+    result = SQLParserAST().parse(TEST_SQL)
+    assert result["success"]
+    assert "diagnostics" not in result
+    assert capsys.readouterr().out == ""
+
+
+def test_diagnostics_attached_on_request():
+    """collect_diagnostics attaches rules and phase timings to the result"""
+    result = SQLParserAST(collect_diagnostics=True).parse(TEST_SQL)
+
+    diagnostics = result["diagnostics"]
+    assert "remove_backticks" in diagnostics["appliedRules"]
+    assert {"normalize", "structure", "content", "total"} <= set(diagnostics["timingsMs"])
+    assert diagnostics["cacheHit"] is False
+
+
+def test_diagnostics_callback():
+    """The callback receives diagnostics without changing the result"""
+    reports = []
+    parser = SQLParserAST(diagnostics_callback=reports.append, cache_size=4)
+    first = parser.parse(TEST_SQL)
+    parser.parse(TEST_SQL)
+
+    assert "diagnostics" not in first
+    assert len(reports) == 2
+    assert [report["cacheHit"] for report in reports] == [False, True]
+
+
+if __name__ == "__main__":
+    test_diagnostics_attached_on_request()
+    test_diagnostics_callback()
+    print("✅ Diagnostics tests passed")
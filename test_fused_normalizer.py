@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Fused Normalizer Test Script
+
+Checks that the fused single-pass MySQL normalizer produces exactly the same
+SQL and applied-rule list as the rule-by-rule legacy engine.
+"""
+
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.sql_normalizer_mysql import MySQLCompatibleNormalizer, NormalizationRule
+
+SAMPLE_QUERIES = [
+    "SELECT u.name, o.total FROM users u JOIN orders o ON u.id = o.user_id WHERE o.total > 10",
+    "select   `db`.`users`.`id`,count(*) as cnt from db.users , db.orders where users.id=orders.uid group   by users.id",
+    "SELECT a FROM t1 left   outer join t2 ON t1.id=t2.id RIGHT JOIN t3 ON t2.x<>t3.x inner  join t4 ON 1=1",
+    "WITH x AS (SELECT 1 AS a) SELECT a FROM x ORDER  BY a DESC",
+    "SELECT * FROM t WHERE a>=1 AND b<=2 AND c!=3 AND d <  > e",
+    "select * from t left left inner join u on t.id = u.id",
+    "SELECT * FROM t LEFT JOIN (select id from u) s ON s.id = t.id",
+    "with with x as (select 1) select * from x",
+    "SELECT `from`, `where` FROM `t` WHERE `from` = 1",
+    "SELECT a FROM t1 CROSS  JOIN t2 full outer join t3 ON t2.id = t3.id",
+]
+
+
+def test_fused_matches_legacy():
+    """Both engines give the same SQL, rules and validation errors"""
+    fused = MySQLCompatibleNormalizer()
+    legacy = MySQLCompatibleNormalizer(engine="legacy")
+    for sql in SAMPLE_QUERIES:
+        assert fused.normalize_query(sql) == legacy.normalize_query(sql), sql
+
+
+def test_unknown_engine_rejected():
+    """Only the documented engines are accepted"""
+    try:
+        MySQLCompatibleNormalizer(engine="turbo")
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError for an unknown engine")
+
+
+def test_custom_rules_use_sequential_path():
+    """A customized rule list is still honoured by the fused engine"""
+    normalizer = MySQLCompatibleNormalizer()
+    normalizer.rules.append(NormalizationRule(
+        name="rename_users",
+        pattern=r'\busers\b',
+        replacement='members',
+        description="Test-only rename"
+    ))
+    normalized, applied, _ = normalizer.normalize_query("SELECT id FROM users")
+    assert "members" in normalized
+    assert "rename_users" in applied
+
+
+if __name__ == "__main__":
+    test_fused_matches_legacy()
+    test_unknown_engine_rejected()
+    test_custom_rules_use_sequential_path()
+    print("✅ Fused normalizer tests passed")
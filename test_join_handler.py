@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Join Handler Test Script
+
+Checks that nested and long JOIN chains are parsed in linear time.
+"""
+
+import sys
+import os
+import time
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.join_handler import parse_joins_from_sql
+
+
+def test_triple_nested_content():
+    """The triple-nested path still sees every JOIN in the bracket group"""
+    sql = """SELECT * FROM (((`mt_item` join `mv_order` on(`mt_item`.`OrderID` = `mv_order`.`OrderID`))
+    left join `mv_item_status_desc` on(`mt_item`.`iType` = `mv_item_status_desc`.`Item_Type`))
+    left join `mv_item_type_desc` on(`mt_item`.`iType` = `mv_item_type_desc`.`DESC_CODE`))"""
+    joins, _ = parse_joins_from_sql(sql)
+    tables = [join.table_reference.table_name for join in joins]
+    assert tables == ['mv_order', 'mv_item_status_desc', 'mv_item_type_desc']
+
+
+def _join_chain(count):
+    sql = "SELECT t0.id FROM t0"
+    for i in range(1, count):
+        sql += f" LEFT JOIN t{i} a{i} ON a{i}.id = t{i - 1}.id"
+    return sql + " WHERE t0.x = 1"
+
+
+def test_long_join_chain_scales():
+    """Hundreds of JOINs are all found, without quadratic slow-down"""
+    parse_joins_from_sql(_join_chain(50))
+
+    start = time.perf_counter()
+    joins, aliases = parse_joins_from_sql(_join_chain(100))
+    small = time.perf_counter() - start
+
+    start = time.perf_counter()
+    joins, aliases = parse_joins_from_sql(_join_chain(800))
+    large = time.perf_counter() - start
+
+    assert len(joins) == 799 and len(aliases) == 799
+    assert joins[-1].table_reference.table_name == 't799'
+    # 8x the JOINs: linear is ~8x, the old quadratic scan was ~60x
+    assert large < small * 30 + 0.05
+
+
+if __name__ == "__main__":
+    test_triple_nested_content()
+    test_long_join_chain_scales()
+    print("✅ Join handler tests passed")
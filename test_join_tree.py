@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Join Tree Test Script
+
+Checks the recursive-descent FROM/JOIN parser: arbitrary bracket nesting,
+derived tables, USING/CROSS joins and JOIN-like functions.
+"""
+
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.join_handler import JoinHandler, parse_joins_from_sql
+
+
+def _summary(sql):
+    joins, aliases = parse_joins_from_sql(sql)
+    return [(join.join_type, join.table_reference.table_name) for join in joins], aliases
+
+
+def test_nesting_depth_independent():
+    """The same JOIN chain gives the same JOINs at any bracket depth"""
+    flat = ("SELECT * FROM orders o JOIN customers c ON o.cid = c.id "
+            "LEFT JOIN regions r ON c.rid = r.id")
+    expected = [('INNER', 'customers'), ('LEFT', 'regions')]
+    assert _summary(flat)[0] == expected
+
+    for depth in (1, 2, 3, 6):
+        nested = ("SELECT * FROM " + "(" * depth + "orders o JOIN customers c ON(o.cid = c.id)) " +
+                  "LEFT JOIN regions r ON(c.rid = r.id)" + ")" * (depth - 1))
+        joins, aliases = _summary(nested)
+        assert joins == expected, (depth, joins)
+        assert aliases == {'c': 'customers', 'r': 'regions'}
+
+
+def test_condition_stops_at_group_end():
+    """ON(...) conditions end at the bracket that closes their group"""
+    joins, _ = parse_joins_from_sql(
+        "SELECT * FROM ((`items` join `orders` on(`items`.`oid` = `orders`.`id`)) "
+        "left join `status` on(`items`.`st` = `status`.`code`)) where `items`.`x` < 1")
+    assert [join.condition.condition_text for join in joins] == [
+        "(`items`.`oid` = `orders`.`id`)", "(`items`.`st` = `status`.`code`)"
+    ]
+
+
+def test_derived_tables_and_subqueries():
+    """JOINs inside derived tables and ON subqueries are found too"""
+    joins, aliases = _summary(
+        "SELECT * FROM (SELECT a.id FROM accounts a JOIN users u ON a.uid = u.id) s "
+        "JOIN orders o ON o.sid = s.id AND o.pid IN (SELECT p.id FROM products p "
+        "RIGHT JOIN vendors v ON p.vid = v.id)")
+    assert sorted(joins) == [('INNER', 'orders'), ('INNER', 'users'), ('RIGHT', 'vendors')]
+    assert aliases['o'] == 'orders'
+
+
+def test_join_variants():
+    """CROSS / NATURAL / USING joins parse; LEFT(...) is not a JOIN"""
+    joins, _ = _summary(
+        "SELECT LEFT(name, 3) FROM customers CROSS JOIN regions "
+        "NATURAL JOIN countries JOIN orders USING (customer_id) WHERE RIGHT(code, 2) = 'x'")
+    assert joins == [('INNER', 'regions'), ('INNER', 'countries'), ('INNER', 'orders')]
+
+
+def test_very_deep_nesting():
+    """Pathological nesting neither recurses without bound nor loses JOINs"""
+    sql = "SELECT * FROM " + "(" * 2000 + "ta JOIN tb ON ta.i = tb.i" + ")" * 2000
+    joins, _ = _summary(sql)
+    assert joins == [('INNER', 'tb')]
+
+    handler = JoinHandler()
+    handler.parse_joins_from_sql(sql)
+    assert handler.get_join_summary()["total"] == 1
+
+
+if __name__ == "__main__":
+    test_nesting_depth_independent()
+    test_condition_stops_at_group_end()
+    test_derived_tables_and_subqueries()
+    test_join_variants()
+    test_very_deep_nesting()
+    print("✅ Join tree tests passed")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Parse Cache Test Script
+
+Checks the bounded LRU result cache in SQLParserAST: hit/miss/eviction
+counters, the byte limit, and that hits hand out independent copies.
+"""
+
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core.parse_cache import ParseCache
+
+TEST_SQL = "SELECT u.name, o.total FROM users u JOIN orders o ON u.id = o.user_id WHERE o.total > 10"
+
+
+def test_cache_hit_returns_copy():
+    """Mutating a returned result never leaks into the cache"""
+    parser = SQLParserAST(cache_size=8)
+    first = parser.parse(TEST_SQL)
+    first["tables"].append("tampered")
+
+    second = parser.parse(TEST_SQL)
+    assert "tampered" not in second["tables"]
+    assert second == parser.parse(TEST_SQL)
+
+    info = parser.cache_info()
+    assert info["enabled"]
+    assert (info["hits"], info["misses"], info["entries"]) == (2, 1, 1)
+
+
+def test_cache_lru_eviction():
+    """Least recently used entries are evicted first"""
+    cache = ParseCache(max_entries=2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    cache.get("a")
+    cache.put("c", {"v": 3})
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.info()["evictions"] == 1
+
+
+def test_cache_max_bytes():
+    """The serialized size of all entries stays under max_bytes"""
+    cache = ParseCache(max_entries=100, max_bytes=64)
+    for i in range(10):
+        cache.put(str(i), {"value": "x" * 20})
+
+    info = cache.info()
+    assert info["bytes"] <= 64
+    assert info["evictions"] > 0
+    assert not cache.put("big", {"value": "x" * 100})
+
+
+def test_cache_by_normalized_sql():
+    """Formatting-only variants share one entry when keyed on normalized SQL"""
+    parser = SQLParserAST(cache_size=8, cache_by_normalized_sql=True)
+    parser.parse(TEST_SQL)
+    parser.parse("  " + TEST_SQL.replace(" JOIN ", "\n   JOIN "))
+
+    info = parser.cache_info()
+    assert (info["hits"], info["entries"]) == (1, 1)
+
+    parser.clear_cache()
+    assert parser.cache_info()["entries"] == 0
+
+
+def test_failed_parses_not_cached():
+    """Only successful results are cached"""
+    parser = SQLParserAST(cache_size=8)
+    parser.parse(None)
+    assert parser.cache_info()["entries"] == 0
+
+
+if __name__ == "__main__":
+    test_cache_hit_returns_copy()
+    test_cache_lru_eviction()
+    test_cache_max_bytes()
+    test_cache_by_normalized_sql()
+    test_failed_parses_not_cached()
+    print("✅ Parse cache tests passed")
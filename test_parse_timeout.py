@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Parse Timeout Test Script
+
+Checks the per-parse time budget (parse(sql, timeout=...), parse_timeout and
+sql-splitter --timeout) and that the clause patterns stay linear on large or
+malformed input.
+"""
+
+import sys
+import os
+import io
+import json
+import re
+import time
+from contextlib import redirect_stdout, redirect_stderr
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core import iter_parse_sql_batch
+from sql_splitter.core.deadline import ParseDeadline, ParseTimeoutError
+from sql_splitter.core.regex_registry import LazyClause, LineScopedPattern
+from sql_splitter.core.sql_normalizer_mysql import MySQLCompatibleNormalizer
+from sql_splitter.core.sql_parser_ast_v6_0 import main
+
+TEST_SQL = "SELECT u.name, o.total FROM users u JOIN orders o ON u.id = o.user_id WHERE u.active = 1"
+SPENT = 1e-9  # Budget that is always gone by the first checkpoint
+
+
+def test_deadline():
+    """ParseDeadline raises at check() once its budget is spent"""
+    deadline = ParseDeadline(60)
+    assert not deadline.expired() and deadline.remaining() > 59
+    deadline.check("normalize")
+
+    spent = ParseDeadline(SPENT)
+    try:
+        spent.check("structure")
+        assert False, "expected ParseTimeoutError"
+    except ParseTimeoutError as e:
+        assert e.phase == "structure"
+        assert "structure" in str(e)
+        assert e.to_dict()["budgetMs"] == round(SPENT * 1000.0, 3)
+
+    for bad in (0, -1):
+        try:
+            ParseDeadline(bad)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+    # poll() reads the clock every POLL_INTERVAL calls and reports the last phase
+    polled = ParseDeadline(SPENT)
+    polled.phase = "content.where"
+    try:
+        for _ in range(ParseDeadline.POLL_INTERVAL):
+            polled.poll()
+        assert False, "expected ParseTimeoutError"
+    except ParseTimeoutError as e:
+        assert e.phase == "content.where"
+
+
+def test_timeout_error_result():
+    """A spent budget yields an error result instead of raising"""
+    result = SQLParserAST().parse(TEST_SQL, timeout=SPENT)
+    assert result["success"] is False
+    assert result["errorType"] == "timeout"
+    assert result["timeout"]["phase"] == "normalize"
+    assert result["timeout"]["elapsedMs"] >= 0
+    json.dumps(result)
+
+
+def test_generous_timeout_is_transparent():
+    """Parses that finish in time are identical to unlimited ones"""
+    assert SQLParserAST().parse(TEST_SQL, timeout=30) == SQLParserAST().parse(TEST_SQL)
+    parser = SQLParserAST(parse_timeout=30, use_token_stream=True)
+    assert parser.parse(TEST_SQL) == SQLParserAST(use_token_stream=True).parse(TEST_SQL)
+
+
+def test_parse_timeout_option():
+    """parse_timeout is the default budget; timeout= overrides it per call"""
+    parser = SQLParserAST(parse_timeout=SPENT, collect_diagnostics=True)
+    result = parser.parse(TEST_SQL)
+    assert result["errorType"] == "timeout"
+    assert parser.parse(TEST_SQL, timeout=30)["success"]
+    # The parser is reusable after a timeout
+    assert parser.parse(TEST_SQL)["errorType"] == "timeout"
+
+    try:
+        SQLParserAST(parse_timeout=0)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_timeouts_are_not_cached():
+    """Only successful results enter the result cache"""
+    parser = SQLParserAST(cache_size=8)
+    assert parser.parse(TEST_SQL, timeout=SPENT)["success"] is False
+    assert parser.parse(TEST_SQL)["success"] is True
+
+
+def test_budget_stops_long_phases():
+    """Long phases poll the budget, so a huge comma-join view stops near it"""
+    sql = _comma_join(6000)
+    for use_token_stream in (False, True):
+        parser = SQLParserAST(use_token_stream=use_token_stream)
+        full = _elapsed(parser.parse, sql)
+        for fraction in (0.1, 0.4, 0.7):
+            start = time.perf_counter()
+            result = parser.parse(sql, timeout=full * fraction)
+            elapsed = time.perf_counter() - start
+            if result["success"]:
+                continue  # this run happened to be faster than the reference
+            assert result["errorType"] == "timeout"
+            assert elapsed < full * (fraction + 0.25), (use_token_stream, fraction, full, elapsed)
+
+
+def test_batch_and_cli_timeout():
+    """parse_timeout reaches the batch parsers and sql-splitter --timeout"""
+    results = list(iter_parse_sql_batch([TEST_SQL, "SELECT a FROM t1"], workers=1, parse_timeout=SPENT))
+    assert [result["errorType"] for result in results] == ["timeout", "timeout"]
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    old_stdin = sys.stdin
+    sys.stdin = io.StringIO(TEST_SQL + ";\nSELECT a FROM t1;\n")
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            code = main(['--timeout', '30', '-q'])
+            bad = main(['--timeout', '0'])
+    finally:
+        sys.stdin = old_stdin
+    assert code == 0
+    assert all(json.loads(line)["success"] for line in stdout.getvalue().splitlines())
+    assert bad == 2 and "--timeout" in stderr.getvalue()
+
+
+def test_lazy_clause_matches_regex():
+    """LazyClause finds the same clause as the regular expression it replaces"""
+    clause = LazyClause(r'\bWHERE\s+', r'\s+(?:GROUP\s+BY|ORDER\s+BY|LIMIT)', re.IGNORECASE,
+                        'test.where_clause', end_anchor=True)
+    reference = re.compile(clause.pattern, re.IGNORECASE | re.DOTALL)
+    samples = [
+        "SELECT a FROM t WHERE x = 1 GROUP BY a",
+        "SELECT a FROM t WHERE  x = 1\n  ORDER BY a LIMIT 3",
+        "SELECT a FROM t WHERE   GROUP BY a",
+        "SELECT a FROM t WHERE x = 1\n",
+        "SELECT a FROM t WHERE x = 1",
+        "SELECT a FROM t",
+    ]
+    for sql in samples:
+        expected = reference.search(sql)
+        found = clause.search(sql)
+        if expected is None:
+            assert found is None, sql
+        else:
+            assert found.span() == expected.span() and found.group(1) == expected.group(1), sql
+
+
+def test_line_scoped_pattern_matches_regex():
+    """LineScopedPattern substitutes exactly like re.sub"""
+    pattern = r'FROM\s+(.*?)\s+WHERE\s+(\w+)'
+    scoped = LineScopedPattern(pattern, re.IGNORECASE | re.MULTILINE, 'test.from_where', r'FROM\s+')
+    reference = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    samples = [
+        "SELECT a FROM t1 a, t2 b WHERE a.id = b.id",
+        "FROM x FROM y\n FROM\n z WHERE w",
+        "FROM a FROM b WHERE c\nFROM d WHERE e",
+        "FROM a\nWHERE b FROM",
+    ]
+    for sql in samples:
+        assert scoped.sub(r'<\1|\2>', sql) == reference.sub(r'<\1|\2>', sql), sql
+
+
+def _elapsed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def _comma_join(count):
+    return ("SELECT t0.id FROM " + ", ".join(f"tab{i} t{i}" for i in range(count)) + " WHERE " +
+            " AND ".join(f"t{i - 1}.id = t{i}.pid" for i in range(1, count)) + " AND t0.x > 1")
+
+
+def test_adversarial_input_scales_linearly():
+    """Doubling pathological input roughly doubles the parse time"""
+    parser = SQLParserAST()
+    normalizer = MySQLCompatibleNormalizer()
+    cases = [
+        (parser.parse, lambda n: "SELECT " * n + "a"),
+        (parser.parse, lambda n: "SELECT a FROM tt " + "GROUP BY a " * n),
+        (parser.parse, lambda n: "WITH x AS (SELECT 1) " * n),
+        (normalizer.normalize_query, lambda n: "SELECT a " + "FROM tt " * n),
+        (normalizer.normalize_query, lambda n: "SELECT a FROM tt" + " " * (n * 20) + "x"),
+        (normalizer.normalize_query, _comma_join),
+    ]
+    for function, build in cases:
+        small = min(_elapsed(function, build(400)) for _ in range(3))
+        large = min(_elapsed(function, build(1600)) for _ in range(3))
+        # Linear work grows ~4x here; the quadratic patterns grew ~16x
+        assert large < max(small, 0.002) * 10, (build(1)[:30], small, large)
+
+
+if __name__ == "__main__":
+    test_deadline()
+    test_timeout_error_result()
+    test_generous_timeout_is_transparent()
+    test_parse_timeout_option()
+    test_timeouts_are_not_cached()
+    test_budget_stops_long_phases()
+    test_batch_and_cli_timeout()
+    test_lazy_clause_matches_regex()
+    test_line_scoped_pattern_matches_regex()
+    test_adversarial_input_scales_linearly()
+    print("✅ All parse timeout tests passed")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Persistent Cache Test Script
+
+Checks the SQLite-backed result cache: results survive a parser restart,
+only changed statements are reparsed, namespaces isolate parser versions,
+LRU eviction holds the limits, and disk errors degrade to cache misses.
+"""
+
+import sys
+import os
+import io
+import json
+import sqlite3
+import tempfile
+from contextlib import redirect_stdout
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core.persistent_cache import PersistentParseCache
+from sql_splitter.core.cli import main as cli_main
+
+VIEWS = [f"SELECT v{index}.id, c.name FROM orders v{index} JOIN customers c ON v{index}.cid = c.id "
+         f"WHERE v{index}.total > {index}" for index in range(20)]
+
+
+def _path(directory):
+    return os.path.join(directory, "cache", "parse.db")
+
+
+def test_results_survive_restart():
+    """A second parser over the same file reparses only changed views"""
+    with tempfile.TemporaryDirectory() as directory:
+        first = SQLParserAST(cache_path=_path(directory))
+        expected = [first.parse(sql) for sql in VIEWS]
+        assert first.cache_info()["misses"] == len(VIEWS)
+        first.result_cache.close()
+
+        restarted = SQLParserAST(cache_path=_path(directory))
+        assert restarted.warm_cache() == len(VIEWS)
+        changed = VIEWS[:-1] + [VIEWS[-1] + " AND c.active = 1"]
+        results = [restarted.parse(sql) for sql in changed]
+
+        info = restarted.cache_info()
+        assert (info["hits"], info["misses"], info["entries"]) == (len(VIEWS) - 1, 1, len(VIEWS) + 1)
+        assert results[:-1] == expected[:-1]
+        assert results[-1] == SQLParserAST().parse(changed[-1])
+
+        # Hits are private copies
+        results[0]["tables"].append("tampered")
+        assert restarted.parse(VIEWS[0]) == expected[0]
+
+
+def test_namespaces_isolate_parser_configurations():
+    """Other versions/options never read each other's entries; purge_stale drops them"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _path(directory)
+        SQLParserAST(cache_path=path).parse(VIEWS[0])
+
+        token_mode = SQLParserAST(cache_path=path, use_token_stream=True)
+        assert token_mode.warm_cache() == 0
+        token_mode.parse(VIEWS[0])
+        assert token_mode.cache_info()["misses"] == 1
+
+        cache = PersistentParseCache(path, namespace=token_mode._cache_namespace())
+        assert len(cache) == 2
+        assert cache.purge_stale() == 1 and len(cache) == 1
+        cache.close()
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """Least recently used entries go first, also across reopening"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _path(directory)
+        with PersistentParseCache(path, max_entries=2) as cache:
+            cache.put("a", {"v": 1})
+            cache.put("b", {"v": 2})
+            assert cache.get("a") == {"v": 1}
+
+        with PersistentParseCache(path, max_entries=2) as cache:
+            cache.put("c", {"v": 3})
+            assert "a" in cache and "b" not in cache and "c" in cache
+            assert cache.info()["evictions"] == 1
+
+        payload = {"text": "x" * 100}
+        with PersistentParseCache(path, max_bytes=250) as cache:
+            cache.clear()
+            for key in ("p", "q", "r"):
+                assert cache.put(key, payload)
+            info = cache.info()
+            assert info["entries"] == 2 and info["bytes"] <= 250 and "p" not in cache
+            assert not cache.put("huge", {"text": "x" * 500})
+
+
+def test_bounded_fill_keeps_totals():
+    """Filling a bounded cache with thousands of entries keeps both limits and exact totals"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _path(directory)
+        with PersistentParseCache(path, max_entries=500, max_bytes=40000) as cache:
+            for index in range(3000):
+                assert cache.put(f"k{index}", {"v": index, "pad": "x" * (index % 97)})
+            cache.put("k2999", {"v": "replaced"})
+            info = cache.info()
+            assert info["entries"] <= 500 and info["bytes"] <= 40000
+            assert info["evictions"] == 3000 - info["entries"]
+            assert "k0" not in cache and cache.get("k2999") == {"v": "replaced"}
+
+        conn = sqlite3.connect(path)
+        actual = conn.execute("SELECT COUNT(*), SUM(size) FROM parse_cache").fetchone()
+        conn.close()
+        with PersistentParseCache(path) as cache:
+            assert (cache.info()["entries"], cache.info()["bytes"]) == actual
+            assert len(cache) == actual[0]
+
+
+def test_disk_errors_are_cache_misses():
+    """A broken cache database never makes parse() fail"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = _path(directory)
+        parser = SQLParserAST(cache_path=path)
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE parse_cache")
+        conn.commit()
+        conn.close()
+
+        result = parser.parse(VIEWS[1])
+        assert result == SQLParserAST().parse(VIEWS[1])
+        assert parser.result_cache.errors >= 2  # failed read and failed write
+
+
+def test_cli_cache_option():
+    """sql-splitter --cache reuses results between runs"""
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "views.sql")
+        with open(source, "w") as handle:
+            handle.write(";\n".join(VIEWS[:5]) + ";\n")
+        runs = []
+        for _ in range(2):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                assert cli_main(["-q", "--cache", _path(directory), source]) == 0
+            runs.append([json.loads(line) for line in output.getvalue().splitlines()])
+        assert runs[0] == runs[1] and len(runs[0]) == 5
+        with PersistentParseCache(_path(directory)) as cache:
+            assert len(cache) == 5
+
+
+if __name__ == "__main__":
+    test_results_survive_restart()
+    test_namespaces_isolate_parser_configurations()
+    test_lru_eviction_by_entries_and_bytes()
+    test_bounded_fill_keeps_totals()
+    test_disk_errors_are_cache_misses()
+    test_cli_cache_option()
+    print("✅ All persistent cache tests passed")
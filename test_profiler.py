@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Parse Profiler Test Script
+
+Checks the per-phase timing instrumentation: metadata.timings on results,
+allocation counts, and histograms aggregated across parse calls.
+"""
+
+import sys
+import os
+import json
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core.profiler import ParseProfiler, PhaseHistogram
+
+TEST_SQL = "SELECT u.name, COUNT(*) AS n FROM users u JOIN orders o ON u.id = o.user_id WHERE u.active = 1 GROUP BY u.name"
+
+
+def test_timings_off_by_default():
+    """Results are unchanged unless profiling is requested"""
+    result = SQLParserAST().parse(TEST_SQL)
+    assert "timings" not in result.get("metadata", {})
+
+
+def test_metadata_timings():
+    """profile_timings attaches per-phase wall time and allocation counts"""
+    result = SQLParserAST(profile_timings=True).parse(TEST_SQL)
+    timings = result["metadata"]["timings"]
+    expected = {"normalize", "structure", "structure.cte", "structure.joins", "structure.tables",
+                "content", "content.fields", "content.where", "content.output", "total"}
+    assert expected <= set(timings)
+    for phase in timings.values():
+        assert phase["ms"] >= 0
+        assert isinstance(phase["allocatedBlocks"], int)
+    # Sub-phases are listed right after their parent and fit inside it
+    names = list(timings)
+    assert names.index("structure") < names.index("structure.cte") < names.index("content")
+    assert timings["structure.joins"]["ms"] <= timings["structure"]["ms"]
+    # Remaining output is identical to an unprofiled parse
+    del result["metadata"]["timings"]
+    if not result["metadata"]:
+        del result["metadata"]
+    assert result == SQLParserAST().parse(TEST_SQL)
+    json.dumps(result)
+
+
+def test_profiler_histograms():
+    """A profiler aggregates every parse into per-phase histograms"""
+    profiler = ParseProfiler(keep_slowest=2)
+    parser = SQLParserAST(profiler=profiler, use_token_stream=True)
+    for index in range(5):
+        parser.parse(f"SELECT a FROM t{index} WHERE b = {index}")
+    parser.parse(TEST_SQL)
+
+    stats = profiler.stats()
+    assert stats["parses"] == 6
+    total = stats["phases"]["total"]
+    assert total["count"] == 6
+    assert sum(total["histogram"].values()) == 6
+    assert total["minMs"] <= total["p50Ms"] <= total["maxMs"]
+    assert "tokenize" in stats["phases"] and "content.clauses" in stats["phases"]
+    assert len(stats["slowest"]) == 2
+    assert stats["slowest"][0]["totalMs"] >= stats["slowest"][1]["totalMs"]
+    assert "structure.joins" in profiler.format_table()
+
+    profiler.reset()
+    assert profiler.stats()["parses"] == 0
+
+
+def test_profiler_as_callback():
+    """The profiler also works as a diagnostics_callback and counts cache hits"""
+    profiler = ParseProfiler()
+    parser = SQLParserAST(diagnostics_callback=profiler, cache_size=4)
+    parser.parse(TEST_SQL)
+    parser.parse(TEST_SQL)
+    stats = profiler.stats()
+    assert stats["parses"] == 2
+    assert stats["cacheHits"] == 1
+
+
+def test_histogram_buckets():
+    """Observations land in the first bucket whose bound covers them"""
+    histogram = PhaseHistogram((1.0, 10.0))
+    for ms in (0.5, 1.0, 5.0, 50.0):
+        histogram.add(ms)
+    summary = histogram.to_dict()
+    assert summary["histogram"] == {"<=1ms": 2, "<=10ms": 1, ">10ms": 1}
+    assert summary["p50Ms"] == 1.0
+    assert summary["p99Ms"] == 50.0
+
+
+if __name__ == "__main__":
+    test_timings_off_by_default()
+    test_metadata_timings()
+    test_profiler_histograms()
+    test_profiler_as_callback()
+    test_histogram_buckets()
+    print("✅ Parse profiler tests passed")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Regex Registry Test Script
+
+Checks the shared regex registry: patterns are declared once, warm()
+compiles them all, and opt-in stats attribute calls to named patterns.
+"""
+
+import re
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core.regex_registry import RegexRegistry, REGEX_REGISTRY, regex
+
+TEST_SQL = "SELECT u.name, COUNT(o.id) FROM users u LEFT JOIN orders o ON u.id = o.user_id GROUP BY u.name"
+
+
+def test_register_is_idempotent():
+    """The same pattern and flags share one tracked entry"""
+    registry = RegexRegistry()
+    first = registry.register(r'\bSELECT\b', re.IGNORECASE, 'select')
+    second = registry.register(r'\bSELECT\b', re.IGNORECASE, 'other_name')
+    third = registry.register(r'\bSELECT\b')
+
+    assert first is second
+    assert first is not third
+    assert len(registry) == 2
+
+
+def test_tracked_pattern_matches_re():
+    """TrackedPattern behaves like the compiled re.Pattern"""
+    pattern = regex(r'(\w+)\.(\w+)', 0, 'test.dotted')
+    text = "a.b = c.d"
+    compiled = re.compile(r'(\w+)\.(\w+)')
+
+    assert pattern.findall(text) == compiled.findall(text)
+    assert pattern.sub(r'\2', text) == compiled.sub(r'\2', text)
+    assert pattern.search(text, 3).group(0) == "c.d"
+
+
+def test_warm_and_stats():
+    """Core modules register their patterns and stats count calls"""
+    assert REGEX_REGISTRY.warm() > 50
+    assert all(entry["compiled"] for entry in REGEX_REGISTRY.stats())
+
+    REGEX_REGISTRY.reset_stats()
+    REGEX_REGISTRY.enable_stats()
+    try:
+        result = SQLParserAST().parse(TEST_SQL)
+    finally:
+        REGEX_REGISTRY.enable_stats(False)
+
+    assert result["success"]
+    report = REGEX_REGISTRY.stats(top=5)
+    assert len(report) == 5
+    assert report[0]["calls"] > 0
+    assert sum(entry["calls"] for entry in REGEX_REGISTRY.stats()) > 10
+    REGEX_REGISTRY.reset_stats()
+
+
+if __name__ == "__main__":
+    test_register_is_idempotent()
+    test_tracked_pattern_matches_re()
+    test_warm_and_stats()
+    print("✅ Regex registry tests passed")
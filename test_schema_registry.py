@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Schema Registry Test Script
+
+Checks the shared database-name registry: loading from files and from
+information_schema.SCHEMATA, constant-time prefix handling, and that a custom
+registry reaches the normalizer, the extractors, the cache key and batch workers.
+"""
+
+import sys
+import os
+import pickle
+import tempfile
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core import SchemaRegistry, DEFAULT_SCHEMA_REGISTRY, parse_sql_batch
+from sql_splitter.core.schema_registry import DEFAULT_DATABASE_NAMES
+
+SQL = ("SELECT sales_eu.orders.id, c.name FROM sales_eu.orders "
+       "JOIN crm.customers c ON sales_eu.orders.cid = c.id WHERE sales_eu.orders.total > 5")
+SCHEMAS = SchemaRegistry(['sales_eu', 'crm'])
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+        self.closed = False
+
+    def execute(self, query):
+        self.executed.append(query)
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeConnection:
+    """Minimal DB-API connection returning fixed SCHEMATA rows"""
+
+    def __init__(self, rows):
+        self.cursor_obj = _FakeCursor(rows)
+
+    def cursor(self):
+        return self.cursor_obj
+
+
+def test_default_registry():
+    """The default registry holds the built-in names"""
+    assert DEFAULT_SCHEMA_REGISTRY.names == DEFAULT_DATABASE_NAMES
+    assert 'momo' in DEFAULT_SCHEMA_REGISTRY
+    assert 'MOMO' not in DEFAULT_SCHEMA_REGISTRY
+    assert DEFAULT_SCHEMA_REGISTRY.contains_ignore_case('MOMO')
+    assert DEFAULT_SCHEMA_REGISTRY.strip_prefix('momo.orders.id') == 'orders.id'
+    assert DEFAULT_SCHEMA_REGISTRY.split_prefix('orders.id') == (None, 'orders.id')
+
+
+def test_from_file():
+    """JSON lists and plain name-per-line files with comments"""
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "schemas.txt")
+        with open(text_path, 'w', encoding='utf-8') as handle:
+            handle.write("# production schemas\nsales_eu\n  crm  # customers\n\n")
+        json_path = os.path.join(directory, "schemas.json")
+        with open(json_path, 'w', encoding='utf-8') as handle:
+            handle.write('["sales_eu", "crm"]')
+
+        assert SchemaRegistry.from_file(text_path) == SCHEMAS
+        assert SchemaRegistry.from_file(json_path) == SCHEMAS
+        assert SchemaRegistry.from_file(text_path, include_defaults=True).names == SCHEMAS.names | DEFAULT_DATABASE_NAMES
+
+
+def test_from_information_schema():
+    """SCHEMATA rows become the registry; system schemas are skipped by default"""
+    connection = _FakeConnection([('sales_eu',), ('crm',), ('mysql',), ('information_schema',)])
+    registry = SchemaRegistry.from_information_schema(connection)
+    assert registry == SCHEMAS
+    assert 'SCHEMATA' in connection.cursor_obj.executed[0]
+    assert connection.cursor_obj.closed
+
+    registry = SchemaRegistry.from_information_schema(connection, include_system=True)
+    assert 'mysql' in registry and len(registry) == 4
+
+
+def test_custom_registry_strips_prefixes():
+    """Custom database prefixes are stripped from tables, joins and conditions"""
+    default = SQLParserAST().parse(SQL)
+    assert 'sales_eu' in default['tables']
+    assert default['whereConditions'] == ['sales_eu.orders.total > 5']
+
+    for use_token_stream in (False, True):
+        result = SQLParserAST(schema_registry=SCHEMAS, use_token_stream=use_token_stream).parse(SQL)
+        assert result['tables'] == ['customers', 'orders']
+        assert result['whereConditions'] == ['orders.total > 5']
+        assert [field['field'] for field in result['fields']] == ['orders.id', 'c.name']
+    assert result['joins'][0]['condition'] == 'orders.cid = c.id'
+
+
+def test_empty_registry_is_kept():
+    """An empty registry is used as given, not replaced by the default"""
+    empty = SchemaRegistry([])
+    sql = "SELECT momo.orders.id FROM momo.orders WHERE momo.orders.total > 5"
+    for use_token_stream in (False, True):
+        parser = SQLParserAST(schema_registry=empty, use_token_stream=use_token_stream)
+        assert parser.schemas is empty
+        assert parser.parse(sql)['whereConditions'] == ['momo.orders.total > 5']
+    assert SQLParserAST(schema_registry=empty)._cache_namespace() != SQLParserAST()._cache_namespace()
+
+
+def test_registry_in_cache_key_and_workers():
+    """Registries key the result cache apart and survive pickling into batch workers"""
+    default = SQLParserAST()
+    custom = SQLParserAST(schema_registry=SCHEMAS)
+    assert default._cache_namespace() != custom._cache_namespace()
+    assert SQLParserAST(schema_registry=SchemaRegistry())._cache_namespace() == default._cache_namespace()
+
+    assert pickle.loads(pickle.dumps(SCHEMAS)) == SCHEMAS
+    results = parse_sql_batch([SQL, SQL], workers=2, schema_registry=SCHEMAS)
+    assert all(result['tables'] == ['customers', 'orders'] for result in results)
+
+if __name__ == "__main__":
+    test_default_registry()
+    test_from_file()
+    test_from_information_schema()
+    test_custom_registry_strips_prefixes()
+    test_empty_registry_is_kept()
+    test_registry_in_cache_key_and_workers()
+    print("✅ All schema registry tests passed")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared Helper Test Script
+
+Checks that the functional API (parse_sql, parse_sql_to_json and the
+normalizer helpers) reuses process-wide instances instead of rebuilding a
+parser and its normalization rules on every call.
+"""
+
+import sys
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST, parse_sql, parse_sql_to_json, normalize_sql_query
+from sql_splitter.core import sql_normalizer_mysql, sql_parser_ast_v6_0
+from sql_splitter.core.sql_normalizer_mysql import (
+    MySQLCompatibleNormalizer, get_normalization_rules, validate_mysql_syntax
+)
+
+TEST_SQL = "SELECT `u`.`name`, COUNT(*) AS `n` FROM `main_db`.`users` `u` JOIN `orders` `o` ON `u`.`id` = `o`.`uid` GROUP BY `u`.`name`"
+
+
+def test_parse_sql_reuses_one_parser():
+    """parse_sql builds one parser per mode and returns what a fresh parser would"""
+    assert parse_sql(TEST_SQL) == SQLParserAST().parse(TEST_SQL)
+    assert parse_sql(TEST_SQL, use_token_stream=True) == SQLParserAST(use_token_stream=True).parse(TEST_SQL)
+
+    shared = sql_parser_ast_v6_0._get_shared_parser()
+    assert shared is sql_parser_ast_v6_0._get_shared_parser()
+    assert shared is not sql_parser_ast_v6_0._get_shared_parser(use_token_stream=True)
+    assert json.loads(parse_sql_to_json(TEST_SQL)) == parse_sql(TEST_SQL)
+
+
+def test_results_are_independent():
+    """Callers may mutate a result without affecting later calls"""
+    first = parse_sql(TEST_SQL)
+    first["tables"].append("tampered")
+    first["fields"][0]["table"] = "tampered"
+    assert parse_sql(TEST_SQL) == SQLParserAST().parse(TEST_SQL)
+
+
+def test_normalizer_helpers_share_rules():
+    """The standalone normalizer functions load the rules once"""
+    default = sql_normalizer_mysql._get_default_normalizer()
+    assert default is sql_normalizer_mysql._get_default_normalizer()
+
+    fresh = MySQLCompatibleNormalizer()
+    assert normalize_sql_query(TEST_SQL) == fresh.normalize_query(TEST_SQL)[0]
+    assert get_normalization_rules() == [rule.name for rule in fresh.rules]
+    assert validate_mysql_syntax("SELECT a FROM t LEFT INNER JOIN u ON t.id = u.id") == \
+        fresh._validate_mysql_syntax("SELECT a FROM t LEFT INNER JOIN u ON t.id = u.id")
+
+    names = get_normalization_rules()
+    names.append("tampered")
+    assert "tampered" not in get_normalization_rules()
+
+
+def test_helpers_from_threads():
+    """The shared instances serve concurrent callers"""
+    queries = [f"SELECT a{index}.x FROM t{index} a{index} WHERE a{index}.y = {index}" for index in range(40)]
+    expected = [SQLParserAST().parse(sql) for sql in queries]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(parse_sql, queries)) == expected
+        assert list(pool.map(normalize_sql_query, queries)) == \
+            [MySQLCompatibleNormalizer().normalize_query(sql)[0] for sql in queries]
+
+
+if __name__ == "__main__":
+    test_parse_sql_reuses_one_parser()
+    test_results_are_independent()
+    test_normalizer_helpers_share_rules()
+    test_helpers_from_threads()
+    print("✅ All shared helper tests passed")
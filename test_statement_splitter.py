@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Statement Splitter Test Script
+
+Checks the streaming statement splitter on mysqldump-style input: quotes,
+comments, conditional comments, DELIMITER changes and chunk boundaries.
+"""
+
+import sys
+import os
+import io
+import tempfile
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.statement_splitter import StatementSplitter, split_statements, split_sql_file
+
+DUMP = """-- MySQL dump 10.13
+/*!40101 SET NAMES utf8 */;
+DROP TABLE IF EXISTS `t;1`;
+CREATE TABLE `t;1` (
+  `id` int, -- id; comment
+  `s` varchar(10) DEFAULT 'a;''b' /* x; */
+);
+INSERT INTO `t;1` VALUES (1,'x\\';y'),(2,"q;");
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER trg BEFORE INSERT ON t FOR EACH ROW BEGIN
+  SET NEW.id = 1; SET NEW.s = 'a;;b';
+END */;;
+DELIMITER ;
+SELECT 1;;
+DELIMITER $$
+CREATE PROCEDURE p() BEGIN SELECT 1; END$$
+delimiter ;
+SELECT 'tail'
+"""
+
+EXPECTED = [
+    "/*!40101 SET NAMES utf8 */",
+    "DROP TABLE IF EXISTS `t;1`",
+    "CREATE TABLE `t;1` (\n  `id` int, -- id; comment\n  `s` varchar(10) DEFAULT 'a;''b' /* x; */\n)",
+    "INSERT INTO `t;1` VALUES (1,'x\\';y'),(2,\"q;\")",
+    "/*!50003 CREATE*/ /*!50003 TRIGGER trg BEFORE INSERT ON t FOR EACH ROW BEGIN\n"
+    "  SET NEW.id = 1; SET NEW.s = 'a;;b';\nEND */",
+    "SELECT 1",
+    "CREATE PROCEDURE p() BEGIN SELECT 1; END",
+    "SELECT 'tail'",
+]
+
+
+def test_split_dump():
+    """Quotes, comments and DELIMITER changes are honoured"""
+    assert list(split_statements(DUMP)) == EXPECTED
+
+
+def test_chunk_boundaries():
+    """Any chunk size, text or binary, gives the same statements"""
+    for chunk_size in (1, 2, 3, 5, 8, 64):
+        assert list(StatementSplitter(chunk_size=chunk_size).split(io.StringIO(DUMP))) == EXPECTED
+        assert list(StatementSplitter(chunk_size=chunk_size).split(io.BytesIO(DUMP.encode()))) == EXPECTED
+
+
+def test_comment_like_delimiters():
+    """`//`, `--` and `-|` delimiters split outside strings and comments, at any chunk size"""
+    for delimiter in ("//", "--", "-|"):
+        script = (f"DELIMITER {delimiter}\n"
+                  f"SELECT 'a{delimiter}b' FROM t /* x {delimiter} y */ WHERE a - 1 > b / 2{delimiter}\n"
+                  f"SELECT \"q{delimiter}\", `c{delimiter}` # note {delimiter}\nFROM u{delimiter}\n"
+                  "DELIMITER ;\nSELECT 3;")
+        expected = [f"SELECT 'a{delimiter}b' FROM t /* x {delimiter} y */ WHERE a - 1 > b / 2",
+                    f"SELECT \"q{delimiter}\", `c{delimiter}` # note {delimiter}\nFROM u",
+                    "SELECT 3"]
+        assert list(split_statements(script)) == expected, delimiter
+        for chunk_size in (1, 2, 3, 5, 8):
+            splitter = StatementSplitter(chunk_size=chunk_size)
+            assert list(splitter.split(io.StringIO(script))) == expected, (delimiter, chunk_size)
+            assert list(splitter.split(io.BytesIO(script.encode()))) == expected, (delimiter, chunk_size)
+
+
+def test_double_dash_needs_whitespace():
+    """`--` only starts a comment when whitespace or a control character follows (MySQL)"""
+    script = "SELECT 1--2;\nSELECT 5--3;SELECT 2 --\t; note\n;SELECT 3 --;\nSELECT 4;"
+    expected = ["SELECT 1--2", "SELECT 5--3", "SELECT 2 --\t; note", "SELECT 3 --", "SELECT 4"]
+    assert list(split_statements(script)) == expected
+    for chunk_size in (1, 2, 3, 5):
+        assert list(StatementSplitter(chunk_size=chunk_size).split(io.StringIO(script))) == expected
+
+
+def test_split_file_mmap_and_stream():
+    """Files are split the same with and without mmap; empty files yield nothing"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dump.sql")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(DUMP)
+        assert list(split_sql_file(path)) == EXPECTED
+        assert list(split_sql_file(path, use_mmap=False, chunk_size=7)) == EXPECTED
+
+        empty = os.path.join(tmp, "empty.sql")
+        open(empty, "w").close()
+        assert list(split_sql_file(empty)) == []
+
+
+def test_incremental_reading():
+    """Statements are yielded before the whole input has been read"""
+    class CountingStream(io.StringIO):
+        reads = 0
+
+        def read(self, size=-1):
+            CountingStream.reads += 1
+            return super().read(size)
+
+    script = "".join(f"SELECT {i} FROM t{i};\n" for i in range(1000))
+    statements = StatementSplitter(chunk_size=256).split(CountingStream(script))
+    assert next(statements) == "SELECT 0 FROM t0"
+    assert CountingStream.reads == 1
+    assert sum(1 for _ in statements) == 999
+
+
+def test_invalid_delimiter():
+    """Delimiters must be non-empty and free of whitespace"""
+    for delimiter in ("", " ", "a b"):
+        try:
+            StatementSplitter(delimiter=delimiter)
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {delimiter!r}")
+
+
+if __name__ == "__main__":
+    test_split_dump()
+    test_chunk_boundaries()
+    test_comment_like_delimiters()
+    test_double_dash_needs_whitespace()
+    test_split_file_mmap_and_stream()
+    test_incremental_reading()
+    test_invalid_delimiter()
+    print("✅ Statement splitter tests passed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Table Scanner Test Script
+
+Checks that the single reference scan in TableExtractor gives every table
+pattern exactly the matches a separate re.finditer() pass would, and that
+extract_all_tables resolves tables and aliases as before.
+"""
+
+import sys
+import os
+import random
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.table_extractor import TableExtractor, _REFERENCE_SCANNER, _SegmentPattern
+from sql_splitter.core.regex_registry import REGEX_REGISTRY
+from benchmarks.corpus import load_expect_md_queries, nested_joins, wide_select
+
+QUERIES = list(load_expect_md_queries().values()) + [
+    nested_joins(8),
+    wide_select(20),
+    "SELECT `main_db`.`orders`.`id` FROM `main_db`.`orders` o LEFT   JOIN momo.items i ON i.oid = o.id",
+    "select IF(x.a, momo.t.f, 0), COALESCE(`p`.`q`, 1) OVER (PARTITION BY `s`.`k` ORDER BY `s`.`d`) from t x",
+    "SELECT * FROM acct a WHERE EXISTS (SELECT 1 FROM `bills` WHERE bills.id = a.id) AND a.v IN (SELECT v FROM `cards`)",
+    "SELECT (SELECT MAX(z) FROM `d`) m FROM ((( db.e JOIN f ON e.id=f.id)))xjoin g ON 1=1",
+    "SELECT caseless.col, iffy.x, İn.y, ſelect.z FROM Kelvin k\tINNER\nJOIN `x_db`.`h` AS hh ON hh.k = k.k",
+]
+
+_FRAGMENTS = ['SELECT ', 'FROM ', 'from', ' JOIN ', 'LEFT ', 'join', 'inner ', 'ON ', 'AS ', ' ', '\n', '`', '`t1`', '.',
+              'momo', 'main_db', 'orders', 'o', 'a1', '(', ')', '(((', ',', 'CASE ', 'IF', 'WHEN ', 'COALESCE', 'OVER ',
+              'PARTITION BY ', 'ORDER BY ', 'EXISTS ', 'IN ', 'x.y', 'a.b.c', 'ıf', 'ſum', '=', "'s'", 'END']
+
+
+def _expected_spans(pattern, sql):
+    compiled = pattern.pattern.compiled if isinstance(pattern, _SegmentPattern) else pattern.compiled
+    return [match.span() for match in compiled.finditer(sql)]
+
+
+def _assert_scan_matches_finditer(sql):
+    found = _REFERENCE_SCANNER.scan(sql)
+    for pattern in _REFERENCE_SCANNER.patterns:
+        assert [match.span() for match in found[pattern]] == _expected_spans(pattern, sql), (pattern, sql)
+
+
+def test_scan_matches_per_pattern_finditer():
+    """Every pattern gets the same matches as its own finditer() pass"""
+    for sql in QUERIES:
+        _assert_scan_matches_finditer(sql)
+
+
+def test_scan_matches_on_random_fragments():
+    """Also on noisy input: mid-word keywords, stray backticks, case-folded letters"""
+    rng = random.Random(21)
+    for _ in range(3000):
+        _assert_scan_matches_finditer(''.join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 30))))
+
+
+def test_extract_all_tables():
+    """Tables, aliases and database prefixes resolve as before"""
+    tables, aliases = TableExtractor().extract_all_tables(QUERIES[-5])
+    assert tables == ['items', 'orders']
+    assert aliases == {'o': 'orders'}
+
+    tables, _ = TableExtractor().extract_all_tables(QUERIES[-3])
+    assert tables == ['acct', 'bills', 'cards']
+
+    tables, aliases = TableExtractor().extract_all_tables(
+        "SELECT `o`.`id`, `c`.`name` FROM `orders` o JOIN `customers` AS cu ON `o`.`cid` = `cu`.`id`",
+        {'recent'})
+    assert tables == ['customers', 'orders', 'recent']
+    assert aliases == {'o': 'orders', 'cu': 'customers'}
+
+
+def test_single_pass():
+    """extract_all_tables runs the anchor scan once and no per-pattern finditer()"""
+    REGEX_REGISTRY.enable_stats()
+    try:
+        REGEX_REGISTRY.reset_stats()
+        TableExtractor().extract_all_tables(QUERIES[0])
+        calls = {entry["name"]: entry["calls"] for entry in REGEX_REGISTRY.stats()}
+    finally:
+        REGEX_REGISTRY.enable_stats(False)
+    assert calls['tables.reference_scanner'] == 1
+    assert all(pattern.calls == 0 for pattern in _REFERENCE_SCANNER.patterns
+               if not isinstance(pattern, _SegmentPattern))
+
+if __name__ == "__main__":
+    test_scan_matches_per_pattern_finditer()
+    test_scan_matches_on_random_fragments()
+    test_extract_all_tables()
+    test_single_pass()
+    print("✅ All table scanner tests passed")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Thread Safety Test Script
+
+Checks that one SQLParserAST can be shared by many threads: per-call state
+lives in a ParseContext, so concurrent parses return exactly what a private
+parser would.
+"""
+
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core.parse_context import ParseContext
+from benchmarks.corpus import load_expect_md_queries, nested_joins, cte_chain
+
+QUERIES = list(load_expect_md_queries().values()) + [
+    nested_joins(12),
+    cte_chain(6),
+    "SELECT a.id, b.name FROM alpha a, beta b WHERE a.id = b.alpha_id AND a.flag = 1",
+    "SELECT COUNT(*) AS n FROM solo",
+]
+
+
+def _expected(**options):
+    return [SQLParserAST(**options).parse(sql) for sql in QUERIES]
+
+
+def _hammer(parser, rounds=6, threads=8):
+    """Parse every query `rounds` times from `threads` threads, in shuffled order"""
+    jobs = [(round_index * 7 + index) % len(QUERIES)
+            for round_index in range(rounds) for index in range(len(QUERIES))]
+    start = threading.Barrier(threads)
+
+    def parse(index):
+        return index, parser.parse(QUERIES[index])
+
+    def warm(_):
+        start.wait()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(warm, range(threads)))
+        return list(pool.map(parse, jobs))
+
+
+def test_context_holds_call_state():
+    """Each ParseContext owns its handlers and alias map"""
+    first, second = ParseContext("SELECT 1"), ParseContext("SELECT 2")
+    assert first.table_aliases is not second.table_aliases
+    assert first.join_handler is not second.join_handler
+    assert first.content_extractor is not second.content_extractor
+
+    parser = SQLParserAST()
+    parser.parse(QUERIES[0])
+    assert not hasattr(parser, "table_aliases")
+    assert not hasattr(parser, "extracted_tables")
+
+
+def test_shared_parser_string_mode():
+    """Concurrent parses on one regex-mode parser match private parsers"""
+    expected = _expected()
+    parser = SQLParserAST()
+    for index, result in _hammer(parser):
+        assert result == expected[index], QUERIES[index][:60]
+
+
+def test_shared_parser_token_mode():
+    """Concurrent parses on one token-stream parser match private parsers"""
+    expected = _expected(use_token_stream=True, enable_normalization=False)
+    parser = SQLParserAST(use_token_stream=True, enable_normalization=False)
+    for index, result in _hammer(parser):
+        assert result == expected[index], QUERIES[index][:60]
+
+
+def test_shared_parser_with_cache_and_diagnostics():
+    """The result cache and diagnostics stay consistent under concurrency"""
+    expected = _expected()
+    reports = []
+    parser = SQLParserAST(cache_size=64, diagnostics_callback=reports.append, parse_timeout=60)
+    results = _hammer(parser, rounds=4)
+    for index, result in results:
+        assert result == expected[index], QUERIES[index][:60]
+    assert len(reports) == len(results)
+    info = parser.cache_info()
+    assert info["hits"] + info["misses"] == len(results)
+
+
+if __name__ == "__main__":
+    test_context_holds_call_state()
+    test_shared_parser_string_mode()
+    test_shared_parser_token_mode()
+    test_shared_parser_with_cache_and_diagnostics()
+    print("✅ All thread safety tests passed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Token Stream Code Test Script
+
+Checks the index-based TokenStream: the token list is shared instead of
+copied, word codes replace string uppercasing in match/consume, and the
+token-driven JOIN/table/CTE paths agree between list- and compact-backed
+streams.
+"""
+
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter.core.sql_tokenizer import (
+    SQLTokenizer, TokenStream, TokenType, TOKEN_TYPE_CODES, WORD_CODES, NO_WORD_CODE, word_code, word_codes
+)
+from sql_splitter.core.join_handler import JoinHandler
+from sql_splitter.core.table_extractor import TableExtractor
+from sql_splitter.core.cte_handler import CTEHandler
+from benchmarks.corpus import load_expect_md_queries, nested_joins, cte_chain
+
+QUERIES = list(load_expect_md_queries().values()) + [
+    nested_joins(8),
+    cte_chain(3),
+    "select a.x from t1 a cross join t2 b using (id) natural join `db`.`t3` as c where a.y in (select 1 from t4)",
+]
+
+
+def _structure(stream):
+    joins = JoinHandler()
+    join_rows = [(j.join_type, j.table_reference.table_name, j.table_reference.alias, j.condition.condition_text)
+                 for j in joins.parse_joins_from_tokens(stream)]
+    stream.reset()
+    tables = TableExtractor().extract_tables_from_tokens(stream, set())
+    stream.reset()
+    ctes = CTEHandler()
+    ctes.parse_cte_from_tokens(stream)
+    return join_rows, joins.table_aliases, tables, ctes.cte_definitions
+
+
+def test_token_list_is_shared_unless_filtered():
+    """Without comments the stream indexes the tokenizer's list directly"""
+    tokens = SQLTokenizer().tokenize("SELECT a FROM t")
+    stream = TokenStream(tokens)
+    assert stream.tokens is tokens
+    assert list(stream.types) == [TOKEN_TYPE_CODES[t.type] for t in tokens]
+
+    commented = SQLTokenizer().tokenize("SELECT a /* note */ FROM t -- tail")
+    stream = TokenStream(commented)
+    assert stream.tokens is not commented
+    assert [t.value for t in stream.tokens] == ['SELECT', 'a', 'FROM', 't']
+
+
+def test_word_codes():
+    """Codes are case-insensitive and closed over the vocabulary"""
+    assert word_code('select') == word_code('SELECT') == WORD_CODES['SELECT']
+    assert word_code('orders') == NO_WORD_CODE and word_code('`JOIN`') == NO_WORD_CODE
+    assert word_codes('cross', 'USING') == {WORD_CODES['CROSS'], WORD_CODES['USING']}
+
+    stream = SQLTokenizer().tokenize_stream("select `a` from orders o")
+    assert [code == NO_WORD_CODE for code in stream.codes] == [False, True, False, True, True]
+
+
+def test_match_and_consume_by_code():
+    """match/consume keep their case-insensitive semantics"""
+    stream = SQLTokenizer().tokenize_stream("select orders.id from orders using(x)")
+    assert stream.match('FROM', 'SELECT') and stream.match_keyword('SELECT')
+    assert not stream.consume('select', TokenType.IDENTIFIER)
+    assert stream.consume('Select', TokenType.KEYWORD).value == 'SELECT'
+
+    # Words outside the vocabulary fall back to comparing values
+    assert stream.match('ORDERS') and stream.consume('orders').value == 'orders'
+    assert stream.consume('.') and stream.consume('id', TokenType.IDENTIFIER)
+    assert stream.match_keyword('FROM') and not stream.match_next_keyword('USING')
+    stream.position = 5
+    assert stream.consume_qualified_name() == ['orders'] and stream.match('using')
+    stream.position = len(stream.types)
+    assert not stream.match('FROM') and stream.consume() is None and stream.current() is None
+
+
+def test_compact_and_list_streams_agree():
+    """Token-driven JOIN/table/CTE extraction is identical on both backings"""
+    tokenizer = SQLTokenizer()
+    for sql in QUERIES:
+        regular = tokenizer.tokenize_stream(sql)
+        compact = tokenizer.tokenize_stream(sql, compact=True)
+        assert list(regular.codes) == list(compact.codes)
+        assert _structure(regular) == _structure(compact), sql[:60]
+
+
+if __name__ == "__main__":
+    test_token_list_is_shared_unless_filtered()
+    test_word_codes()
+    test_match_and_consume_by_code()
+    test_compact_and_list_streams_agree()
+    print("✅ All token stream code tests passed")
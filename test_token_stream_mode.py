@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Token Stream Mode Test Script
+
+Checks that the single-pass token stream mode (tokenize once, every phase
+reads the same TokenStream) produces expect.md shaped output.
+"""
+
+import sys
+import os
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core.sql_tokenizer import SQLTokenizer
+
+MV_ITEM_SQL = (
+    "select `mt_item`.`DetailsID` AS `DetailsID`,`mv_order`.`Customer` AS `Customer` "
+    "from (((`mt_item` join `mv_order` on(`mt_item`.`Details_OrderID` = `mv_order`.`OrderID`)) "
+    "left join `mv_item_status_desc` on(`mt_item`.`iStatus` = `mv_item_status_desc`.`DESC_CODE`)) "
+    "left join `mv_item_type_desc` on(`mt_item`.`iType` = `mv_item_type_desc`.`DESC_CODE`)) "
+    "where `mt_item`.`iDeleted` < 1"
+)
+
+
+def test_tokenize_stream_keeps_source_text():
+    """Token positions slice back into the scanned SQL"""
+    stream = SQLTokenizer().tokenize_stream("SELECT a, b FROM t WHERE x = 'y z'")
+    assert stream.text(0, 4) == "SELECT a, b"
+    assert stream.tokens[-1].value == "'y z'"
+
+
+def test_token_mode_nested_joins():
+    """Bracketed JOIN chains resolve to one JOIN per table"""
+    parser = SQLParserAST(enable_normalization=False, use_token_stream=True)
+    result = parser.parse(MV_ITEM_SQL)
+
+    assert result["success"]
+    assert [join["rightTable"] for join in result["joins"]] == [
+        "mv_order", "mv_item_status_desc", "mv_item_type_desc"
+    ]
+    assert result["joins"][0]["type"] == "INNER"
+    assert result["joins"][0]["condition"] == "(`mt_item`.`Details_OrderID` = `mv_order`.`OrderID`)"
+    assert result["whereConditions"] == ["mt_item.iDeleted < 1"]
+
+
+def test_token_mode_where_split_respects_groups_and_strings():
+    """AND/OR inside parentheses or string literals do not split conditions"""
+    parser = SQLParserAST(use_token_stream=True)
+    result = parser.parse(
+        "SELECT a FROM t WHERE (a = 1 OR b = 2) AND c LIKE 'x and y' "
+        "AND d BETWEEN 1 AND 5"
+    )
+
+    assert result["whereConditions"] == [
+        "(a = 1 OR b = 2)", "c LIKE 'x and y'", "d BETWEEN 1 AND 5"
+    ]
+
+
+def test_token_mode_cte_main_query():
+    """Fields and WHERE come from the main query, not from CTE bodies"""
+    parser = SQLParserAST(use_token_stream=True)
+    result = parser.parse(
+        "WITH a AS (SELECT id, x FROM t1 WHERE x > 1) "
+        "SELECT a.id, t2.y FROM a JOIN t2 ON a.id = t2.id WHERE t2.y < 3"
+    )
+
+    assert result["success"]
+    assert [field["field"] for field in result["fields"]] == ["a.id", "t2.y"]
+    assert result["whereConditions"] == ["t2.y < 3"]
+    assert "t1" in result["tables"] and "t2" in result["tables"]
+
+
+if __name__ == "__main__":
+    test_tokenize_stream_keeps_source_text()
+    test_token_mode_nested_joins()
+    test_token_mode_where_split_respects_groups_and_strings()
+    test_token_mode_cte_main_query()
+    print("✅ Token stream mode tests passed")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+WHERE Conditions Test Script
+
+Checks the token-based WHERE splitter: depth-0 AND/OR splitting that keeps
+parenthesized groups, string literals and BETWEEN ... AND ... intact, the
+nested AND/OR condition tree, and that string and token mode agree (also
+for comma joins, whose condition the normalizer moves into JOIN ... ON).
+"""
+
+import sys
+import os
+import time
+
+# Add the sql_splitter package to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sql_splitter import SQLParserAST
+from sql_splitter.core import ContentExtractor, LogicalConditionNode, SQLTokenizer
+
+CASES = [
+    ("SELECT a FROM t WHERE (a = 1 OR b = 2) AND c LIKE 'x and y' AND d IS NOT NULL",
+     ['(a = 1 OR b = 2)', "c LIKE 'x and y'", 'd IS NOT NULL'],
+     {'operator': 'AND', 'operands': [{'operator': 'OR', 'operands': ['a = 1', 'b = 2']},
+                                      "c LIKE 'x and y'", 'd IS NOT NULL']}),
+    ("SELECT a FROM t WHERE x = 1 AND y BETWEEN 1 AND 5 OR (z = 2 AND (w = 3 OR v = 4)) OR ((q = 1))",
+     ['x = 1', 'y BETWEEN 1 AND 5', '(z = 2 AND (w = 3 OR v = 4))', '((q = 1))'],
+     {'operator': 'OR', 'operands': [
+         {'operator': 'AND', 'operands': ['x = 1', 'y BETWEEN 1 AND 5']},
+         {'operator': 'AND', 'operands': ['z = 2', {'operator': 'OR', 'operands': ['w = 3', 'v = 4']}]},
+         '((q = 1))']}),
+    ("SELECT a FROM t WHERE `t`.`a` IN (SELECT b FROM u WHERE c = 1 AND d = 2) GROUP BY a",
+     ['t.a IN (SELECT b FROM u WHERE c = 1 AND d = 2)'],
+     't.a IN (SELECT b FROM u WHERE c = 1 AND d = 2)'),
+    ("WITH c AS (SELECT id FROM t WHERE x > 1) SELECT c.id FROM c WHERE c.id < 3 ORDER BY c.id",
+     ['c.id < 3'], 'c.id < 3'),
+    ("SELECT a FROM t WHERE a = 1 AND (b = 2 OR c = 3",
+     ['a = 1', '(b = 2 OR c = 3'],
+     {'operator': 'AND', 'operands': ['a = 1', '(b = 2 OR c = 3']}),
+    ("SELECT u.id FROM momo.users u, main_db.orders o WHERE u.id = o.uid",
+     ['u.id = o.uid'], 'u.id = o.uid'),
+    ("SELECT a FROM t", [], None),
+]
+
+
+def test_flat_conditions_and_tree():
+    """Top-level conditions and the nested AND/OR tree"""
+    extractor = ContentExtractor()
+    for sql, conditions, tree in CASES:
+        assert extractor.extract_where_conditions(sql) == conditions, sql
+        where = extractor.extract_where_clause(sql)
+        if tree is None:
+            assert where is None
+        else:
+            assert where.condition_texts() == conditions
+            assert where.tree_to_dict() == tree, (sql, where.tree_to_dict())
+
+
+def test_parser_modes_agree():
+    """String mode and token mode return the same whereConditions"""
+    for sql, conditions, _ in CASES:
+        for use_token_stream in (False, True):
+            result = SQLParserAST(use_token_stream=use_token_stream).parse(sql)
+            assert result['whereConditions'] == conditions, (use_token_stream, sql, result['whereConditions'])
+
+
+def test_long_where_clause_is_linear():
+    """Nested groups and long AND chains split in time linear in the clause"""
+    extractor = ContentExtractor()
+
+    def timed(terms):
+        nested = "a = 0"
+        for index in range(1, terms):
+            nested = f"(c{index} = {index} OR {nested})" if index % 2 else f"c{index} = {index} AND {nested}"
+        stream = SQLTokenizer().tokenize_stream(f"SELECT a FROM t WHERE {nested}")
+        start = time.perf_counter()
+        where = extractor.extract_where_clause_from_tokens(stream)
+        elapsed = time.perf_counter() - start
+        assert isinstance(where.tree, LogicalConditionNode)
+        return elapsed
+
+    timed(100)
+    small = min(timed(400) for _ in range(3))
+    large = min(timed(1600) for _ in range(3))
+    assert large < small * 10, (small, large)
+
+
+def test_deep_nesting_stays_bounded():
+    """Groups nested deeper than MAX_WHERE_TREE_DEPTH become leaf conditions"""
+    depth = ContentExtractor.MAX_WHERE_TREE_DEPTH + 500
+    sql = "SELECT a FROM t WHERE " + "(a = 1 OR " * depth + "b = 2" + ")" * depth
+    where = ContentExtractor().extract_where_clause(sql)
+    assert len(where.conditions) == 1
+
+    node = where.tree
+    levels = 0
+    while isinstance(node, LogicalConditionNode):
+        node = node.operands[-1]
+        levels += 1
+    assert levels == ContentExtractor.MAX_WHERE_TREE_DEPTH
+    assert node.condition_text.startswith("(a = 1 OR")
+
+if __name__ == "__main__":
+    test_flat_conditions_and_tree()
+    test_parser_modes_agree()
+    test_long_where_clause_is_linear()
+    test_deep_nesting_stays_bounded()
+    print("✅ All WHERE condition tests passed")